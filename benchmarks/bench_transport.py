@@ -0,0 +1,131 @@
+"""Compare validation throughput for different HTTP transport configurations.
+
+Runs against a local stub of the Truelist API, so it measures client-side
+connection handling rather than network latency::
+
+    python benchmarks/bench_transport.py --requests 2000 --concurrency 16
+
+The stub speaks HTTP/1.1 only; HTTP/2 multiplexing needs a TLS endpoint that
+negotiates h2 (such as the real API) to show a difference.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import django
+from django.conf import settings
+from django.test import override_settings
+
+settings.configure(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    TRUELIST_API_KEY="benchmark",
+)
+django.setup()
+
+from truelist_django.cache import CachedTruelistClient  # noqa: E402
+from truelist_django.transport import build_transport  # noqa: E402
+
+_BODY = json.dumps(
+    {
+        "emails": [
+            {
+                "address": "user@example.com",
+                "domain": "example.com",
+                "email_state": "ok",
+                "email_sub_state": "email_ok",
+            }
+        ]
+    }
+).encode()
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self) -> None:  # noqa: N802
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(_BODY)))
+        self.end_headers()
+        self.wfile.write(_BODY)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def _run(label: str, validate: Callable[[], None], requests: int, concurrency: int) -> None:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for future in [executor.submit(validate) for _ in range(requests)]:
+            future.result()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<36} {requests / elapsed:>10.0f} req/s  ({elapsed:.2f}s)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    def per_call_client() -> None:
+        # What TruelistEmailValidator does without a shared transport.
+        client = CachedTruelistClient(base_url=base_url, cache_enabled=False)
+        try:
+            client.validate("user@example.com")
+        finally:
+            client.close()
+
+    pooled = CachedTruelistClient(
+        base_url=base_url,
+        cache_enabled=False,
+        transport=build_transport(max_connections=args.concurrency, keepalive_expiry=30),
+    )
+    dns_cached = CachedTruelistClient(
+        base_url=f"http://localhost:{server.server_address[1]}",
+        cache_enabled=False,
+        transport=build_transport(
+            max_connections=args.concurrency, keepalive_expiry=30, dns_cache_ttl=60
+        ),
+    )
+
+    _run("new SDK client per validation", per_call_client, args.requests, args.concurrency)
+    # What TruelistEmailValidator does with the pool configured by settings.
+    with override_settings(
+        TRUELIST_HTTP_MAX_CONNECTIONS=args.concurrency, TRUELIST_HTTP_KEEPALIVE_EXPIRY=30
+    ):
+        _run(
+            "new client per validation, settings pool",
+            per_call_client,
+            args.requests,
+            args.concurrency,
+        )
+    _run(
+        "shared pool",
+        lambda: pooled.validate("user@example.com") and None,
+        args.requests,
+        args.concurrency,
+    )
+    _run(
+        "shared pool + DNS cache (localhost)",
+        lambda: dns_cached.validate("user@example.com") and None,
+        args.requests,
+        args.concurrency,
+    )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from importlib import import_module
+
 from django.apps import AppConfig
 
 
@@ -9,3 +11,7 @@ class TruelistDjangoConfig(AppConfig):
     name = "truelist_django"
     verbose_name = "Truelist Email Validation"
     default_auto_field = "django.db.models.BigAutoField"
+
+    def ready(self) -> None:
+        # Register ValidationRecord, which is kept out of models.py.
+        import_module("truelist_django.records")
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import array
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from truelist import ValidationResult
+
+logger = logging.getLogger(__name__)
+
+# File layout: a fixed header followed by two sorted arrays of 64-bit hashes
+# (addresses first, then domains), all little-endian.
+_MAGIC = b"TLBLOCK1"
+_HEADER = struct.Struct("<8sQQ")
+_ENTRY = struct.Struct("<Q")
+
+KNOWN_INVALID_ADDRESS = "known_invalid_address"
+KNOWN_INVALID_DOMAIN = "known_invalid_domain"
+
+
+def _hash(value: str) -> int:
+    digest = hashlib.sha256(value.lower().strip().encode()).digest()
+    return int.from_bytes(digest[:8], "little")
+
+
+def _sorted_hashes(values: Iterable[str]) -> array.array[int]:
+    hashes = array.array("Q", sorted({_hash(value) for value in values if value.strip()}))
+    if sys.byteorder != "little":
+        hashes.byteswap()
+    return hashes
+
+
+def build_blocklist(path: str, *, addresses: Iterable[str], domains: Iterable[str]) -> None:
+    """Compile known-invalid addresses and domains into an index file.
+
+    The file is written next to ``path`` and moved into place with ``os.replace``,
+    so readers either see the old index or the new one, never a partial file.
+
+    Args:
+        path: Destination of the index file.
+        addresses: Email addresses known to be invalid.
+        domains: Domains known to be invalid.
+    """
+    address_hashes = _sorted_hashes(addresses)
+    domain_hashes = _sorted_hashes(domains)
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".truelist-blocklist-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, len(address_hashes), len(domain_hashes)))
+            address_hashes.tofile(f)
+            domain_hashes.tofile(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class _Mapping(NamedTuple):
+    identity: tuple[int, int] | None
+    buffer: mmap.mmap | None
+    address_count: int
+    domain_count: int
+
+
+_EMPTY = _Mapping(None, None, 0, 0)
+
+
+class KnownInvalidIndex:
+    """Read-only, memory-mapped index of known-invalid addresses and domains.
+
+    The index file is mapped with ``mmap``, so every process on a host shares the
+    same page-cache pages instead of holding its own copy. Lookups are a binary
+    search over sorted 64-bit hashes. The file is re-checked at most every
+    ``check_interval`` seconds and remapped when it has been replaced.
+
+    A missing file behaves like an empty index. A file that is not a complete
+    blocklist (foreign, or truncated) is logged and ignored; the previously
+    loaded index stays in use until a valid file replaces it.
+
+    Args:
+        path: Path of a file produced by :func:`build_blocklist`.
+        check_interval: Seconds between checks for a rebuilt file.
+    """
+
+    def __init__(self, path: str, *, check_interval: float = 5.0) -> None:
+        self.path = path
+        self.check_interval = check_interval
+        self._mapping = _EMPTY
+        self._rejected: tuple[int, int] | None = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+
+    def _current(self) -> _Mapping:
+        if time.monotonic() >= self._next_check:
+            with self._lock:
+                if time.monotonic() >= self._next_check:
+                    try:
+                        self._reload_if_changed()
+                    finally:
+                        self._next_check = time.monotonic() + self.check_interval
+        return self._mapping
+
+    def _reload_if_changed(self) -> None:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            self._mapping = _EMPTY
+            return
+        identity = (stat.st_ino, stat.st_mtime_ns)
+        if identity in (self._mapping.identity, self._rejected):
+            return
+        buffer = None
+        address_count = domain_count = 0
+        try:
+            with open(self.path, "rb") as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            valid = False
+            if len(buffer) >= _HEADER.size:
+                magic, address_count, domain_count = _HEADER.unpack_from(buffer, 0)
+                expected_size = _HEADER.size + _ENTRY.size * (address_count + domain_count)
+                valid = magic == _MAGIC and len(buffer) == expected_size
+            if not valid:
+                buffer.close()
+                buffer = None
+        except (OSError, ValueError):
+            # ValueError: mmap refuses empty files.
+            buffer = None
+        if buffer is None:
+            logger.warning(
+                "Ignoring %s: not a complete Truelist blocklist file; keeping the previous index.",
+                self.path,
+            )
+            self._rejected = identity
+            return
+        # The previous mapping is left to the garbage collector rather than closed,
+        # since another thread may still be searching it.
+        self._mapping = _Mapping(identity, buffer, address_count, domain_count)
+        self._rejected = None
+
+    @staticmethod
+    def _search(buffer: mmap.mmap, start: int, count: int, target: int) -> bool:
+        low, high = 0, count
+        while low < high:
+            mid = (low + high) // 2
+            (value,) = _ENTRY.unpack_from(buffer, start + mid * _ENTRY.size)
+            if value < target:
+                low = mid + 1
+            elif value > target:
+                high = mid
+            else:
+                return True
+        return False
+
+    def lookup(self, email: str) -> str | None:
+        """Check an email address against the index.
+
+        Args:
+            email: The email address to look up.
+
+        Returns:
+            ``KNOWN_INVALID_ADDRESS`` or ``KNOWN_INVALID_DOMAIN`` when the address
+            or its domain is listed, otherwise None.
+        """
+        mapping = self._current()
+        if mapping.buffer is None:
+            return None
+        address_start = _HEADER.size
+        if self._search(mapping.buffer, address_start, mapping.address_count, _hash(email)):
+            return KNOWN_INVALID_ADDRESS
+        domain_start = address_start + mapping.address_count * _ENTRY.size
+        domain = email.rpartition("@")[2]
+        if self._search(mapping.buffer, domain_start, mapping.domain_count, _hash(domain)):
+            return KNOWN_INVALID_DOMAIN
+        return None
+
+
+_indexes: dict[str, KnownInvalidIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_blocklist(path: str) -> KnownInvalidIndex:
+    """Return the process-wide index for ``path``, creating it on first use."""
+    index = _indexes.get(path)
+    if index is None:
+        with _indexes_lock:
+            index = _indexes.setdefault(path, KnownInvalidIndex(path))
+    return index
+
+
+def known_invalid_result(email: str, sub_state: str) -> ValidationResult:
+    """Build the result returned for an address rejected by the index."""
+    return ValidationResult(
+        email=email,
+        domain=email.rpartition("@")[2],
+        canonical=None,
+        mx_record=None,
+        first_name=None,
+        last_name=None,
+        state="email_invalid",
+        sub_state=sub_state,
+        verified_at=None,
+        suggestion=None,
+    )
@@ -1,18 +1,87 @@
 from __future__ import annotations
 
 import hashlib
-from typing import Any
+import time
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, cast
 
+import httpx
 from django.core.cache import caches
-from truelist import Truelist, ValidationResult
+from django.utils.module_loading import import_string
+from truelist import TimeoutError, Truelist, TruelistError, ValidationResult
+from truelist.client import EmailResource
 
+from truelist_django.blocklist import get_blocklist, known_invalid_result
+from truelist_django.dispatch import INTERACTIVE, PRIORITIES, get_dispatcher
+from truelist_django.local_cache import SharedMemoryCache, get_local_cache
 from truelist_django.settings import get_setting
+from truelist_django.transport import attach_transport, get_shared_client
+from truelist_django.typos import typo_result
 
+_GENERATION_PREFIX = "truelist:generation"
+# Cache hits update a tracked address's access time at most this often (seconds).
+_ACCESS_TRACKING_INTERVAL = 300
 
-def _cache_key(email: str) -> str:
-    """Generate a cache key for an email address."""
-    email_hash = hashlib.sha256(email.lower().strip().encode()).hexdigest()
-    return f"truelist:validation:{email_hash}"
+
+def _normalize(email: str) -> str:
+    return email.lower().strip()
+
+
+def _short_hash(value: str) -> str:
+    return hashlib.sha256(value.encode()).hexdigest()[:16]
+
+
+class _DeadlineHTTPClient:
+    """Sends an SDK request with a timeout that ends at ``deadline`` (monotonic)."""
+
+    def __init__(self, client: httpx.Client, deadline: float) -> None:
+        self._client = client
+        self._deadline = deadline
+
+    def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        remaining = self._deadline - time.monotonic()
+        if remaining <= 0:
+            raise httpx.TimeoutException("Deadline passed before the request was sent")
+        timeout = min(remaining, self._client.timeout.read or remaining)
+        return self._client.request(method, url, timeout=timeout, **kwargs)
+
+
+def _cache_key(email: str, namespace: str = "0") -> str:
+    """Generate a cache key for an email address within a generation namespace."""
+    email_hash = hashlib.sha256(_normalize(email).encode()).hexdigest()
+    return f"truelist:validation:{namespace}:{email_hash}"
+
+
+def _global_generation_key() -> str:
+    return f"{_GENERATION_PREFIX}:global"
+
+
+def _domain_generation_key(domain: str) -> str:
+    return f"{_GENERATION_PREFIX}:domain:{_short_hash(domain.lower().strip())}"
+
+
+def _tenant_generation_key(tenant: str) -> str:
+    return f"{_GENERATION_PREFIX}:tenant:{_short_hash(tenant)}"
+
+
+def _email_domain(email: str) -> str:
+    return _normalize(email).rpartition("@")[2]
+
+
+def _bump_generation(cache: Any, key: str) -> int:
+    """Increment a generation counter, creating it if it does not exist yet.
+
+    Counters are stored without expiry. If the cache evicts a counter, it restarts
+    from zero, so point ``TRUELIST_CACHE_ALIAS`` at a backend that does not evict
+    aggressively when relying on invalidation.
+    """
+    try:
+        return int(cache.incr(key))
+    except ValueError:
+        if cache.add(key, 1, None):
+            return 1
+        return int(cache.incr(key))
 
 
 class CachedTruelistClient:
@@ -22,9 +91,42 @@ class CachedTruelistClient:
         - TRUELIST_CACHE_ENABLED: Whether caching is active (default: False)
         - TRUELIST_CACHE_TTL: Cache duration in seconds (default: 3600)
         - TRUELIST_CACHE_ALIAS: Which Django cache backend to use (default: "default")
+        - TRUELIST_CACHE_STATE_TTLS: Per-state cache durations overriding
+          TRUELIST_CACHE_TTL, e.g. ``{"email_invalid": 604800}`` (default: {})
+        - TRUELIST_BLOCKLIST_PATH: Index of known-invalid addresses and domains checked
+          before the cache and the API (default: None)
+        - TRUELIST_TYPO_DETECTION: Reject domains that look like typos of popular
+          domains locally, with a corrected suggestion (default: False)
+
+    With ``TRUELIST_LOCAL_CACHE_PATH`` set, a host-local shared-memory tier sits in
+    front of the Django cache (see :mod:`truelist_django.local_cache`). Entries
+    stay there for at most ``TRUELIST_LOCAL_CACHE_TTL`` seconds, which bounds how
+    long an invalidation made on another host can take to be seen.
+
+    With ``TRUELIST_REFRESH_TRACKING`` on, cached addresses are recorded in the
+    database so the ``truelist_refresh`` scheduler can re-validate them before they
+    expire (see :mod:`truelist_django.refresh`).
+
+    ``TRUELIST_BACKEND`` replaces the Truelist SDK client with another backend,
+    such as the in-memory fake from :mod:`truelist_django.testing`.
+
+    HTTP connection pooling, keep-alive, HTTP/2, proxies and DNS caching are
+    configured with the ``TRUELIST_HTTP_*`` settings, or by passing an httpx
+    ``transport``. A transport built from settings is shared by every client in
+    the process, along with one SDK client on top of it, so short-lived clients
+    still reuse open connections and skip the SDK client's setup.
+
+    With ``TRUELIST_MAX_IN_FLIGHT`` set, API calls share a bounded pool of slots
+    ordered by the client's ``priority`` ("interactive", "batch" or "background"),
+    so bulk work cannot starve form validation (see :mod:`truelist_django.dispatch`).
 
     Results with state "unknown" are never cached.
 
+    Cache keys are namespaced by generation counters (global, per domain and per
+    tenant). Bumping a counter with :meth:`invalidate_all`, :meth:`invalidate_domain`
+    or :meth:`invalidate_tenant` makes every entry in that class unreachable in O(1),
+    without scanning keys; stale entries simply age out with their TTL.
+
     Usage::
 
         client = CachedTruelistClient()
@@ -40,7 +142,16 @@ class CachedTruelistClient:
         cache_enabled: bool | None = None,
         cache_ttl: int | None = None,
         cache_alias: str | None = None,
+        tenant: str | None = None,
+        blocklist_path: str | None = None,
+        transport: httpx.BaseTransport | None = None,
+        refresh_tracking: bool | None = None,
+        priority: str = INTERACTIVE,
+        typo_detection: bool | None = None,
+        state_ttls: Mapping[str, int] | None = None,
     ) -> None:
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority {priority!r}; expected one of {PRIORITIES}.")
         self._api_key = api_key or get_setting("TRUELIST_API_KEY")
         self._base_url = base_url or get_setting("TRUELIST_BASE_URL")
         self._timeout: int = timeout if timeout is not None else get_setting("TRUELIST_TIMEOUT")
@@ -51,20 +162,109 @@ class CachedTruelistClient:
             cache_ttl if cache_ttl is not None else get_setting("TRUELIST_CACHE_TTL")
         )
         self._cache_alias: str = cache_alias or get_setting("TRUELIST_CACHE_ALIAS")
+        self._tenant = tenant
+        self._local_cache_path: str | None = get_setting("TRUELIST_LOCAL_CACHE_PATH")
+        self._state_ttls: Mapping[str, int] = (
+            state_ttls if state_ttls is not None else get_setting("TRUELIST_CACHE_STATE_TTLS")
+        )
+        self._local_cache_ttl: int = get_setting("TRUELIST_LOCAL_CACHE_TTL")
+        self._blocklist_path: str | None = blocklist_path or get_setting("TRUELIST_BLOCKLIST_PATH")
+        self._transport = transport
+        self._refresh_tracking: bool = (
+            refresh_tracking
+            if refresh_tracking is not None
+            else get_setting("TRUELIST_REFRESH_TRACKING")
+        )
+        self._priority = priority
+        self._typo_detection: bool = (
+            typo_detection if typo_detection is not None else get_setting("TRUELIST_TYPO_DETECTION")
+        )
         self._client: Truelist | None = None
+        self._client_shared = False
 
     def _get_client(self) -> Truelist:
         if self._client is None:
+            backend = get_setting("TRUELIST_BACKEND")
+            if backend is not None:
+                if isinstance(backend, str):
+                    backend = import_string(backend)
+                self._client = cast(
+                    Truelist,
+                    backend(self._api_key, base_url=self._base_url, timeout=float(self._timeout)),
+                )
+                return self._client
+            if self._transport is None:
+                shared = get_shared_client(
+                    self._api_key, base_url=self._base_url, timeout=float(self._timeout)
+                )
+                if shared is not None:
+                    self._client = shared
+                    self._client_shared = True
+                    return self._client
             self._client = Truelist(
                 self._api_key,
                 base_url=self._base_url,
                 timeout=float(self._timeout),
             )
+            if self._transport is not None:
+                attach_transport(self._client, self._transport)
         return self._client
 
     def _get_cache(self) -> Any:
         return caches[self._cache_alias]
 
+    def _get_local_cache(self) -> SharedMemoryCache | None:
+        if not (self._cache_enabled and self._local_cache_path):
+            return None
+        return get_local_cache(self._local_cache_path, get_setting("TRUELIST_LOCAL_CACHE_SLOTS"))
+
+    def _ttl(self, result: ValidationResult) -> int:
+        return self._state_ttls.get(result.state, self._cache_ttl)
+
+    def _local_ttl(self, result: ValidationResult) -> int:
+        return min(self._local_cache_ttl, self._ttl(result))
+
+    def _local_key(self, email: str) -> str:
+        return f"{self._tenant or ''}:{_normalize(email)}"
+
+    def _namespaced_key(self, cache: Any, email: str) -> str:
+        return self._namespaced_keys(cache, [email])[email]
+
+    def _namespaced_keys(self, cache: Any, emails: list[str]) -> dict[str, str]:
+        shared_keys = [_global_generation_key()]
+        if self._tenant is not None:
+            shared_keys.append(_tenant_generation_key(self._tenant))
+        domain_keys = {email: _domain_generation_key(_email_domain(email)) for email in emails}
+        generations = cache.get_many([*shared_keys, *set(domain_keys.values())])
+        prefix = ""
+        if self._tenant is not None:
+            # Tenants get their own partition, not just their own counter.
+            prefix = f"{_short_hash(self._tenant)}."
+        keys = {}
+        for email, domain_key in domain_keys.items():
+            # Namespace order: global, domain, then tenant.
+            generation_keys = [shared_keys[0], domain_key, *shared_keys[1:]]
+            namespace = ".".join(str(generations.get(key, 0)) for key in generation_keys)
+            keys[email] = _cache_key(email, prefix + namespace)
+        return keys
+
+    def get_cached(self, email: str) -> ValidationResult | None:
+        """Return the cached result for an email address without calling the API.
+
+        Args:
+            email: The email address to look up.
+
+        Returns:
+            The cached ValidationResult, or None on a miss or when caching is disabled.
+        """
+        if not self._cache_enabled:
+            return None
+        cache = self._get_cache()
+        cached: dict[str, Any] | None = cache.get(self._namespaced_key(cache, email))
+        if cached is None:
+            return None
+        return ValidationResult(**cached)
+
     def validate(self, email: str) -> ValidationResult:
         """Validate an email address, using cache if enabled.
 
@@ -72,20 +272,190 @@ class CachedTruelistClient:
             email: The email address to validate.
 
         Returns:
-            A ValidationResult from the Truelist API or cache.
+            A ValidationResult from typo detection, the blocklist, the cache or the
+            Truelist API.
         """
+        local_cache = self._get_local_cache()
+        local_result = self._local_result(email, local_cache)
+        if local_result is not None:
+            return local_result
+
+        cache: Any = None
+        key = ""
         if self._cache_enabled:
-            key = _cache_key(email)
             cache = self._get_cache()
+            key = self._namespaced_key(cache, email)
             cached: dict[str, Any] | None = cache.get(key)
             if cached is not None:
-                return ValidationResult(**cached)
+                if self._refresh_tracking:
+                    self._track_access(cache, email)
+                result = ValidationResult(**cached)
+                if local_cache is not None:
+                    local_cache.set(self._local_key(email), result, self._local_ttl(result))
+                return result
+
+        return self._fetch(email, cache, key, accessed=True)
+
+    def _local_result(
+        self, email: str, local_cache: SharedMemoryCache | None
+    ) -> ValidationResult | None:
+        """Check the in-process stages: typo detection, the blocklist and the local tier."""
+        if self._typo_detection:
+            typo = typo_result(email)
+            if typo is not None:
+                return typo
 
-        result = self._get_client().email.validate(email)
+        if self._blocklist_path:
+            known_invalid = get_blocklist(self._blocklist_path).lookup(_normalize(email))
+            if known_invalid is not None:
+                return known_invalid_result(email, known_invalid)
 
-        if self._cache_enabled and not result.is_unknown:
-            key = _cache_key(email)
+        if local_cache is not None:
+            return local_cache.get(self._local_key(email))
+        return None
+
+    def validate_many(
+        self,
+        emails: Iterable[str],
+        *,
+        max_workers: int = 10,
+        timeout: float | None = None,
+    ) -> dict[str, ValidationResult | TruelistError]:
+        """Validate several email addresses, calling the API concurrently for cache misses.
+
+        Cached results are fetched with one ``get_many`` call. The remaining
+        addresses are validated in parallel, so the total latency is close to a
+        single API round trip.
+
+        Args:
+            emails: The email addresses to validate. Duplicates are validated once.
+            max_workers: Maximum concurrent API calls.
+            timeout: Seconds to wait for all API calls (default: TRUELIST_TIMEOUT).
+                Addresses still pending after this get a ``truelist.TimeoutError``.
+                API calls are not retried and give up at this deadline.
+
+        Returns:
+            A mapping of each address to its ValidationResult, or to the
+            ``TruelistError`` raised while validating it, in input order.
+        """
+        ordered = list(dict.fromkeys(emails))
+        results: dict[str, ValidationResult | TruelistError] = {}
+        local_cache = self._get_local_cache()
+        pending = []
+        for email in ordered:
+            local_result = self._local_result(email, local_cache)
+            if local_result is not None:
+                results[email] = local_result
+            else:
+                pending.append(email)
+
+        cache: Any = None
+        keys: dict[str, str] = {}
+        if self._cache_enabled and pending:
+            cache = self._get_cache()
+            keys = self._namespaced_keys(cache, pending)
+            found: dict[str, dict[str, Any]] = cache.get_many(list(keys.values()))
+            misses = []
+            for email in pending:
+                cached = found.get(keys[email])
+                if cached is None:
+                    misses.append(email)
+                    continue
+                if self._refresh_tracking:
+                    self._track_access(cache, email)
+                result = ValidationResult(**cached)
+                if local_cache is not None:
+                    local_cache.set(self._local_key(email), result, self._local_ttl(result))
+                results[email] = result
+            pending = misses
+
+        if pending:
+            fetched = self._call_api_many(
+                pending, max_workers, timeout if timeout is not None else float(self._timeout)
+            )
+            for email, outcome in fetched.items():
+                if isinstance(outcome, ValidationResult):
+                    self._store(email, cache, keys.get(email, ""), outcome, accessed=True)
+                results[email] = outcome
+
+        return {email: results[email] for email in ordered}
+
+    def _call_api_many(
+        self, emails: list[str], max_workers: int, timeout: float
+    ) -> dict[str, ValidationResult | TruelistError]:
+        # Workers only make the API call; cache writes stay on the calling thread.
+        # Each call gives up at the deadline, so calls still running when it passes
+        # release their dispatcher slot and connection shortly after.
+        self._get_client()
+        deadline = time.monotonic() + timeout
+        executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(emails))))
+        try:
+            futures = {executor.submit(self._call_api, email, deadline): email for email in emails}
+            done, _ = wait(futures, timeout=timeout)
+            outcomes: dict[str, ValidationResult | TruelistError] = {}
+            for future, email in futures.items():
+                if future not in done:
+                    outcomes[email] = TimeoutError("Timed out waiting for a Truelist API response")
+                    continue
+                try:
+                    outcomes[email] = future.result()
+                except TruelistError as exc:
+                    outcomes[email] = exc
+            return outcomes
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def refresh(self, email: str) -> ValidationResult:
+        """Validate an email address through the API, replacing any cached result.
+
+        Args:
+            email: The email address to re-validate.
+
+        Returns:
+            A fresh ValidationResult from the Truelist API.
+        """
+        cache: Any = None
+        key = ""
+        if self._cache_enabled:
             cache = self._get_cache()
+            key = self._namespaced_key(cache, email)
+        return self._fetch(email, cache, key, accessed=False)
+
+    def _fetch(self, email: str, cache: Any, key: str, *, accessed: bool) -> ValidationResult:
+        result = self._call_api(email)
+        self._store(email, cache, key, result, accessed=accessed)
+        return result
+
+    def _call_api(self, email: str, deadline: float | None = None) -> ValidationResult:
+        """Call the API, waiting for a dispatcher slot if one is configured.
+
+        With a ``deadline`` (``time.monotonic()`` value), neither the wait nor the
+        request outlasts it, and the request is not retried.
+        """
+        client = self._get_client()
+        resource: EmailResource = client.email
+        timeout = float(self._timeout)
+        if deadline is not None:
+            timeout = min(timeout, deadline - time.monotonic())
+            if timeout <= 0:
+                raise TimeoutError("Timed out waiting for a Truelist API response")
+            http_client = getattr(client, "_client", None)
+            if isinstance(http_client, httpx.Client):
+                resource = EmailResource(
+                    cast(httpx.Client, _DeadlineHTTPClient(http_client, deadline)), max_retries=0
+                )
+        dispatcher = get_dispatcher()
+        if dispatcher is None:
+            return resource.validate(email)
+        with dispatcher.slot(self._priority, timeout=timeout):
+            return resource.validate(email)
+
+    def _store(
+        self, email: str, cache: Any, key: str, result: ValidationResult, *, accessed: bool
+    ) -> None:
+        if cache is not None and not result.is_unknown:
+            # Reuse the key computed before the API call: if the namespace was
+            # invalidated in the meantime, the result lands in the retired one.
             cache.set(
                 key,
                 {
@@ -100,13 +470,74 @@ class CachedTruelistClient:
                     "verified_at": result.verified_at,
                     "suggestion": result.suggestion,
                 },
-                self._cache_ttl,
+                self._ttl(result),
             )
+            local_cache = self._get_local_cache()
+            if local_cache is not None:
+                local_cache.set(self._local_key(email), result, self._local_ttl(result))
+            if self._refresh_tracking:
+                # Imported lazily: models imports validators, which imports this module.
+                from truelist_django.refresh import record_fetch
 
-        return result
+                record_fetch(email, self._tenant, result, self._ttl(result), accessed=accessed)
+
+    def _track_access(self, cache: Any, email: str) -> None:
+        marker = f"truelist:refresh:touched:{_short_hash(f'{self._tenant}:{_normalize(email)}')}"
+        if cache.add(marker, 1, _ACCESS_TRACKING_INTERVAL):
+            from truelist_django.refresh import record_access
+
+            record_access(email, self._tenant)
+
+    def invalidate_all(self) -> int:
+        """Invalidate every cached validation result.
+
+        Returns:
+            The new global generation number.
+        """
+        self._clear_local_cache()
+        return _bump_generation(self._get_cache(), _global_generation_key())
+
+    def invalidate_domain(self, domain: str) -> int:
+        """Invalidate cached validation results for every address at a domain.
+
+        Args:
+            domain: The domain whose results should be discarded (e.g. "example.com").
+
+        Returns:
+            The new generation number for the domain.
+        """
+        self._clear_local_cache()
+        return _bump_generation(self._get_cache(), _domain_generation_key(domain))
+
+    def invalidate_tenant(self, tenant: str | None = None) -> int:
+        """Invalidate cached validation results for a tenant.
+
+        Args:
+            tenant: The tenant to invalidate. Defaults to the client's own tenant.
+
+        Returns:
+            The new generation number for the tenant.
+
+        Raises:
+            ValueError: If no tenant was given and the client has none.
+        """
+        tenant = tenant if tenant is not None else self._tenant
+        if tenant is None:
+            raise ValueError("No tenant given and the client was created without one.")
+        self._clear_local_cache()
+        return _bump_generation(self._get_cache(), _tenant_generation_key(tenant))
+
+    def _clear_local_cache(self) -> None:
+        # The local tier has no generation namespaces, so any invalidation made
+        # on this host drops it entirely; other hosts catch up within its TTL.
+        local_cache = self._get_local_cache()
+        if local_cache is not None:
+            local_cache.clear()
 
     def close(self) -> None:
-        """Close the underlying HTTP client."""
+        """Close the underlying HTTP client, unless it is shared by the process."""
         if self._client is not None:
-            self._client.close()
+            if not self._client_shared:
+                self._client.close()
             self._client = None
+            self._client_shared = False
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from truelist import TimeoutError
+
+from truelist_django.settings import get_setting
+
+INTERACTIVE = "interactive"
+BATCH = "batch"
+BACKGROUND = "background"
+PRIORITIES = (INTERACTIVE, BATCH, BACKGROUND)
+
+
+class _ClassStats:
+    def __init__(self) -> None:
+        self.waiting = 0
+        self.in_flight = 0
+        self.started = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+
+class Dispatcher:
+    """Bounds concurrent Truelist API calls in a process and orders them by priority.
+
+    There are three priority classes: ``"interactive"`` (form and serializer
+    validation), ``"batch"`` (bulk imports) and ``"background"`` (refreshes). At most
+    ``max_in_flight`` calls run at once, and ``interactive_reserved`` of those slots
+    can only be used by interactive calls, so a backfill can never take all of them.
+    When a slot frees up, waiting calls start in priority order.
+
+    Usage::
+
+        dispatcher = Dispatcher(max_in_flight=16, interactive_reserved=4)
+        with dispatcher.slot("batch"):
+            client.email.validate(email)
+
+    Args:
+        max_in_flight: Maximum concurrent API calls.
+        interactive_reserved: Slots only interactive calls may use.
+    """
+
+    def __init__(self, *, max_in_flight: int, interactive_reserved: int = 0) -> None:
+        if max_in_flight <= 0:
+            raise ValueError("max_in_flight must be positive.")
+        if not 0 <= interactive_reserved < max_in_flight:
+            raise ValueError("interactive_reserved must be between 0 and max_in_flight - 1.")
+        self.max_in_flight = max_in_flight
+        self.interactive_reserved = interactive_reserved
+        self._condition = threading.Condition()
+        self._in_flight = 0
+        self._stats = {priority: _ClassStats() for priority in PRIORITIES}
+
+    def _can_start(self, priority: str) -> bool:
+        limit = self.max_in_flight
+        if priority != INTERACTIVE:
+            limit -= self.interactive_reserved
+        if self._in_flight >= limit:
+            return False
+        for higher in PRIORITIES[: PRIORITIES.index(priority)]:
+            if self._stats[higher].waiting:
+                return False
+        return True
+
+    def acquire(self, priority: str, timeout: float | None = None) -> None:
+        """Wait for a slot in ``priority``'s class.
+
+        Raises:
+            ValueError: If ``priority`` is not a known class.
+            truelist.TimeoutError: If no slot became free within ``timeout`` seconds.
+        """
+        if priority not in self._stats:
+            raise ValueError(f"Unknown priority {priority!r}; expected one of {PRIORITIES}.")
+        stats = self._stats[priority]
+        start = time.monotonic()
+        deadline = None if timeout is None else start + timeout
+        with self._condition:
+            stats.waiting += 1
+            try:
+                while not self._can_start(priority):
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError("Timed out waiting for a Truelist API slot")
+                    self._condition.wait(remaining)
+            finally:
+                stats.waiting -= 1
+                # A departing waiter may unblock lower classes.
+                self._condition.notify_all()
+            waited = time.monotonic() - start
+            self._in_flight += 1
+            stats.in_flight += 1
+            stats.started += 1
+            stats.total_wait += waited
+            stats.max_wait = max(stats.max_wait, waited)
+
+    def release(self, priority: str) -> None:
+        """Return a slot taken with :meth:`acquire`."""
+        with self._condition:
+            self._in_flight -= 1
+            self._stats[priority].in_flight -= 1
+            self._condition.notify_all()
+
+    @contextmanager
+    def slot(self, priority: str, timeout: float | None = None) -> Iterator[None]:
+        """Hold a slot in ``priority``'s class for the duration of the block."""
+        self.acquire(priority, timeout)
+        try:
+            yield
+        finally:
+            self.release(priority)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return queue depth, in-flight count and wait times per priority class.
+
+        Returns:
+            A mapping of class name to ``queue_depth``, ``in_flight``, ``started``,
+            ``mean_wait`` and ``max_wait`` (seconds).
+        """
+        with self._condition:
+            return {
+                priority: {
+                    "queue_depth": stats.waiting,
+                    "in_flight": stats.in_flight,
+                    "started": stats.started,
+                    "mean_wait": stats.total_wait / stats.started if stats.started else 0.0,
+                    "max_wait": stats.max_wait,
+                }
+                for priority, stats in self._stats.items()
+            }
+
+
+_dispatchers: dict[tuple[int, int], Dispatcher] = {}
+_dispatchers_lock = threading.Lock()
+
+
+def get_dispatcher() -> Dispatcher | None:
+    """Return the process-wide dispatcher, or None if ``TRUELIST_MAX_IN_FLIGHT`` is unset."""
+    max_in_flight = get_setting("TRUELIST_MAX_IN_FLIGHT")
+    if not max_in_flight:
+        return None
+    # Always leave one slot for batch and background calls, so a reservation that
+    # would use every slot (e.g. the default of 2 with a limit of 2) still works.
+    reserved = min(get_setting("TRUELIST_INTERACTIVE_RESERVED"), max_in_flight - 1)
+    key = (max_in_flight, reserved)
+    dispatcher = _dispatchers.get(key)
+    if dispatcher is None:
+        with _dispatchers_lock:
+            dispatcher = _dispatchers.setdefault(
+                key, Dispatcher(max_in_flight=key[0], interactive_reserved=key[1])
+            )
+    return dispatcher
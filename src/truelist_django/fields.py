@@ -3,10 +3,13 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+from django.core.exceptions import ValidationError as DjangoValidationError
 from truelist import AuthenticationError, TruelistError, ValidationResult
 
 from truelist_django.cache import CachedTruelistClient
+from truelist_django.forms import check_syntax, parse_email_list
 from truelist_django.settings import get_setting
+from truelist_django.validators import TruelistEmailValidator
 
 logger = logging.getLogger(__name__)
 
@@ -78,10 +81,92 @@ try:
                     "Email validation returned an inconclusive result."
                 )
 
+            if result.suggestion:
+                raise serializers.ValidationError(
+                    "This email address could not be verified as deliverable. "
+                    f"Did you mean {result.suggestion}?"
+                )
             raise serializers.ValidationError(
                 "This email address could not be verified as deliverable."
             )
 
+    class TruelistMultiEmailField(serializers.Field):  # type: ignore[type-arg]
+        """DRF serializer field for a list of addresses, validated together via Truelist.
+
+        Accepts a list of strings or a single string separated by commas,
+        semicolons or whitespace. Duplicates are dropped, cached results come from
+        one bulk lookup, and the remaining addresses are validated concurrently.
+        Errors name the address they belong to.
+
+        Usage::
+
+            from rest_framework import serializers
+            from truelist_django.fields import TruelistMultiEmailField
+
+            class InviteSerializer(serializers.Serializer):
+                emails = TruelistMultiEmailField(max_emails=50)
+
+        Args:
+            allow_risky: Accept emails with "risky" state (default: from settings, or True).
+            fail_silently: If True, don't raise on API/network errors (default: True).
+                Auth errors (401) always raise regardless of this setting.
+            max_emails: Maximum number of distinct addresses (default: 100).
+            max_workers: Maximum concurrent API calls (default: 10).
+            timeout: Seconds to wait for all API calls (default: TRUELIST_TIMEOUT).
+            allow_empty: Whether an empty list is valid (default: False).
+            **kwargs: Additional keyword arguments passed to Field.
+        """
+
+        default_error_messages = {
+            "not_a_list": "Expected a list of email addresses or a string of them.",
+            "empty": "This list may not be empty.",
+            "max_emails": "Enter at most {max_emails} email addresses (you entered {count}).",
+        }
+
+        def __init__(
+            self,
+            *,
+            allow_risky: bool | None = None,
+            fail_silently: bool = True,
+            max_emails: int = 100,
+            max_workers: int = 10,
+            timeout: float | None = None,
+            allow_empty: bool = False,
+            **kwargs: Any,
+        ) -> None:
+            self.validator = TruelistEmailValidator(
+                allow_risky=allow_risky, fail_silently=fail_silently
+            )
+            self.max_emails = max_emails
+            self.max_workers = max_workers
+            self.timeout = timeout
+            self.allow_empty = allow_empty
+            super().__init__(**kwargs)
+
+        def to_internal_value(self, data: Any) -> list[str]:
+            if not isinstance(data, (str, list, tuple)) or (
+                not isinstance(data, str) and not all(isinstance(item, str) for item in data)
+            ):
+                self.fail("not_a_list")
+            addresses = parse_email_list(data)
+            if not addresses and not self.allow_empty:
+                self.fail("empty")
+            if len(addresses) > self.max_emails:
+                self.fail("max_emails", max_emails=self.max_emails, count=len(addresses))
+
+            try:
+                check_syntax(addresses)
+                if addresses:
+                    self.validator.validate_many(
+                        addresses, max_workers=self.max_workers, timeout=self.timeout
+                    )
+            except DjangoValidationError as exc:
+                raise serializers.ValidationError(exc.messages) from None
+            return addresses
+
+        def to_representation(self, value: Any) -> list[str]:
+            return list(value)
+
 except ImportError:
 
     class TruelistEmailField:  # type: ignore[no-redef]
@@ -92,3 +177,12 @@ except ImportError:
                 "djangorestframework is required to use TruelistEmailField. "
                 'Install it with: pip install "truelist-django[drf]"'
             )
+
+    class TruelistMultiEmailField:  # type: ignore[no-redef]
+        """Placeholder that raises when DRF is not installed."""
+
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            raise ImportError(
+                "djangorestframework is required to use TruelistMultiEmailField. "
+                'Install it with: pip install "truelist-django[drf]"'
+            )
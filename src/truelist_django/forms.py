@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from typing import Any
+
+from django import forms
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+
+from truelist_django.validators import TruelistEmailValidator
+
+_SEPARATORS = re.compile(r"[\s,;]+")
+
+
+def parse_email_list(value: str | Iterable[str]) -> list[str]:
+    """Split pasted addresses on commas, semicolons and whitespace.
+
+    Args:
+        value: A string of addresses, or an iterable of address strings.
+
+    Returns:
+        The addresses in input order, with blanks and case-insensitive duplicates
+        removed.
+    """
+    parts = _SEPARATORS.split(value) if isinstance(value, str) else value
+    seen: dict[str, str] = {}
+    for part in parts:
+        address = part.strip()
+        if address:
+            seen.setdefault(address.lower(), address)
+    return list(seen.values())
+
+
+def check_syntax(addresses: Iterable[str]) -> None:
+    """Raise one "<address>: <reason>" error per syntactically invalid address."""
+    errors = []
+    for address in addresses:
+        try:
+            validate_email(address)
+        except ValidationError:
+            errors.append(
+                ValidationError(
+                    "%(email)s: Enter a valid email address.",
+                    code="invalid",
+                    params={"email": address},
+                )
+            )
+    if errors:
+        raise ValidationError(errors)
+
+
+class TruelistMultiEmailField(forms.Field):
+    """Form field for a list of addresses, validated together via the Truelist API.
+
+    Addresses can be separated by commas, semicolons or whitespace. Duplicates are
+    dropped, cached results come from one bulk lookup, and the remaining
+    addresses are validated concurrently, so a pasted list of 50 addresses costs
+    about one API round trip. Errors name the address they belong to.
+
+    Usage::
+
+        from django import forms
+        from truelist_django.forms import TruelistMultiEmailField
+
+        class InviteForm(forms.Form):
+            emails = TruelistMultiEmailField(max_emails=50)
+
+    ``cleaned_data["emails"]`` is a list of address strings.
+
+    Args:
+        allow_risky: Accept emails with "risky" state (default: from settings, or True).
+        fail_silently: If True, don't raise on API/network errors (default: True).
+            Auth errors (401) always raise regardless of this setting.
+        max_emails: Maximum number of distinct addresses (default: 100).
+        max_workers: Maximum concurrent API calls (default: 10).
+        timeout: Seconds to wait for all API calls (default: TRUELIST_TIMEOUT).
+        **kwargs: Additional keyword arguments passed to Field.
+    """
+
+    widget = forms.Textarea
+    default_error_messages = {
+        "max_emails": "Enter at most %(max_emails)d email addresses (you entered %(count)d).",
+    }
+
+    def __init__(
+        self,
+        *,
+        allow_risky: bool | None = None,
+        fail_silently: bool = True,
+        max_emails: int = 100,
+        max_workers: int = 10,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self.validator = TruelistEmailValidator(
+            allow_risky=allow_risky, fail_silently=fail_silently
+        )
+        self.max_emails = max_emails
+        self.max_workers = max_workers
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def prepare_value(self, value: Any) -> Any:
+        if isinstance(value, (list, tuple)):
+            return ", ".join(value)
+        return value
+
+    def to_python(self, value: Any) -> list[str]:
+        if not value:
+            return []
+        return parse_email_list(value)
+
+    def validate(self, value: list[str]) -> None:
+        super().validate(value)
+        if len(value) > self.max_emails:
+            raise ValidationError(
+                self.error_messages["max_emails"],
+                code="max_emails",
+                params={"max_emails": self.max_emails, "count": len(value)},
+            )
+        check_syntax(value)
+
+    def run_validators(self, value: list[str]) -> None:
+        super().run_validators(value)
+        if value:
+            self.validator.validate_many(value, max_workers=self.max_workers, timeout=self.timeout)
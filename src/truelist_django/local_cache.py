@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from typing import Any
+
+from truelist import ValidationResult
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+# File layout: header, one CLOCK hand byte per bucket, then fixed-width records.
+# Buckets are WAYS consecutive records; a key only ever lives in its own bucket.
+_MAGIC = b"TLSHM001"
+_HEADER = struct.Struct("<8sII")  # magic, slot count, record size
+_HEADER_SIZE = 64
+_WAYS = 8
+_RECORD_SIZE = 256
+# seq (seqlock counter, odd while a write is in progress), key hash, expiry
+# (unix seconds), reference bit, payload length.
+_RECORD = struct.Struct("<IQIBxH")
+_SEQ = struct.Struct("<I")
+_SEQ_MASK = 0xFFFFFFFF
+_REF_OFFSET = 16
+_MAX_PAYLOAD = _RECORD_SIZE - _RECORD.size
+_READ_RETRIES = 4
+_LOCK_STRIPES = 64
+
+_FIELDS = [field.name for field in dataclasses.fields(ValidationResult)]
+_SEPARATOR = "\x1f"
+_NONE = "\x00"
+
+
+def _encode(result: ValidationResult) -> bytes:
+    values = (getattr(result, name) for name in _FIELDS)
+    return _SEPARATOR.join(_NONE if value is None else value for value in values).encode()
+
+
+def _decode(payload: bytes) -> ValidationResult:
+    values = payload.decode().split(_SEPARATOR)
+    fields: dict[str, Any] = {
+        name: None if value == _NONE else value for name, value in zip(_FIELDS, values)
+    }
+    return ValidationResult(**fields)
+
+
+class SharedMemoryCache:
+    """Fixed-size, host-local result cache shared by all processes through ``mmap``.
+
+    Every worker on a host maps the same file (ideally on a tmpfs such as
+    ``/dev/shm``), so they share one hot set without a network round trip.
+
+    - Records are fixed-width (256 bytes): a 64-bit key hash, an expiry, a CLOCK
+      reference bit and the encoded result. Results that do not fit are skipped.
+    - The table is 8-way set associative. Reads are lock-free: each record carries
+      a sequence counter that writers make odd while writing, and readers retry
+      when it changed under them.
+    - Writers take a per-bucket lock (a thread lock stripe plus an ``fcntl`` byte
+      range lock for other processes) and evict with the CLOCK algorithm.
+
+    Args:
+        path: File backing the table. Created, or replaced with an empty table if
+            its layout differs.
+        slots: Number of records; rounded up to a multiple of 8.
+    """
+
+    def __init__(self, path: str, *, slots: int = 65536) -> None:
+        if fcntl is None:  # pragma: no cover
+            raise ImportError("SharedMemoryCache requires a platform with fcntl.")
+        self.path = path
+        self.slots = max(_WAYS, -(-slots // _WAYS) * _WAYS)
+        self._buckets = self.slots // _WAYS
+        self._records_offset = _HEADER_SIZE + self._buckets
+        size = self._records_offset + self.slots * _RECORD_SIZE
+        self._thread_locks = [threading.Lock() for _ in range(_LOCK_STRIPES)]
+
+        self._fd = self._open(size)
+        self._buffer = mmap.mmap(self._fd, size, mmap.MAP_SHARED)
+
+    def _open(self, size: int) -> int:
+        """Open the table at ``self.path``, replacing it if its layout differs.
+
+        A file that other processes may have mapped is never resized: shrinking it
+        would crash them with SIGBUS. A new table is built next to it and moved
+        into place instead, and existing mappings keep using the old file.
+        """
+        header = _HEADER.pack(_MAGIC, self.slots, _RECORD_SIZE)
+        while True:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.lockf(fd, fcntl.LOCK_EX)
+                stat = os.fstat(fd)
+                if os.stat(self.path).st_ino != stat.st_ino:
+                    # Another process replaced the file while we waited for the lock.
+                    os.close(fd)
+                    continue
+                if stat.st_size == size and os.pread(fd, _HEADER.size, 0) == header:
+                    fcntl.lockf(fd, fcntl.LOCK_UN)
+                    return fd
+                # Keep the old file locked until the new one is in place, so other
+                # openers wait and then find the replacement.
+                replacement = self._create(size, header)
+            except BaseException:
+                os.close(fd)
+                raise
+            os.close(fd)
+            return replacement
+
+    def _create(self, size: int, header: bytes) -> int:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".truelist-cache-")
+        try:
+            os.ftruncate(fd, size)
+            os.pwrite(fd, header, 0)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.close(fd)
+            os.unlink(tmp_path)
+            raise
+        return fd
+
+    @staticmethod
+    def key_hash(key: str) -> int:
+        """Hash a cache key to the non-zero 64-bit value stored in the table."""
+        value = int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "little")
+        return value or 1
+
+    def _record_offset(self, bucket: int, way: int) -> int:
+        return self._records_offset + (bucket * _WAYS + way) * _RECORD_SIZE
+
+    def get(self, key: str) -> ValidationResult | None:
+        """Return the unexpired result stored for ``key``, or None."""
+        target = self.key_hash(key)
+        bucket = target % self._buckets
+        buffer = self._buffer
+        now = int(time.time())
+        for way in range(_WAYS):
+            offset = self._record_offset(bucket, way)
+            for _ in range(_READ_RETRIES):
+                seq, stored_key, expires, _, length = _RECORD.unpack_from(buffer, offset)
+                if seq & 1:
+                    continue
+                if stored_key != target:
+                    break
+                start = offset + _RECORD.size
+                payload = buffer[start : start + length]
+                if _SEQ.unpack_from(buffer, offset)[0] != seq:
+                    continue
+                if expires <= now:
+                    return None
+                buffer[offset + _REF_OFFSET] = 1
+                return _decode(payload)
+        return None
+
+    def set(self, key: str, result: ValidationResult, ttl: int) -> bool:
+        """Store ``result`` for ``ttl`` seconds.
+
+        Returns:
+            False if the encoded result is too large for a record.
+        """
+        payload = _encode(result)
+        if len(payload) > _MAX_PAYLOAD:
+            return False
+        target = self.key_hash(key)
+        bucket = target % self._buckets
+        with self._lock_bucket(bucket):
+            way = self._choose_way(bucket, target)
+            offset = self._record_offset(bucket, way)
+            buffer = self._buffer
+            (seq,) = _SEQ.unpack_from(buffer, offset)
+            writing = (seq + 1) & _SEQ_MASK
+            _SEQ.pack_into(buffer, offset, writing)
+            start = offset + _RECORD.size
+            buffer[start : start + len(payload)] = payload
+            _RECORD.pack_into(
+                buffer, offset, writing, target, int(time.time()) + ttl, 1, len(payload)
+            )
+            _SEQ.pack_into(buffer, offset, (seq + 2) & _SEQ_MASK)
+        return True
+
+    def _choose_way(self, bucket: int, target: int) -> int:
+        now = int(time.time())
+        free = None
+        for way in range(_WAYS):
+            _, stored_key, expires, _, _ = _RECORD.unpack_from(
+                self._buffer, self._record_offset(bucket, way)
+            )
+            if stored_key == target:
+                return way
+            if free is None and (stored_key == 0 or expires <= now):
+                free = way
+        if free is not None:
+            return free
+        # CLOCK: clear reference bits until an unreferenced record comes round.
+        hand_offset = _HEADER_SIZE + bucket
+        hand = self._buffer[hand_offset] % _WAYS
+        while True:
+            ref_offset = self._record_offset(bucket, hand) + _REF_OFFSET
+            if not self._buffer[ref_offset]:
+                self._buffer[hand_offset] = (hand + 1) % _WAYS
+                return hand
+            self._buffer[ref_offset] = 0
+            hand = (hand + 1) % _WAYS
+
+    def _lock_bucket(self, bucket: int) -> _BucketLock:
+        return _BucketLock(self, bucket)
+
+    def clear(self) -> None:
+        """Drop every record."""
+        for bucket in range(self._buckets):
+            with self._lock_bucket(bucket):
+                for way in range(_WAYS):
+                    offset = self._record_offset(bucket, way)
+                    (seq,) = _SEQ.unpack_from(self._buffer, offset)
+                    _RECORD.pack_into(self._buffer, offset, (seq + 2) & _SEQ_MASK, 0, 0, 0, 0)
+
+
+class _BucketLock:
+    def __init__(self, cache: SharedMemoryCache, bucket: int) -> None:
+        self._cache = cache
+        self._bucket = bucket
+        self._thread_lock = cache._thread_locks[bucket % _LOCK_STRIPES]
+
+    def __enter__(self) -> None:
+        self._thread_lock.acquire()
+        # fcntl locks belong to the process, so threads are serialised above.
+        fcntl.lockf(self._cache._fd, fcntl.LOCK_EX, 1, self._bucket)
+
+    def __exit__(self, *args: object) -> None:
+        fcntl.lockf(self._cache._fd, fcntl.LOCK_UN, 1, self._bucket)
+        self._thread_lock.release()
+
+
+_local_caches: dict[tuple[int, str, int], SharedMemoryCache] = {}
+_local_caches_lock = threading.Lock()
+
+
+def get_local_cache(path: str, slots: int) -> SharedMemoryCache:
+    """Return this process's mapping of the shared table at ``path``."""
+    key = (os.getpid(), path, slots)
+    local_cache = _local_caches.get(key)
+    if local_cache is None:
+        with _local_caches_lock:
+            local_cache = _local_caches.get(key)
+            if local_cache is None:
+                local_cache = SharedMemoryCache(path, slots=slots)
+                _local_caches[key] = local_cache
+    return local_cache
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from truelist_django.blocklist import build_blocklist
+from truelist_django.settings import get_setting
+
+
+def _read_lines(paths: list[str]) -> Iterator[str]:
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            yield from f
+
+
+class Command(BaseCommand):
+    help = (
+        "Compile known-invalid addresses and domains into a memory-mapped index file. "
+        "The file is swapped in atomically, so running workers pick it up without restart."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--addresses",
+            action="append",
+            default=[],
+            metavar="FILE",
+            help="File with one known-invalid address per line. May be repeated.",
+        )
+        parser.add_argument(
+            "--domains",
+            action="append",
+            default=[],
+            metavar="FILE",
+            help="File with one known-invalid domain per line. May be repeated.",
+        )
+        parser.add_argument(
+            "--output",
+            default=None,
+            help="Index file to write (default: TRUELIST_BLOCKLIST_PATH).",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        output = options["output"] or get_setting("TRUELIST_BLOCKLIST_PATH")
+        if not output:
+            raise CommandError("No output path: pass --output or set TRUELIST_BLOCKLIST_PATH.")
+        if not (options["addresses"] or options["domains"]):
+            raise CommandError("Nothing to compile: pass --addresses or --domains.")
+
+        try:
+            build_blocklist(
+                output,
+                addresses=_read_lines(options["addresses"]),
+                domains=_read_lines(options["domains"]),
+            )
+        except OSError as exc:
+            raise CommandError(str(exc)) from exc
+        self.stdout.write(f"Wrote blocklist to {output}.")
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from truelist_django.cache import CachedTruelistClient
+
+
+class Command(BaseCommand):
+    help = (
+        "Invalidate cached Truelist validation results by bumping generation counters. "
+        "Runs in O(1) per target and never scans cache keys."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            dest="all",
+            help="Invalidate every cached result.",
+        )
+        parser.add_argument(
+            "--domain",
+            action="append",
+            default=[],
+            dest="domains",
+            metavar="DOMAIN",
+            help="Invalidate results for addresses at DOMAIN. May be repeated.",
+        )
+        parser.add_argument(
+            "--tenant",
+            action="append",
+            default=[],
+            dest="tenants",
+            metavar="TENANT",
+            help="Invalidate results cached for TENANT. May be repeated.",
+        )
+        parser.add_argument(
+            "--cache-alias",
+            default=None,
+            help="Django cache alias to use (default: TRUELIST_CACHE_ALIAS).",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if not (options["all"] or options["domains"] or options["tenants"]):
+            raise CommandError("Nothing to invalidate: pass --all, --domain or --tenant.")
+
+        client = CachedTruelistClient(cache_alias=options["cache_alias"])
+        if options["all"]:
+            generation = client.invalidate_all()
+            self.stdout.write(f"Invalidated all results (generation {generation}).")
+        for domain in options["domains"]:
+            generation = client.invalidate_domain(domain)
+            self.stdout.write(f"Invalidated domain {domain} (generation {generation}).")
+        for tenant in options["tenants"]:
+            generation = client.invalidate_tenant(tenant)
+            self.stdout.write(f"Invalidated tenant {tenant} (generation {generation}).")
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from truelist_django.refresh import RefreshScheduler
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-validate tracked addresses before their cached results expire, "
+        "most recently accessed first, within an API budget."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Refresh one minute's budget of due addresses and exit.",
+        )
+        parser.add_argument(
+            "--budget",
+            type=int,
+            default=None,
+            help="API calls per minute (default: TRUELIST_REFRESH_BUDGET).",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        scheduler = RefreshScheduler(budget_per_minute=options["budget"])
+        if options["once"]:
+            refreshed = scheduler.run_once()
+            self.stdout.write(f"Refreshed {refreshed} addresses.")
+            return
+        self.stdout.write(
+            f"Refreshing tracked addresses at up to {scheduler.budget_per_minute} calls/minute."
+        )
+        try:
+            scheduler.run_forever()
+        except KeyboardInterrupt:
+            self.stdout.write("Stopped.")
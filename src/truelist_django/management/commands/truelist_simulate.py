@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from truelist_django.simulate import CachePolicy, read_log, simulate
+
+
+def _parse_state_ttl(value: str) -> tuple[str, int]:
+    state, sep, ttl = value.partition("=")
+    if not sep or not state:
+        raise CommandError(f"Invalid --state-ttl {value!r}: expected STATE=SECONDS.")
+    try:
+        return state, int(ttl)
+    except ValueError:
+        raise CommandError(f"Invalid --state-ttl {value!r}: expected STATE=SECONDS.") from None
+
+
+class Command(BaseCommand):
+    help = (
+        "Replay an anonymised request log through the cache logic with a simulated "
+        "clock, and report hit ratio, API calls saved, memory and staleness per policy."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "log",
+            help="CSV log with timestamp, key and state columns (optionally domain and tenant).",
+        )
+        parser.add_argument(
+            "--ttl",
+            type=int,
+            action="append",
+            default=[],
+            help="Cache TTL in seconds to evaluate. May be repeated (default: 3600).",
+        )
+        parser.add_argument(
+            "--max-entries",
+            type=int,
+            action="append",
+            default=[],
+            help="Cache capacity to evaluate. May be repeated (default: unbounded).",
+        )
+        parser.add_argument(
+            "--state-ttl",
+            action="append",
+            default=[],
+            metavar="STATE=SECONDS",
+            help="Per-state TTL applied to every policy, e.g. email_invalid=604800.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        state_ttls = dict(_parse_state_ttl(value) for value in options["state_ttl"])
+        policies = [
+            CachePolicy(
+                name=f"ttl={ttl} max_entries={max_entries or 'unbounded'}",
+                ttl=ttl,
+                state_ttls=state_ttls,
+                max_entries=max_entries,
+            )
+            for ttl in options["ttl"] or [3600]
+            for max_entries in options["max_entries"] or [None]
+        ]
+
+        try:
+            with open(options["log"], encoding="utf-8", newline="") as f:
+                reports = simulate(read_log(f), policies)
+        except (OSError, ValueError) as exc:
+            raise CommandError(str(exc)) from exc
+
+        for report in reports:
+            self.stdout.write(
+                f"{report.policy.name}: "
+                f"requests={report.requests} "
+                f"hit_ratio={report.hit_ratio:.1%} "
+                f"api_calls={report.api_calls} "
+                f"api_calls_saved={report.api_calls_saved} "
+                f"evictions={report.evictions} "
+                f"peak_entries={report.peak_entries} "
+                f"peak_bytes={report.peak_bytes} "
+                f"stale_hits={report.stale_ratio:.1%} "
+                f"mean_hit_age={report.mean_hit_age:.0f}s "
+                f"max_hit_age={report.max_hit_age:.0f}s"
+            )
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="ValidationRecord",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("email", models.CharField(max_length=254)),
+                ("tenant", models.CharField(blank=True, default="", max_length=255)),
+                ("state", models.CharField(max_length=32)),
+                ("fetched_at", models.DateTimeField()),
+                ("refresh_after", models.DateTimeField(db_index=True)),
+                ("last_accessed_at", models.DateTimeField(db_index=True)),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("email", "tenant"), name="truelist_record_unique"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+from django.core.exceptions import ValidationError
+from django.db import models
+from django.utils import timezone
+from truelist import ValidationResult
+
+from truelist_django.settings import get_setting
+from truelist_django.validators import TruelistEmailValidator
+
+
+class TruelistVerifiedEmailMixin(models.Model):
+    """Abstract model mixin that skips re-validation of an unchanged, verified email.
+
+    The mixin remembers the last verified value along with its state, sub-state and
+    verification time. ``full_clean()`` only calls Truelist when the email differs
+    from the remembered value (case-insensitively) or the verification is older than
+    the re-verify age.
+
+    Usage::
+
+        from django.db import models
+        from truelist_django.models import TruelistVerifiedEmailMixin
+
+        class Profile(TruelistVerifiedEmailMixin, models.Model):
+            email = models.EmailField()
+
+    Do not also add ``TruelistEmailValidator`` to the field's ``validators``; the
+    mixin runs ``truelist_validator`` itself.
+
+    Attributes:
+        truelist_email_field: Name of the email field to verify (default: "email").
+        truelist_validator: Validator used for verification.
+        truelist_reverify_after: Seconds after which a verification expires. None uses
+            ``TRUELIST_REVERIFY_AFTER``.
+    """
+
+    truelist_email_field = "email"
+    truelist_validator = TruelistEmailValidator()
+    truelist_reverify_after: int | None = None
+
+    truelist_verified_email = models.EmailField(blank=True, default="", editable=False)
+    truelist_state = models.CharField(max_length=32, blank=True, default="", editable=False)
+    truelist_sub_state = models.CharField(max_length=64, blank=True, default="", editable=False)
+    truelist_verified_at = models.DateTimeField(null=True, blank=True, editable=False)
+
+    class Meta:
+        abstract = True
+
+    def truelist_is_verified(self) -> bool:
+        """Whether the current email value was verified recently enough to trust."""
+        value = getattr(self, self.truelist_email_field)
+        if not value or self.truelist_verified_at is None:
+            return False
+        if str(value).lower().strip() != self.truelist_verified_email.lower().strip():
+            return False
+        max_age = self.truelist_reverify_after
+        if max_age is None:
+            max_age = get_setting("TRUELIST_REVERIFY_AFTER")
+        if max_age is None:
+            return True
+        return timezone.now() - self.truelist_verified_at < timedelta(seconds=max_age)
+
+    def truelist_record(self, value: str, result: ValidationResult) -> None:
+        """Remember a verification result for ``value``."""
+        self.truelist_verified_email = value
+        self.truelist_state = result.state
+        self.truelist_sub_state = result.sub_state
+        self.truelist_verified_at = timezone.now()
+
+    def clean_fields(self, exclude: Any = None) -> None:
+        name = self.truelist_email_field
+        errors: dict[str, Any] = {}
+        try:
+            super().clean_fields(exclude=exclude)
+        except ValidationError as exc:
+            errors = exc.update_error_dict(errors)
+
+        value = getattr(self, name)
+        if (
+            (exclude is None or name not in exclude)
+            and name not in errors
+            and value
+            and not self.truelist_is_verified()
+        ):
+            try:
+                result = self.truelist_validator.validate(value)
+            except ValidationError as exc:
+                errors[name] = exc.error_list
+            else:
+                # Inconclusive results are not remembered, matching the cache.
+                if result is not None and not result.is_unknown:
+                    self.truelist_record(value, result)
+
+        if errors:
+            raise ValidationError(errors)
@@ -0,0 +1,32 @@
+"""Models that require ``truelist_django`` in ``INSTALLED_APPS``.
+
+They live outside :mod:`truelist_django.models` so that the abstract
+``TruelistVerifiedEmailMixin`` can be imported without installing the app.
+"""
+
+from __future__ import annotations
+
+from django.db import models
+
+
+class ValidationRecord(models.Model):
+    """A cached validation result tracked for background refresh.
+
+    Rows are written by ``CachedTruelistClient`` when ``TRUELIST_REFRESH_TRACKING``
+    is on, and consumed by :class:`truelist_django.refresh.RefreshScheduler`.
+    """
+
+    email = models.CharField(max_length=254)
+    tenant = models.CharField(max_length=255, blank=True, default="")
+    state = models.CharField(max_length=32)
+    fetched_at = models.DateTimeField()
+    refresh_after = models.DateTimeField(db_index=True)
+    last_accessed_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["email", "tenant"], name="truelist_record_unique"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.email} ({self.state})"
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from truelist import AuthenticationError, TruelistError, ValidationResult
+
+from truelist_django.cache import CachedTruelistClient
+from truelist_django.dispatch import BACKGROUND
+from truelist_django.records import ValidationRecord
+from truelist_django.settings import get_setting
+
+logger = logging.getLogger(__name__)
+
+# How long to wait before retrying an address whose refresh failed or came back
+# "unknown" (seconds).
+_RETRY_DELAY = 900
+
+
+def record_fetch(
+    email: str,
+    tenant: str | None,
+    result: ValidationResult,
+    ttl: int,
+    *,
+    accessed: bool = True,
+) -> None:
+    """Track a freshly cached result so it is refreshed before it expires.
+
+    Args:
+        email: The validated address.
+        tenant: The client's tenant, if any.
+        result: The result that was cached.
+        ttl: Seconds the result stays cached.
+        accessed: Whether a caller asked for the address, as opposed to a
+            background refresh. Only accesses keep an address in the active window.
+    """
+    now = timezone.now()
+    # Short-lived results refresh halfway through their TTL, so they are not due
+    # again the moment they are fetched.
+    lead = min(get_setting("TRUELIST_REFRESH_LEAD"), ttl // 2)
+    email = email.lower().strip()
+    tenant = tenant or ""
+    fields = {
+        "state": result.state,
+        "fetched_at": now,
+        "refresh_after": now + timedelta(seconds=ttl - lead),
+    }
+    if accessed:
+        fields["last_accessed_at"] = now
+    if not ValidationRecord.objects.filter(email=email, tenant=tenant).update(**fields):
+        try:
+            with transaction.atomic():
+                ValidationRecord.objects.create(
+                    email=email, tenant=tenant, **{"last_accessed_at": now, **fields}
+                )
+        except IntegrityError:
+            # Another process tracked the address first.
+            ValidationRecord.objects.filter(email=email, tenant=tenant).update(**fields)
+
+
+def record_access(email: str, tenant: str | None) -> None:
+    """Mark a tracked address as recently used."""
+    ValidationRecord.objects.filter(email=email.lower().strip(), tenant=tenant or "").update(
+        last_accessed_at=timezone.now()
+    )
+
+
+class RefreshScheduler:
+    """Re-validates cached results before they expire, within an API budget.
+
+    Addresses are picked from :class:`~truelist_django.records.ValidationRecord`
+    rows whose refresh time has passed. Recently accessed addresses go first;
+    addresses not accessed within the active window are dropped instead of
+    refreshed and simply expire from the cache.
+
+    Usage::
+
+        scheduler = RefreshScheduler(budget_per_minute=120)
+        scheduler.run_forever()
+
+    Args:
+        budget_per_minute: API calls allowed per minute (default: TRUELIST_REFRESH_BUDGET).
+        active_window: Seconds since last access after which an address is no longer
+            refreshed (default: TRUELIST_REFRESH_ACTIVE_WINDOW).
+        client_factory: Builds the client for a tenant (None for no tenant). The
+            client must have refresh tracking on, so refreshed records are rescheduled.
+        sleep: Sleep function, replaceable in tests.
+    """
+
+    def __init__(
+        self,
+        *,
+        budget_per_minute: int | None = None,
+        active_window: int | None = None,
+        client_factory: Callable[[str | None], CachedTruelistClient] | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.budget_per_minute: int = (
+            budget_per_minute
+            if budget_per_minute is not None
+            else get_setting("TRUELIST_REFRESH_BUDGET")
+        )
+        if self.budget_per_minute <= 0:
+            raise ValueError("budget_per_minute must be positive.")
+        self.active_window: int = (
+            active_window
+            if active_window is not None
+            else get_setting("TRUELIST_REFRESH_ACTIVE_WINDOW")
+        )
+        self.client_factory = client_factory or (
+            lambda tenant: CachedTruelistClient(
+                cache_enabled=True, tenant=tenant, refresh_tracking=True, priority=BACKGROUND
+            )
+        )
+        self.sleep = sleep
+        self._next_slot = 0.0
+
+    def prune(self) -> int:
+        """Stop tracking addresses that have not been accessed within the active window.
+
+        Returns:
+            The number of records removed.
+        """
+        cutoff = timezone.now() - timedelta(seconds=self.active_window)
+        deleted, _ = ValidationRecord.objects.filter(last_accessed_at__lt=cutoff).delete()
+        return deleted
+
+    def due(self, limit: int) -> list[ValidationRecord]:
+        """Return up to ``limit`` records to refresh, most recently accessed first."""
+        now = timezone.now()
+        return list(
+            ValidationRecord.objects.filter(
+                refresh_after__lte=now,
+                last_accessed_at__gte=now - timedelta(seconds=self.active_window),
+            ).order_by("-last_accessed_at", "refresh_after")[:limit]
+        )
+
+    def _wait_for_slot(self) -> None:
+        interval = 60.0 / self.budget_per_minute
+        now = time.monotonic()
+        if self._next_slot > now:
+            self.sleep(self._next_slot - now)
+            now = self._next_slot
+        self._next_slot = max(now, self._next_slot) + interval
+
+    def _refresh(self, record: ValidationRecord) -> bool:
+        client = self.client_factory(record.tenant or None)
+        try:
+            result = client.refresh(record.email)
+        except AuthenticationError:
+            raise
+        except TruelistError:
+            logger.warning("Truelist API error while refreshing %s", record.email, exc_info=True)
+            result = None
+        finally:
+            client.close()
+
+        if result is None or result.is_unknown:
+            # Successful refreshes rewrite the record through record_fetch().
+            ValidationRecord.objects.filter(pk=record.pk).update(
+                refresh_after=timezone.now() + timedelta(seconds=_RETRY_DELAY)
+            )
+            return False
+        return True
+
+    def run_once(self) -> int:
+        """Refresh one minute's budget of due addresses.
+
+        Returns:
+            The number of addresses refreshed successfully.
+        """
+        self.prune()
+        refreshed = 0
+        for record in self.due(self.budget_per_minute):
+            self._wait_for_slot()
+            if self._refresh(record):
+                refreshed += 1
+        return refreshed
+
+    def run_forever(self, idle_interval: float = 30.0) -> None:
+        """Refresh continuously, sleeping ``idle_interval`` seconds when nothing is due."""
+        while True:
+            if not self.due(1):
+                self.sleep(idle_interval)
+                continue
+            self.run_once()
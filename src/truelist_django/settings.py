@@ -12,6 +12,31 @@ _DEFAULTS: dict[str, Any] = {
     "TRUELIST_CACHE_ENABLED": False,
     "TRUELIST_CACHE_TTL": 3600,
     "TRUELIST_CACHE_ALIAS": "default",
+    "TRUELIST_CACHE_STATE_TTLS": {},
+    "TRUELIST_LOCAL_CACHE_PATH": None,
+    "TRUELIST_LOCAL_CACHE_SLOTS": 65536,
+    "TRUELIST_LOCAL_CACHE_TTL": 60,
+    "TRUELIST_BACKEND": None,
+    "TRUELIST_BLOCKLIST_PATH": None,
+    "TRUELIST_REVERIFY_AFTER": 30 * 24 * 3600,
+    "TRUELIST_HTTP_TRANSPORT": None,
+    "TRUELIST_HTTP_MAX_CONNECTIONS": 100,
+    "TRUELIST_HTTP_MAX_KEEPALIVE": 20,
+    "TRUELIST_HTTP_KEEPALIVE_EXPIRY": 5.0,
+    "TRUELIST_HTTP2": False,
+    "TRUELIST_HTTP_PROXY": None,
+    "TRUELIST_DNS_CACHE_TTL": 0,
+    "TRUELIST_REFRESH_TRACKING": False,
+    "TRUELIST_REFRESH_BUDGET": 60,
+    "TRUELIST_REFRESH_LEAD": 600,
+    "TRUELIST_REFRESH_ACTIVE_WINDOW": 7 * 24 * 3600,
+    "TRUELIST_LIVE_DEBOUNCE": 0.3,
+    "TRUELIST_LIVE_RATE_LIMIT": 60,
+    "TRUELIST_MAX_IN_FLIGHT": None,
+    "TRUELIST_INTERACTIVE_RESERVED": 2,
+    "TRUELIST_TYPO_DETECTION": False,
+    "TRUELIST_TYPO_EXTRA_DOMAINS": (),
+    "TRUELIST_TYPO_MAX_DISTANCE": 2,
 }
 
 
@@ -0,0 +1,374 @@
+"""Offline cache policy simulator.
+
+Replays a log of validation requests through the real ``CachedTruelistClient``
+cache logic, with a simulated clock and an in-memory cache, once per candidate
+policy::
+
+    from truelist_django.simulate import CachePolicy, read_log, simulate
+
+    with open("requests.csv") as f:
+        reports = simulate(
+            read_log(f),
+            [
+                CachePolicy("1h", ttl=3600),
+                CachePolicy("1d, 100k entries", ttl=86400, max_entries=100_000),
+            ],
+        )
+
+The log is a CSV file with a header row and the columns ``timestamp`` (Unix
+seconds or ISO 8601), ``key`` (an opaque, hashed address), ``state`` (the
+state Truelist returned at that time) and optionally ``domain`` (hashed) and
+``tenant``. Rows must be in time order.
+"""
+
+from __future__ import annotations
+
+import csv
+import heapq
+import pickle
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import IO, Any, NamedTuple, cast
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from truelist import Truelist, ValidationResult
+
+from truelist_django.cache import CachedTruelistClient
+
+_VALIDATION_PREFIX = "truelist:validation:"
+_FALLBACK_DOMAIN = "simulated.invalid"
+
+
+class LogRecord(NamedTuple):
+    timestamp: float
+    key: str
+    state: str
+    domain: str = ""
+    tenant: str = ""
+
+
+class CachePolicy(NamedTuple):
+    """A cache configuration to evaluate.
+
+    Attributes:
+        name: Label used in reports.
+        ttl: Cache duration in seconds, as ``TRUELIST_CACHE_TTL``.
+        state_ttls: Per-state durations, as ``TRUELIST_CACHE_STATE_TTLS``.
+        max_entries: Cache capacity, evicting least recently used entries first.
+            None for unbounded.
+    """
+
+    name: str
+    ttl: int
+    state_ttls: Mapping[str, int] = {}
+    max_entries: int | None = None
+
+
+@dataclass
+class SimulationReport:
+    """Outcome of replaying a log against one policy.
+
+    ``peak_bytes`` counts keys and pickled values only; real backends add their
+    own per-entry overhead on top.
+    """
+
+    policy: CachePolicy
+    requests: int = 0
+    hits: int = 0
+    api_calls: int = 0
+    evictions: int = 0
+    stale_hits: int = 0
+    total_hit_age: float = 0.0
+    max_hit_age: float = 0.0
+    peak_entries: int = 0
+    peak_bytes: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        return self.hits / self.requests if self.requests else 0.0
+
+    @property
+    def api_calls_saved(self) -> int:
+        """API calls avoided compared with no cache."""
+        return self.hits
+
+    @property
+    def stale_ratio(self) -> float:
+        """Fraction of hits whose cached state differed from the logged state."""
+        return self.stale_hits / self.hits if self.hits else 0.0
+
+    @property
+    def mean_hit_age(self) -> float:
+        """Mean seconds between caching a result and serving it."""
+        return self.total_hit_age / self.hits if self.hits else 0.0
+
+
+def _parse_timestamp(value: str) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value).timestamp()
+
+
+def read_log(file: IO[str]) -> Iterator[LogRecord]:
+    """Parse a CSV request log.
+
+    Raises:
+        ValueError: If a required column is missing or a timestamp is malformed.
+    """
+    reader = csv.DictReader(file)
+    missing = {"timestamp", "key", "state"} - set(reader.fieldnames or ())
+    if missing:
+        raise ValueError(f"Log is missing columns: {', '.join(sorted(missing))}")
+    for row in reader:
+        yield LogRecord(
+            timestamp=_parse_timestamp(row["timestamp"]),
+            key=row["key"],
+            state=row["state"],
+            domain=row.get("domain") or "",
+            tenant=row.get("tenant") or "",
+        )
+
+
+class SimulatedCache(BaseCache):
+    """In-memory Django cache backend driven by a simulated clock.
+
+    Entries expire against :attr:`now` rather than wall time. With ``max_entries``
+    set, the least recently used entry is evicted when the cache is full. The
+    cache also keeps the statistics reported by :func:`simulate`.
+    """
+
+    def __init__(self, *, max_entries: int | None = None) -> None:
+        super().__init__({"TIMEOUT": None})
+        self.now = 0.0
+        self.max_entries = max_entries
+        self.evictions = 0
+        self.bytes = 0
+        self.peak_entries = 0
+        self.peak_bytes = 0
+        self.last_hit_age: float | None = None
+        # key -> (value, expiry, stored at, size)
+        self._data: OrderedDict[str, tuple[Any, float | None, float, int]] = OrderedDict()
+        self._expiries: list[tuple[float, str]] = []
+
+    def advance(self, now: float) -> None:
+        """Move the clock to ``now`` and drop entries that expired by then."""
+        self.now = now
+        while self._expiries and self._expiries[0][0] <= now:
+            expiry, key = heapq.heappop(self._expiries)
+            entry = self._data.get(key)
+            # Skip heap items left behind by entries that were overwritten.
+            if entry is not None and entry[1] == expiry:
+                self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        _, _, _, size = self._data.pop(key)
+        self.bytes -= size
+
+    def _live(self, key: str) -> tuple[Any, float | None, float, int] | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[1] is not None and entry[1] <= self.now:
+            self._remove(key)
+            return None
+        return entry
+
+    def _expiry(self, timeout: Any) -> float | None:
+        if timeout is DEFAULT_TIMEOUT:
+            timeout = self.default_timeout
+        return None if timeout is None else self.now + timeout
+
+    def get(self, key: str, default: Any = None, version: int | None = None) -> Any:
+        entry = self._live(key)
+        if entry is None:
+            return default
+        self._data.move_to_end(key)
+        if key.startswith(_VALIDATION_PREFIX):
+            self.last_hit_age = self.now - entry[2]
+        return entry[0]
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        timeout: Any = DEFAULT_TIMEOUT,
+        version: int | None = None,
+    ) -> None:
+        if key in self._data:
+            self._remove(key)
+        expiry = self._expiry(timeout)
+        if expiry is not None and expiry <= self.now:
+            return
+        size = len(key) + len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        self._data[key] = (value, expiry, self.now, size)
+        self.bytes += size
+        if expiry is not None:
+            heapq.heappush(self._expiries, (expiry, key))
+        while self.max_entries is not None and len(self._data) > self.max_entries:
+            self._remove(next(iter(self._data)))
+            self.evictions += 1
+        self.peak_entries = max(self.peak_entries, len(self._data))
+        self.peak_bytes = max(self.peak_bytes, self.bytes)
+
+    def add(
+        self,
+        key: str,
+        value: Any,
+        timeout: Any = DEFAULT_TIMEOUT,
+        version: int | None = None,
+    ) -> bool:
+        if self._live(key) is not None:
+            return False
+        self.set(key, value, timeout)
+        return True
+
+    def touch(self, key: str, timeout: Any = DEFAULT_TIMEOUT, version: int | None = None) -> bool:
+        entry = self._live(key)
+        if entry is None:
+            return False
+        self.set(key, entry[0], timeout)
+        return True
+
+    def delete(self, key: str, version: int | None = None) -> bool:
+        if self._live(key) is None:
+            return False
+        self._remove(key)
+        return True
+
+    def has_key(self, key: str, version: int | None = None) -> bool:
+        return self._live(key) is not None
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._expiries.clear()
+        self.bytes = 0
+
+
+class _ReplayBackend:
+    """Stand-in for the SDK client that answers with the state from the log."""
+
+    def __init__(self) -> None:
+        self.state = "ok"
+        self.calls = 0
+
+    @property
+    def email(self) -> _ReplayBackend:
+        return self
+
+    def validate(self, email: str) -> ValidationResult:
+        self.calls += 1
+        return ValidationResult(
+            email=email,
+            domain=email.rpartition("@")[2],
+            canonical=None,
+            mx_record=None,
+            first_name=None,
+            last_name=None,
+            state=self.state,
+            sub_state=self.state,
+            verified_at=None,
+            suggestion=None,
+        )
+
+    def close(self) -> None:
+        pass
+
+
+class _SimulatedClient(CachedTruelistClient):
+    """``CachedTruelistClient`` wired to a simulated cache and replay backend.
+
+    Only the Django cache tier is simulated: the blocklist, typo detection, the
+    local tier and refresh tracking are off.
+    """
+
+    def __init__(
+        self,
+        cache: SimulatedCache,
+        backend: _ReplayBackend,
+        policy: CachePolicy,
+        tenant: str | None,
+    ) -> None:
+        super().__init__(
+            cache_enabled=True,
+            cache_ttl=policy.ttl,
+            state_ttls=policy.state_ttls,
+            tenant=tenant,
+            refresh_tracking=False,
+            typo_detection=False,
+        )
+        self._blocklist_path = None
+        self._local_cache_path = None
+        self._simulated_cache = cache
+        self._client = cast(Truelist, backend)
+
+    def _get_cache(self) -> Any:
+        return self._simulated_cache
+
+
+class _Run:
+    def __init__(self, policy: CachePolicy) -> None:
+        self.report = SimulationReport(policy=policy)
+        self.cache = SimulatedCache(max_entries=policy.max_entries)
+        self.backend = _ReplayBackend()
+        self._clients: dict[str, _SimulatedClient] = {}
+
+    def replay(self, record: LogRecord) -> None:
+        client = self._clients.get(record.tenant)
+        if client is None:
+            client = _SimulatedClient(
+                self.cache, self.backend, self.report.policy, record.tenant or None
+            )
+            self._clients[record.tenant] = client
+        report = self.report
+        self.cache.advance(record.timestamp)
+        self.cache.last_hit_age = None
+        self.backend.state = record.state
+        calls = self.backend.calls
+
+        result = client.validate(f"{record.key}@{record.domain or _FALLBACK_DOMAIN}")
+
+        report.requests += 1
+        if self.backend.calls > calls:
+            report.api_calls += 1
+            return
+        report.hits += 1
+        if result.state != record.state:
+            report.stale_hits += 1
+        age = self.cache.last_hit_age or 0.0
+        report.total_hit_age += age
+        report.max_hit_age = max(report.max_hit_age, age)
+
+    def finish(self) -> SimulationReport:
+        self.report.evictions = self.cache.evictions
+        self.report.peak_entries = self.cache.peak_entries
+        self.report.peak_bytes = self.cache.peak_bytes
+        return self.report
+
+
+def simulate(
+    records: Iterable[LogRecord], policies: Sequence[CachePolicy]
+) -> list[SimulationReport]:
+    """Replay ``records`` against each policy in a single pass over the log.
+
+    Args:
+        records: Requests in time order, e.g. from :func:`read_log`.
+        policies: Cache configurations to compare.
+
+    Returns:
+        One report per policy, in the same order.
+
+    Raises:
+        ValueError: If the records are not in time order.
+    """
+    runs = [_Run(policy) for policy in policies]
+    previous = float("-inf")
+    for record in records:
+        if record.timestamp < previous:
+            raise ValueError(f"Log is not in time order at key {record.key!r}.")
+        previous = record.timestamp
+        for run in runs:
+            run.replay(record)
+    return [run.finish() for run in runs]
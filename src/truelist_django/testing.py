@@ -0,0 +1,253 @@
+"""In-memory fake Truelist backend for tests and load tests.
+
+Select it with a setting instead of patching ``CachedTruelistClient``::
+
+    # settings.py (test settings)
+    TRUELIST_BACKEND = "truelist_django.testing.backend"
+
+or, with pytest, enable the ``truelist_fake`` fixture in ``conftest.py``::
+
+    pytest_plugins = ["truelist_django.testing"]
+
+    def test_signup(truelist_fake):
+        truelist_fake.add_rule(domain="mailinator.com", state="email_invalid")
+        ...
+        truelist_fake.assert_called_with("user@mailinator.com")
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import threading
+import time
+from collections.abc import Callable, Iterator
+from typing import Any, NamedTuple
+
+from truelist import ConnectionError, ValidationResult
+
+_DEFAULT_SUB_STATES = {
+    "ok": "email_ok",
+    "email_invalid": "failed_no_mailbox",
+    "risky": "accept_all",
+    "unknown": "unknown",
+}
+
+
+class _Rule(NamedTuple):
+    state: str
+    sub_state: str
+    suggestion: str | None
+    error: Exception | None
+    latency: float | None
+
+
+def _normalize(value: str) -> str:
+    return value.lower().strip()
+
+
+class FakeTruelist:
+    """Deterministic stand-in for the Truelist SDK client.
+
+    Results come from rules matched by exact address, then domain, then regular
+    expression, in that order; anything unmatched gets ``default_state``. Address
+    and domain rules are dictionary lookups, so large rule sets stay fast.
+
+    Args:
+        default_state: State returned when no rule matches (default: "ok").
+        latency: Simulated seconds per call, or a ``(low, high)`` range to draw from.
+        error_rate: Fraction of calls, between 0 and 1, that raise ``error_factory()``.
+        error_factory: Builds the exception raised for injected errors
+            (default: ``truelist.ConnectionError``).
+        seed: Seed for latency ranges and error injection, so runs are repeatable.
+    """
+
+    def __init__(
+        self,
+        *,
+        default_state: str = "ok",
+        latency: float | tuple[float, float] = 0.0,
+        error_rate: float = 0.0,
+        error_factory: Callable[[], Exception] | None = None,
+        seed: int = 0,
+    ) -> None:
+        self.default_state = default_state
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_factory = error_factory or (lambda: ConnectionError("Injected failure"))
+        self.calls: list[str] = []
+        self._addresses: dict[str, _Rule] = {}
+        self._domains: dict[str, _Rule] = {}
+        self._patterns: list[tuple[re.Pattern[str], _Rule]] = []
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @property
+    def email(self) -> FakeTruelist:
+        """Mirror ``Truelist.email`` so ``client.email.validate()`` works."""
+        return self
+
+    def add_rule(
+        self,
+        *,
+        address: str | None = None,
+        domain: str | None = None,
+        pattern: str | re.Pattern[str] | None = None,
+        state: str = "email_invalid",
+        sub_state: str | None = None,
+        suggestion: str | None = None,
+        error: Exception | None = None,
+        latency: float | None = None,
+    ) -> None:
+        """Add a rule matching exactly one of ``address``, ``domain`` or ``pattern``.
+
+        Args:
+            address: Exact email address (case-insensitive).
+            domain: Domain of the address (case-insensitive).
+            pattern: Regular expression searched in the lowercased address.
+            state: State to return (default: "email_invalid").
+            sub_state: Sub-state to return (default: a typical one for ``state``).
+            suggestion: Suggestion to return.
+            error: Exception to raise instead of returning a result.
+            latency: Simulated seconds for this rule, overriding ``latency``.
+
+        Raises:
+            ValueError: If not exactly one matcher is given.
+        """
+        if sum(matcher is not None for matcher in (address, domain, pattern)) != 1:
+            raise ValueError("Pass exactly one of address, domain or pattern.")
+        rule = _Rule(
+            state=state,
+            sub_state=sub_state or _DEFAULT_SUB_STATES.get(state, state),
+            suggestion=suggestion,
+            error=error,
+            latency=latency,
+        )
+        if address is not None:
+            self._addresses[_normalize(address)] = rule
+        elif domain is not None:
+            self._domains[_normalize(domain)] = rule
+        elif pattern is not None:
+            self._patterns.append((re.compile(pattern), rule))
+
+    def _match(self, email: str) -> _Rule | None:
+        rule = self._addresses.get(email)
+        if rule is None:
+            rule = self._domains.get(email.rpartition("@")[2])
+        if rule is None:
+            for pattern, candidate in self._patterns:
+                if pattern.search(email):
+                    return candidate
+        return rule
+
+    def _sleep(self, latency: float | tuple[float, float]) -> None:
+        if isinstance(latency, tuple):
+            with self._lock:
+                latency = self._random.uniform(*latency)
+        if latency > 0:
+            time.sleep(latency)
+
+    def validate(self, email: str) -> ValidationResult:
+        """Return the fake result for ``email``, recording the call."""
+        self.calls.append(email)
+        normalized = _normalize(email)
+        rule = self._match(normalized)
+        self._sleep(rule.latency if rule is not None and rule.latency is not None else self.latency)
+
+        if self.error_rate:
+            with self._lock:
+                injected = self._random.random() < self.error_rate
+            if injected:
+                raise self.error_factory()
+        if rule is not None and rule.error is not None:
+            raise rule.error
+
+        state = rule.state if rule is not None else self.default_state
+        return ValidationResult(
+            email=email,
+            domain=normalized.rpartition("@")[2],
+            canonical=normalized.rpartition("@")[0] or None,
+            mx_record=None,
+            first_name=None,
+            last_name=None,
+            state=state,
+            sub_state=rule.sub_state if rule is not None else _DEFAULT_SUB_STATES.get(state, state),
+            verified_at=None,
+            suggestion=rule.suggestion if rule is not None else None,
+        )
+
+    def close(self) -> None:
+        """No-op, for parity with ``Truelist.close()``."""
+
+    def reset(self) -> None:
+        """Forget all rules and recorded calls."""
+        self._addresses.clear()
+        self._domains.clear()
+        self._patterns.clear()
+        self.calls.clear()
+
+    def assert_called_with(self, email: str) -> None:
+        """Assert that ``email`` was validated at least once (case-insensitive)."""
+        normalized = _normalize(email)
+        if not any(_normalize(call) == normalized for call in self.calls):
+            raise AssertionError(f"{email!r} was not validated. Calls: {self.calls!r}")
+
+    def assert_not_called(self) -> None:
+        """Assert that no validation was made."""
+        if self.calls:
+            raise AssertionError(f"Expected no validations. Calls: {self.calls!r}")
+
+    def assert_call_count(self, count: int) -> None:
+        """Assert the exact number of validations made."""
+        if len(self.calls) != count:
+            raise AssertionError(
+                f"Expected {count} validations, got {len(self.calls)}. Calls: {self.calls!r}"
+            )
+
+
+_active = FakeTruelist()
+
+
+def install(fake: FakeTruelist) -> FakeTruelist:
+    """Make ``fake`` the instance returned by :func:`backend`.
+
+    Returns:
+        The previously installed fake.
+    """
+    global _active
+    previous, _active = _active, fake
+    return previous
+
+
+def get_fake() -> FakeTruelist:
+    """Return the currently installed fake."""
+    return _active
+
+
+def backend(api_key: str, **kwargs: Any) -> FakeTruelist:
+    """``TRUELIST_BACKEND`` factory returning the installed :class:`FakeTruelist`.
+
+    Every client shares the installed fake, so calls made through short-lived
+    ``CachedTruelistClient`` instances are all recorded in one place.
+    """
+    return _active
+
+
+try:
+    import pytest
+except ImportError:  # pragma: no cover
+    pass
+else:
+
+    @pytest.fixture
+    def truelist_fake() -> Iterator[FakeTruelist]:
+        """Route all Truelist validation through a fresh :class:`FakeTruelist`."""
+        from django.test import override_settings
+
+        fake = FakeTruelist()
+        previous = install(fake)
+        try:
+            with override_settings(TRUELIST_BACKEND="truelist_django.testing.backend"):
+                yield fake
+        finally:
+            install(previous)
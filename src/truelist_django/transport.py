@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import os
+import socket
+import threading
+import time
+from collections.abc import Iterable
+from typing import Any
+
+import httpcore
+import httpx
+from django.utils.module_loading import import_string
+from truelist import Truelist
+
+from truelist_django.settings import get_setting
+
+_DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=5.0
+)
+
+
+class CachingResolverBackend(httpcore.NetworkBackend):
+    """httpcore network backend that caches DNS lookups for ``ttl`` seconds.
+
+    Connections are opened to the cached IP addresses in order; TLS still
+    verifies against the original hostname. A host whose cached addresses all
+    fail to connect is evicted so the next attempt resolves again.
+    """
+
+    def __init__(self, ttl: float, backend: httpcore.NetworkBackend | None = None) -> None:
+        self.ttl = ttl
+        self._backend = backend if backend is not None else httpcore.SyncBackend()
+        self._addresses: dict[tuple[str, int], tuple[float, list[str]]] = {}
+        self._lock = threading.Lock()
+
+    def _resolve(self, host: str, port: int) -> list[str]:
+        now = time.monotonic()
+        cached = self._addresses.get((host, port))
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        addresses = list(dict.fromkeys(str(info[4][0]) for info in infos))
+        with self._lock:
+            self._addresses[(host, port)] = (now + self.ttl, addresses)
+        return addresses
+
+    def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: Iterable[Any] | None = None,
+    ) -> httpcore.NetworkStream:
+        try:
+            addresses = self._resolve(host, port)
+        except OSError as exc:
+            raise httpcore.ConnectError(str(exc)) from exc
+        last_exc: Exception | None = None
+        for address in addresses:
+            try:
+                return self._backend.connect_tcp(
+                    address,
+                    port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=socket_options,
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as exc:
+                last_exc = exc
+        with self._lock:
+            self._addresses.pop((host, port), None)
+        if last_exc is not None:
+            raise last_exc
+        raise httpcore.ConnectError(f"No addresses found for {host}")
+
+    def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: Iterable[Any] | None = None,
+    ) -> httpcore.NetworkStream:
+        return self._backend.connect_unix_socket(
+            path, timeout=timeout, socket_options=socket_options
+        )
+
+    def sleep(self, seconds: float) -> None:
+        self._backend.sleep(seconds)
+
+
+def build_transport(
+    *,
+    max_connections: int | None = 100,
+    max_keepalive_connections: int | None = 20,
+    keepalive_expiry: float | None = 5.0,
+    http2: bool = False,
+    proxy: str | None = None,
+    dns_cache_ttl: float = 0,
+) -> httpx.HTTPTransport:
+    """Build an httpx transport with tuned connection limits.
+
+    Args:
+        max_connections: Upper bound on open connections.
+        max_keepalive_connections: Idle connections kept for reuse.
+        keepalive_expiry: Seconds an idle connection is kept open.
+        http2: Negotiate HTTP/2, multiplexing concurrent requests over one
+            connection. Requires the ``h2`` package.
+        proxy: Proxy URL, e.g. "http://proxy.internal:3128".
+        dns_cache_ttl: Seconds to cache DNS lookups. 0 disables caching.
+
+    Returns:
+        The configured transport.
+    """
+    try:
+        transport = httpx.HTTPTransport(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            proxy=proxy,
+        )
+    except ImportError:
+        raise ImportError(
+            "The h2 package is required for TRUELIST_HTTP2. "
+            'Install it with: pip install "truelist-django[http2]"'
+        ) from None
+    if dns_cache_ttl and proxy is None:
+        # httpx exposes no hook for the network backend, so install it on the pool
+        # before any connection is made.
+        transport._pool._network_backend = CachingResolverBackend(dns_cache_ttl)
+    return transport
+
+
+class _SharedTransport(httpx.BaseTransport):
+    """Process-wide transport whose connection pool outlives individual clients."""
+
+    def __init__(self, transport: httpx.BaseTransport) -> None:
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        # Clients are short-lived (one per validation); keep the pool alive.
+        pass
+
+
+_shared_transports: dict[tuple[Any, ...], _SharedTransport] = {}
+_shared_lock = threading.Lock()
+
+
+def _settings_config() -> tuple[Any, ...]:
+    return (
+        get_setting("TRUELIST_HTTP_TRANSPORT"),
+        get_setting("TRUELIST_HTTP_MAX_CONNECTIONS"),
+        get_setting("TRUELIST_HTTP_MAX_KEEPALIVE"),
+        get_setting("TRUELIST_HTTP_KEEPALIVE_EXPIRY"),
+        get_setting("TRUELIST_HTTP2"),
+        get_setting("TRUELIST_HTTP_PROXY"),
+        get_setting("TRUELIST_DNS_CACHE_TTL"),
+    )
+
+
+_DEFAULT_CONFIG = (
+    None,
+    _DEFAULT_LIMITS.max_connections,
+    _DEFAULT_LIMITS.max_keepalive_connections,
+    _DEFAULT_LIMITS.keepalive_expiry,
+    False,
+    None,
+    0,
+)
+
+
+def get_shared_transport() -> httpx.BaseTransport | None:
+    """Return the process-wide transport configured by ``TRUELIST_HTTP_*`` settings.
+
+    Returns None when every transport setting is at its default, in which case the
+    Truelist SDK's own HTTP client is used unchanged. Transports are keyed by
+    process ID so that a pool created before ``fork()`` is never reused by a child.
+    """
+    config = _settings_config()
+    if config == _DEFAULT_CONFIG:
+        return None
+    key = (os.getpid(), *config)
+    transport = _shared_transports.get(key)
+    if transport is None:
+        with _shared_lock:
+            transport = _shared_transports.get(key)
+            if transport is None:
+                factory, max_conn, max_keepalive, expiry, http2, proxy, dns_ttl = config
+                if factory is not None:
+                    if isinstance(factory, str):
+                        factory = import_string(factory)
+                    inner = factory()
+                else:
+                    inner = build_transport(
+                        max_connections=max_conn,
+                        max_keepalive_connections=max_keepalive,
+                        keepalive_expiry=expiry,
+                        http2=http2,
+                        proxy=proxy,
+                        dns_cache_ttl=dns_ttl,
+                    )
+                transport = _SharedTransport(inner)
+                _shared_transports[key] = transport
+    return transport
+
+
+def attach_transport(client: Truelist, transport: httpx.BaseTransport) -> None:
+    """Route a Truelist SDK client's requests through ``transport``.
+
+    The SDK builds its own httpx.Client and has no transport hook, so this swaps in
+    an equivalent client. Call it before the client's first request.
+
+    Args:
+        client: A freshly created Truelist client.
+        transport: The httpx transport to send requests through.
+    """
+    sdk_client: httpx.Client = client._client
+    client._client = httpx.Client(
+        base_url=sdk_client.base_url,
+        headers=sdk_client.headers,
+        timeout=sdk_client.timeout,
+        transport=transport,
+    )
+    sdk_client.close()
+
+
+_shared_clients: dict[tuple[Any, ...], Truelist] = {}
+
+
+def get_shared_client(api_key: str, *, base_url: str, timeout: float) -> Truelist | None:
+    """Return the process-wide SDK client that sends requests through the shared transport.
+
+    Creating a ``Truelist`` client loads an SSL context, which costs more than a
+    request over a warm connection, so clients configured by settings reuse one
+    per API key, base URL and timeout. The returned client must not be closed.
+
+    Returns:
+        None if no transport is configured by ``TRUELIST_HTTP_*`` settings.
+    """
+    transport = get_shared_transport()
+    if transport is None:
+        return None
+    key = (os.getpid(), *_settings_config(), api_key, base_url, timeout)
+    client = _shared_clients.get(key)
+    if client is None:
+        with _shared_lock:
+            client = _shared_clients.get(key)
+            if client is None:
+                client = Truelist(api_key, base_url=base_url, timeout=timeout)
+                attach_transport(client, transport)
+                _shared_clients[key] = client
+    return client
@@ -0,0 +1,388 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable
+
+from truelist import ValidationResult
+
+from truelist_django.settings import get_setting
+
+TYPO_DOMAIN = "typo_domain"
+
+# Mailbox providers that account for most consumer signups. Order matters: when
+# two domains are equally close to a typo, the earlier one is suggested.
+POPULAR_DOMAINS = (
+    "gmail.com",
+    "yahoo.com",
+    "hotmail.com",
+    "outlook.com",
+    "icloud.com",
+    "aol.com",
+    "live.com",
+    "msn.com",
+    "me.com",
+    "mac.com",
+    "googlemail.com",
+    "protonmail.com",
+    "proton.me",
+    "gmx.com",
+    "gmx.de",
+    "gmx.net",
+    "mail.com",
+    "zoho.com",
+    "yandex.com",
+    "yandex.ru",
+    "mail.ru",
+    "comcast.net",
+    "verizon.net",
+    "att.net",
+    "sbcglobal.net",
+    "bellsouth.net",
+    "cox.net",
+    "charter.net",
+    "earthlink.net",
+    "yahoo.co.uk",
+    "yahoo.co.in",
+    "yahoo.fr",
+    "yahoo.de",
+    "hotmail.co.uk",
+    "hotmail.fr",
+    "hotmail.de",
+    "hotmail.it",
+    "outlook.fr",
+    "outlook.de",
+    "live.co.uk",
+    "live.fr",
+    "btinternet.com",
+    "sky.com",
+    "orange.fr",
+    "free.fr",
+    "laposte.net",
+    "web.de",
+    "t-online.de",
+    "libero.it",
+    "qq.com",
+    "163.com",
+    "126.com",
+    "naver.com",
+    "rediffmail.com",
+    "shaw.ca",
+    "rogers.com",
+    "bigpond.com",
+    "optusnet.com.au",
+    "fastmail.com",
+)
+
+# Real mailbox providers within a few edits of a popular domain. They are added
+# to the index as known domains, so they are never flagged as typos.
+LEGITIMATE_NEIGHBOURS = (
+    "ymail.com",
+    "email.com",
+    "foxmail.com",
+    "rocketmail.com",
+    "fastmail.fm",
+    "hanmail.net",
+)
+
+# Public suffixes that mailbox providers register under. A domain that only
+# differs from a popular one in its suffix (e.g. "hotmail.nl" vs "hotmail.fr") is
+# a regional variant if its suffix is listed here. Country codes that are mostly
+# seen as typos of "com" ("co", "cm", "om") are deliberately left out.
+_PLAUSIBLE_SUFFIXES = frozenset(
+    {
+        # Generic
+        "com",
+        "net",
+        "org",
+        "edu",
+        "gov",
+        "info",
+        "biz",
+        "me",
+        "io",
+        # Country codes
+        "ar",
+        "at",
+        "au",
+        "be",
+        "bg",
+        "br",
+        "ca",
+        "ch",
+        "cl",
+        "cn",
+        "cz",
+        "de",
+        "dk",
+        "ee",
+        "es",
+        "eu",
+        "fi",
+        "fr",
+        "gr",
+        "hk",
+        "hr",
+        "hu",
+        "id",
+        "ie",
+        "il",
+        "in",
+        "is",
+        "it",
+        "jp",
+        "kr",
+        "lt",
+        "lu",
+        "lv",
+        "mx",
+        "my",
+        "nl",
+        "no",
+        "nz",
+        "pe",
+        "ph",
+        "pk",
+        "pl",
+        "pt",
+        "ro",
+        "rs",
+        "ru",
+        "se",
+        "sg",
+        "si",
+        "sk",
+        "th",
+        "tr",
+        "tw",
+        "ua",
+        "uk",
+        "us",
+        "vn",
+        "za",
+        # Second-level
+        "co.id",
+        "co.il",
+        "co.in",
+        "co.jp",
+        "co.kr",
+        "co.nz",
+        "co.th",
+        "co.uk",
+        "co.za",
+        "com.ar",
+        "com.au",
+        "com.br",
+        "com.cn",
+        "com.hk",
+        "com.mx",
+        "com.my",
+        "com.sg",
+        "com.tr",
+        "com.tw",
+        "ne.jp",
+        "net.au",
+        "or.jp",
+        "org.uk",
+    }
+)
+# Domains shorter than this only match popular domains one edit away, so short
+# legitimate domains (e.g. "aim.com" vs "aol.com") are not flagged.
+_SHORT_DOMAIN = 10
+# A misspelt name is only rejected if it has at least this many characters and is
+# no shorter than the popular name. Shorter names, such as "aon.com" next to
+# "aol.com", are too often real domains of their own.
+_MIN_TYPO_NAME = 5
+# Unknown domains remembered per index, so repeat lookups skip the search.
+_MEMO_SIZE = 4096
+
+
+def _deletions(value: str, depth: int) -> set[str]:
+    """Return ``value`` and every string made by deleting up to ``depth`` characters."""
+    variants = {value}
+    frontier = variants
+    for _ in range(depth):
+        frontier = {
+            current[:index] + current[index + 1 :]
+            for current in frontier
+            for index in range(len(current))
+        }
+        variants |= frontier
+    return variants
+
+
+def _split_suffix(domain: str) -> tuple[str, str]:
+    """Split ``domain`` into its name and public suffix.
+
+    Two-label suffixes such as ``co.uk`` are recognised when they are in the list
+    of plausible suffixes; otherwise the suffix is the last label.
+    """
+    labels = domain.split(".")
+    if len(labels) > 2 and ".".join(labels[-2:]) in _PLAUSIBLE_SUFFIXES:
+        return ".".join(labels[:-2]), ".".join(labels[-2:])
+    name, _, suffix = domain.rpartition(".")
+    return name, suffix
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Damerau-Levenshtein distance (optimal string alignment) between two strings."""
+    width = len(b) + 1
+    before: list[int] = []
+    previous = list(range(width))
+    for i, char in enumerate(a, 1):
+        row = [i] * width
+        for j in range(1, width):
+            other = b[j - 1]
+            if char == other:
+                row[j] = previous[j - 1]
+            else:
+                row[j] = 1 + min(previous[j], row[j - 1], previous[j - 1])
+                if i > 1 and j > 1 and char == b[j - 2] and a[i - 2] == other:
+                    row[j] = min(row[j], before[j - 2] + 1)
+        before, previous = previous, row
+    return previous[-1]
+
+
+class TypoIndex:
+    """Finds the popular domain a mistyped domain was most likely meant to be.
+
+    The index stores every string reachable from each known domain by deleting up
+    to ``max_distance`` characters. A lookup generates the same deletions of the
+    queried domain, so candidates come from a handful of dictionary probes rather
+    than a scan, and only those candidates are checked with the edit distance.
+    Known domains are answered with one dictionary lookup, and the answers for
+    recently seen unknown domains are remembered.
+
+    Usage::
+
+        index = TypoIndex(["gmail.com", "yahoo.com"])
+        index.suggest("gmial.com")  # "gmail.com"
+        index.suggest("gmail.com")  # None
+        index.is_typo("gmial.com")  # True
+
+    Args:
+        domains: Known domains, most popular first.
+        max_distance: Maximum edits (insertions, deletions, substitutions or
+            transpositions) between a typo and its suggestion (default: 2).
+    """
+
+    def __init__(self, domains: Iterable[str], *, max_distance: int = 2) -> None:
+        self.max_distance = max_distance
+        self._ranks: dict[str, int] = {}
+        self._deletions: dict[str, list[str]] = {}
+        self._memo: dict[str, str | None] = {}
+        for domain in domains:
+            domain = domain.lower().strip()
+            if not domain or domain in self._ranks:
+                continue
+            self._ranks[domain] = len(self._ranks)
+            for variant in _deletions(domain, max_distance):
+                self._deletions.setdefault(variant, []).append(domain)
+
+    def __contains__(self, domain: str) -> bool:
+        return domain.lower().strip() in self._ranks
+
+    def suggest(self, domain: str) -> str | None:
+        """Return the closest known domain to ``domain``.
+
+        Returns:
+            None if ``domain`` is itself known or nothing is close enough.
+        """
+        domain = domain.lower().strip()
+        if not domain or domain in self._ranks:
+            return None
+        try:
+            return self._memo[domain]
+        except KeyError:
+            pass
+        suggestion = self._search(domain)
+        if len(self._memo) >= _MEMO_SIZE:
+            self._memo.clear()
+        self._memo[domain] = suggestion
+        return suggestion
+
+    def is_typo(self, domain: str) -> bool:
+        """Return whether ``domain`` looks like a mistyped popular domain.
+
+        Being close to a popular domain is not enough:
+
+        - A domain that only differs from its suggestion in a plausible public
+          suffix, such as ``hotmail.nl`` for ``hotmail.fr``, is a regional
+          variant. A suffix like ``con`` or ``cm`` still counts as a typo.
+        - A misspelt name counts only if it has at least 5 characters and is no
+          shorter than the suggested name, so ``gmial.com`` is a typo but
+          ``aon.com`` (for ``aol.com``) and ``gmai.com`` are not.
+        """
+        suggestion = self.suggest(domain)
+        if suggestion is None:
+            return False
+        name, suffix = _split_suffix(domain.lower().strip())
+        target = _split_suffix(suggestion)[0]
+        if name == target:
+            return suffix not in _PLAUSIBLE_SUFFIXES
+        return len(name) >= max(len(target), _MIN_TYPO_NAME)
+
+    def _search(self, domain: str) -> str | None:
+        limit = self.max_distance if len(domain) >= _SHORT_DOMAIN else min(self.max_distance, 1)
+        best: tuple[int, int] | None = None
+        suggestion = None
+        checked: set[str] = set()
+        for variant in _deletions(domain, limit):
+            for candidate in self._deletions.get(variant, ()):
+                if candidate in checked or abs(len(candidate) - len(domain)) > limit:
+                    continue
+                checked.add(candidate)
+                distance = edit_distance(domain, candidate)
+                if distance > limit:
+                    continue
+                score = (distance, self._ranks[candidate])
+                if best is None or score < best:
+                    best, suggestion = score, candidate
+        return suggestion
+
+
+_indexes: dict[tuple[tuple[str, ...], int], TypoIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_typo_index() -> TypoIndex:
+    """Return the process-wide index of known domains, including settings extras."""
+    extra = tuple(get_setting("TRUELIST_TYPO_EXTRA_DOMAINS"))
+    key = (extra, get_setting("TRUELIST_TYPO_MAX_DISTANCE"))
+    index = _indexes.get(key)
+    if index is None:
+        with _indexes_lock:
+            index = _indexes.get(key)
+            if index is None:
+                index = TypoIndex(
+                    POPULAR_DOMAINS + LEGITIMATE_NEIGHBOURS + extra, max_distance=key[1]
+                )
+                _indexes[key] = index
+    return index
+
+
+def typo_result(email: str) -> ValidationResult | None:
+    """Return an ``email_invalid`` result if the domain of ``email`` looks like a typo.
+
+    The result's ``suggestion`` is the address with the domain corrected. Returns
+    None for domains that are known, not close to one, or regional variants of
+    one (see :meth:`TypoIndex.is_typo`).
+    """
+    local, _, domain = email.strip().rpartition("@")
+    if not local:
+        return None
+    index = get_typo_index()
+    if not index.is_typo(domain):
+        return None
+    suggestion = index.suggest(domain)
+    return ValidationResult(
+        email=email,
+        domain=domain.lower(),
+        canonical=None,
+        mx_record=None,
+        first_name=None,
+        last_name=None,
+        state="email_invalid",
+        sub_state=TYPO_DOMAIN,
+        verified_at=None,
+        suggestion=f"{local}@{suggestion}",
+    )
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from django.urls import path
+
+from truelist_django.views import TruelistValidateView
+
+app_name = "truelist"
+
+urlpatterns = [
+    path("validate/", TruelistValidateView.as_view(), name="validate"),
+]
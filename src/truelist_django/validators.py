@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
 from typing import Any
 
 from django.core.exceptions import ValidationError
@@ -13,6 +14,14 @@ from truelist_django.settings import get_setting
 logger = logging.getLogger(__name__)
 
 
+def _address_error(value: str, error: ValidationError) -> ValidationError:
+    return ValidationError(
+        "%(email)s: %(error)s",
+        code=error.code,
+        params={"email": value, "error": error.messages[0]},
+    )
+
+
 @deconstructible
 class TruelistEmailValidator:
     """Django validator that checks email deliverability via the Truelist API.
@@ -30,10 +39,15 @@ class TruelistEmailValidator:
         fail_silently: If True, don't raise on API/network errors (default: True).
             Auth errors (401) always raise regardless of this setting.
         message: Custom error message for invalid emails.
+        suggestion_message: Error message used instead of ``message`` when Truelist
+            suggests a correction; ``%(suggestion)s`` is replaced with it.
         code: Error code for the ValidationError (default: "invalid_email").
     """
 
     message = "This email address could not be verified as deliverable."
+    suggestion_message = (
+        "This email address could not be verified as deliverable. Did you mean %(suggestion)s?"
+    )
     code = "invalid_email"
 
     def __init__(
@@ -42,6 +56,7 @@ class TruelistEmailValidator:
         allow_risky: bool | None = None,
         fail_silently: bool = True,
         message: str | None = None,
+        suggestion_message: str | None = None,
         code: str | None = None,
     ) -> None:
         self.allow_risky = (
@@ -50,10 +65,27 @@ class TruelistEmailValidator:
         self.fail_silently = fail_silently
         if message is not None:
             self.message = message
+        if suggestion_message is not None:
+            self.suggestion_message = suggestion_message
         if code is not None:
             self.code = code
 
     def __call__(self, value: Any) -> None:
+        self.validate(value)
+
+    def validate(self, value: Any) -> ValidationResult | None:
+        """Validate a value and return the Truelist result it was judged on.
+
+        Args:
+            value: The email address to validate.
+
+        Returns:
+            The ValidationResult, or None if the API could not be reached and
+            ``fail_silently`` let the value pass.
+
+        Raises:
+            ValidationError: If the email is rejected.
+        """
         client = CachedTruelistClient()
         try:
             result: ValidationResult = client.validate(str(value))
@@ -66,10 +98,82 @@ class TruelistEmailValidator:
                     "Email validation service is temporarily unavailable.",
                     code="service_unavailable",
                 ) from None
-            return
+            return None
         finally:
             client.close()
 
+        self.check_result(result)
+        return result
+
+    def validate_many(
+        self,
+        values: Iterable[str],
+        *,
+        max_workers: int = 10,
+        timeout: float | None = None,
+    ) -> dict[str, ValidationResult | None]:
+        """Validate several addresses at once and report errors per address.
+
+        Cache hits come from one bulk lookup and misses are validated concurrently
+        (see :meth:`CachedTruelistClient.validate_many`).
+
+        Args:
+            values: The email addresses to validate.
+            max_workers: Maximum concurrent API calls.
+            timeout: Seconds to wait for all API calls (default: TRUELIST_TIMEOUT).
+                Addresses not validated in time are treated as API errors.
+
+        Returns:
+            A mapping of each address to its ValidationResult, or to None if the API
+            could not be reached and ``fail_silently`` let it pass.
+
+        Raises:
+            ValidationError: With one "<address>: <reason>" error per rejected address.
+        """
+        client = CachedTruelistClient()
+        try:
+            outcomes = client.validate_many(values, max_workers=max_workers, timeout=timeout)
+        finally:
+            client.close()
+
+        results: dict[str, ValidationResult | None] = {}
+        errors: list[ValidationError] = []
+        for value, outcome in outcomes.items():
+            if isinstance(outcome, AuthenticationError):
+                raise outcome
+            if isinstance(outcome, TruelistError):
+                logger.warning("Truelist API error while validating %s", value, exc_info=outcome)
+                results[value] = None
+                if not self.fail_silently:
+                    errors.append(
+                        _address_error(
+                            value,
+                            ValidationError(
+                                "Email validation service is temporarily unavailable.",
+                                code="service_unavailable",
+                            ),
+                        )
+                    )
+                continue
+            results[value] = outcome
+            try:
+                self.check_result(outcome)
+            except ValidationError as exc:
+                errors.append(_address_error(value, exc))
+
+        if errors:
+            raise ValidationError(errors)
+        return results
+
+    def check_result(self, result: ValidationResult) -> None:
+        """Raise ValidationError if a Truelist result is not acceptable.
+
+        Args:
+            result: The result to judge against ``allow_risky`` and ``fail_silently``.
+
+        Raises:
+            ValidationError: If the email is rejected.
+        """
         if result.is_valid:
             return
 
@@ -84,6 +188,12 @@ class TruelistEmailValidator:
                 code="unknown_email",
             )
 
+        if result.suggestion:
+            raise ValidationError(
+                self.suggestion_message,
+                code=self.code,
+                params={"suggestion": result.suggestion},
+            )
         raise ValidationError(self.message, code=self.code)
 
     def __eq__(self, other: object) -> bool:
@@ -93,5 +203,6 @@ class TruelistEmailValidator:
             self.allow_risky == other.allow_risky
             and self.fail_silently == other.fail_silently
             and self.message == other.message
+            and self.suggestion_message == other.suggestion_message
             and self.code == other.code
         )
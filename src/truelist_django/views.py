@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+import uuid
+from typing import Any
+
+from django.core.cache import caches
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.http import HttpRequest, JsonResponse
+from django.views import View
+from truelist import AuthenticationError, TruelistError, ValidationResult
+
+from truelist_django.cache import CachedTruelistClient
+from truelist_django.settings import get_setting
+
+logger = logging.getLogger(__name__)
+
+_MAX_EMAIL_LENGTH = 254
+_MAX_CLIENT_ID_LENGTH = 64
+_POLL_INTERVAL = 0.05
+
+
+def _hash(value: str) -> str:
+    return hashlib.sha256(value.lower().strip().encode()).hexdigest()
+
+
+def is_plausible_email(email: str) -> bool:
+    """Strict local syntax gate applied before any API call.
+
+    Accepts only addresses that pass Django's email validation, fit in 254
+    characters and have a dotted domain (so ``user@localhost`` is rejected).
+    """
+    if not email or len(email) > _MAX_EMAIL_LENGTH:
+        return False
+    try:
+        validate_email(email)
+    except ValidationError:
+        return False
+    domain = email.rpartition("@")[2]
+    return "." in domain.strip(".")
+
+
+class TruelistValidateView(View):
+    """JSON endpoint for validate-as-you-type forms.
+
+    ``GET ?email=user@example.com`` returns the validation state of an address.
+    Each request goes through, in order:
+
+    1. A per-IP rate limit (``TRUELIST_LIVE_RATE_LIMIT`` requests per minute).
+    2. A strict local syntax gate; malformed input never reaches the API.
+    3. A cache lookup, answered immediately on a hit.
+    4. A per-client debounce (``TRUELIST_LIVE_DEBOUNCE`` seconds): if the same
+       client sent a newer request in the meantime, this one is dropped. Clients
+       are identified by a ``client`` query parameter (a random id the form
+       generates per field) or the session; without either, there is no debounce.
+    5. Coalescing of identical in-flight lookups, so concurrent requests for one
+       address make a single API call.
+
+    Results are always written to the cache, so a form submitted afterwards through
+    ``TruelistEmailValidator`` is a cache hit as long as ``TRUELIST_CACHE_ENABLED``
+    is on.
+
+    Usage::
+
+        from django.urls import include, path
+
+        urlpatterns = [
+            path("truelist/", include("truelist_django.urls")),
+        ]
+
+    Responses carry a ``status`` of ``"checked"`` (with ``state``, ``sub_state``
+    and ``suggestion``), ``"invalid_syntax"``, ``"superseded"``, ``"throttled"``
+    (HTTP 429) or ``"unavailable"`` (HTTP 503).
+    """
+
+    http_method_names = ["get"]
+    debounce: float | None = None
+    rate_limit: int | None = None
+
+    def get_client_ip(self, request: HttpRequest) -> str:
+        """Return the address used for throttling. Override when behind a proxy."""
+        return str(request.META.get("REMOTE_ADDR", ""))
+
+    def get_session_id(self, request: HttpRequest) -> str | None:
+        """Return the identity used for debouncing, or None to skip debouncing.
+
+        Uses the ``client`` query parameter if present, then the session key. The
+        client IP is deliberately not used: users behind one proxy or NAT would
+        supersede each other's lookups.
+        """
+        client_id = request.GET.get("client", "").strip()
+        if client_id and len(client_id) <= _MAX_CLIENT_ID_LENGTH:
+            return f"client:{client_id}"
+        session = getattr(request, "session", None)
+        session_key = getattr(session, "session_key", None)
+        return f"session:{session_key}" if session_key else None
+
+    def _is_throttled(self, cache: Any, request: HttpRequest) -> bool:
+        limit = (
+            self.rate_limit
+            if self.rate_limit is not None
+            else get_setting("TRUELIST_LIVE_RATE_LIMIT")
+        )
+        if not limit:
+            return False
+        window = int(time.time() // 60)
+        key = f"truelist:live:throttle:{_hash(self.get_client_ip(request))[:16]}:{window}"
+        cache.add(key, 0, 60)
+        try:
+            count = cache.incr(key)
+        except ValueError:
+            # The counter expired between add() and incr(); start a new window.
+            cache.set(key, 1, 60)
+            count = 1
+        return bool(count > limit)
+
+    def _is_superseded(self, cache: Any, request: HttpRequest) -> bool:
+        debounce = (
+            self.debounce if self.debounce is not None else get_setting("TRUELIST_LIVE_DEBOUNCE")
+        )
+        session_id = self.get_session_id(request)
+        if not debounce or session_id is None:
+            return False
+        key = f"truelist:live:latest:{_hash(session_id)[:16]}"
+        token = uuid.uuid4().hex
+        cache.set(key, token, 60)
+        time.sleep(debounce)
+        return bool(cache.get(key) != token)
+
+    def _validate_coalesced(
+        self, client: CachedTruelistClient, cache: Any, email: str
+    ) -> ValidationResult:
+        timeout = float(get_setting("TRUELIST_TIMEOUT"))
+        key = f"truelist:live:inflight:{_hash(email)}"
+        if not cache.add(key, 1, timeout):
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline:
+                time.sleep(_POLL_INTERVAL)
+                result = client.get_cached(email)
+                if result is not None:
+                    return result
+                if cache.get(key) is None:
+                    break
+            # The other lookup failed or returned "unknown"; do our own.
+            return client.validate(email)
+        try:
+            return client.validate(email)
+        finally:
+            cache.delete(key)
+
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> JsonResponse:
+        cache = caches[get_setting("TRUELIST_CACHE_ALIAS")]
+        if self._is_throttled(cache, request):
+            return JsonResponse({"status": "throttled"}, status=429)
+
+        email = request.GET.get("email", "").strip()
+        if not is_plausible_email(email):
+            return JsonResponse({"email": email, "status": "invalid_syntax"})
+
+        client = CachedTruelistClient(cache_enabled=True)
+        try:
+            result = client.get_cached(email)
+            if result is None:
+                if self._is_superseded(cache, request):
+                    return JsonResponse({"email": email, "status": "superseded"})
+                result = self._validate_coalesced(client, cache, email)
+        except AuthenticationError:
+            raise
+        except TruelistError:
+            logger.warning("Truelist API error while validating %s", email, exc_info=True)
+            return JsonResponse({"email": email, "status": "unavailable"}, status=503)
+        finally:
+            client.close()
+
+        return JsonResponse(
+            {
+                "email": email,
+                "status": "checked",
+                "state": result.state,
+                "sub_state": result.sub_state,
+                "suggestion": result.suggestion,
+            }
+        )
@@ -1,8 +1,16 @@
 from __future__ import annotations
 
 import pytest
+from django.core.cache import caches
 from truelist import ValidationResult
 
+pytest_plugins = ["truelist_django.testing"]
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache() -> None:
+    caches["default"].clear()
+
 
 @pytest.fixture
 def valid_result() -> ValidationResult:
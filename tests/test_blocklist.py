@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from truelist_django.blocklist import (
+    KNOWN_INVALID_ADDRESS,
+    KNOWN_INVALID_DOMAIN,
+    KnownInvalidIndex,
+    build_blocklist,
+    get_blocklist,
+    known_invalid_result,
+)
+
+
+class TestKnownInvalidIndex:
+    def test_finds_listed_addresses_and_domains(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "blocklist.bin")
+        build_blocklist(
+            path,
+            addresses=["bad@example.com", "Other@Example.org\n", ""],
+            domains=["bad-domain.com"],
+        )
+        index = KnownInvalidIndex(path)
+
+        assert index.lookup("bad@example.com") == KNOWN_INVALID_ADDRESS
+        assert index.lookup("other@example.org") == KNOWN_INVALID_ADDRESS
+        assert index.lookup("anyone@bad-domain.com") == KNOWN_INVALID_DOMAIN
+        assert index.lookup("user@example.com") is None
+
+    def test_missing_file_is_empty(self, tmp_path: Path) -> None:
+        index = KnownInvalidIndex(str(tmp_path / "missing.bin"))
+        assert index.lookup("bad@example.com") is None
+
+    def test_picks_up_rebuilt_file(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "blocklist.bin")
+        build_blocklist(path, addresses=["first@example.com"], domains=[])
+        index = KnownInvalidIndex(path, check_interval=0)
+        assert index.lookup("first@example.com") == KNOWN_INVALID_ADDRESS
+
+        build_blocklist(path, addresses=["second@example.com"], domains=[])
+
+        assert index.lookup("first@example.com") is None
+        assert index.lookup("second@example.com") == KNOWN_INVALID_ADDRESS
+
+    @pytest.mark.parametrize(
+        "content", [b"not a blocklist at all", b"", b"TLBLOCK1" + b"\xff" * 16]
+    )
+    def test_ignores_foreign_file(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture, content: bytes
+    ) -> None:
+        path = tmp_path / "blocklist.bin"
+        path.write_bytes(content)
+        index = KnownInvalidIndex(str(path))
+
+        assert index.lookup("bad@example.com") is None
+        assert "not a complete Truelist blocklist" in caplog.text
+        # The failed load still counts as a check.
+        assert index._next_check > 0
+
+    def test_truncated_file_keeps_previous_index(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        path = tmp_path / "blocklist.bin"
+        build_blocklist(str(path), addresses=["bad@example.com"], domains=["bad.com"])
+        index = KnownInvalidIndex(str(path), check_interval=0)
+        assert index.lookup("bad@example.com") == KNOWN_INVALID_ADDRESS
+
+        content = path.read_bytes()
+        path.unlink()
+        path.write_bytes(content[:-4])
+
+        assert index.lookup("bad@example.com") == KNOWN_INVALID_ADDRESS
+        assert index.lookup("user@bad.com") == KNOWN_INVALID_DOMAIN
+        assert caplog.text.count("not a complete Truelist blocklist") == 1
+        index.lookup("bad@example.com")
+        assert caplog.text.count("not a complete Truelist blocklist") == 1
+
+    def test_build_leaves_no_temporary_files(self, tmp_path: Path) -> None:
+        build_blocklist(str(tmp_path / "blocklist.bin"), addresses=["a@b.com"], domains=[])
+        assert os.listdir(tmp_path) == ["blocklist.bin"]
+
+    def test_get_blocklist_is_shared_per_path(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "blocklist.bin")
+        assert get_blocklist(path) is get_blocklist(path)
+
+    def test_known_invalid_result(self) -> None:
+        result = known_invalid_result("bad@example.com", KNOWN_INVALID_DOMAIN)
+        assert result.is_invalid
+        assert result.domain == "example.com"
+        assert result.sub_state == "known_invalid_domain"
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import threading
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import httpx
+import pytest
 from django.core.cache import caches
 from django.test import override_settings
-from truelist import ValidationResult
+from truelist import ConnectionError, TimeoutError, TruelistError, ValidationResult
 
+from truelist_django.blocklist import build_blocklist
 from truelist_django.cache import CachedTruelistClient, _cache_key
+from truelist_django.dispatch import INTERACTIVE, get_dispatcher
+from truelist_django.testing import FakeTruelist
 
 
 class TestCacheKey:
@@ -26,6 +33,11 @@ class TestCacheKey:
         key2 = _cache_key("other@example.com")
         assert key1 != key2
 
+    def test_namespace_changes_key(self) -> None:
+        key1 = _cache_key("user@example.com", "0.0")
+        key2 = _cache_key("user@example.com", "1.0")
+        assert key1 != key2
+
 
 class TestCachedTruelistClient:
     @override_settings(TRUELIST_CACHE_ENABLED=True)
@@ -132,6 +144,22 @@ class TestCachedTruelistClient:
         assert result2.state == "risky"
         mock_client.email.validate.assert_called_once()
 
+    @patch("truelist_django.cache.Truelist")
+    def test_get_cached_never_calls_api(
+        self, mock_truelist_cls: MagicMock, valid_result: ValidationResult
+    ) -> None:
+        mock_client = mock_truelist_cls.return_value
+        mock_client.email.validate.return_value = valid_result
+        caches["default"].clear()
+
+        client = CachedTruelistClient(cache_enabled=True)
+        assert client.get_cached("user@example.com") is None
+        client.validate("user@example.com")
+
+        assert client.get_cached("User@Example.com") == valid_result
+        assert CachedTruelistClient(cache_enabled=False).get_cached("user@example.com") is None
+        mock_client.email.validate.assert_called_once()
+
     @patch("truelist_django.cache.Truelist")
     def test_close_closes_underlying_client(
         self, mock_truelist_cls: MagicMock, valid_result: ValidationResult
@@ -151,9 +179,222 @@ class TestCachedTruelistClient:
         client.close()
         mock_truelist_cls.return_value.close.assert_not_called()
 
+    @patch("truelist_django.cache.Truelist")
+    def test_blocklisted_address_skips_api(
+        self, mock_truelist_cls: MagicMock, tmp_path: Path
+    ) -> None:
+        path = str(tmp_path / "blocklist.bin")
+        build_blocklist(path, addresses=["bad@example.com"], domains=["bad-domain.com"])
+
+        client = CachedTruelistClient(cache_enabled=False, blocklist_path=path)
+        address_result = client.validate("Bad@Example.com")
+        domain_result = client.validate("user@bad-domain.com")
+
+        assert address_result.is_invalid
+        assert address_result.sub_state == "known_invalid_address"
+        assert domain_result.sub_state == "known_invalid_domain"
+        mock_truelist_cls.return_value.email.validate.assert_not_called()
+
     def test_uses_settings_defaults(self) -> None:
         client = CachedTruelistClient()
         assert client._api_key == "test-api-key"
         assert client._base_url == "https://api.truelist.io"
         assert client._timeout == 10
         assert client._cache_enabled is False
+
+
+class TestStateTtls:
+    @override_settings(TRUELIST_CACHE_STATE_TTLS={"email_invalid": 604800})
+    def test_state_ttl_overrides_default(self, truelist_fake: FakeTruelist) -> None:
+        truelist_fake.add_rule(address="bad@example.com")
+        client = CachedTruelistClient(cache_enabled=True, cache_ttl=60)
+
+        with patch.object(caches["default"], "set") as cache_set:
+            client.validate("bad@example.com")
+            client.validate("good@example.com")
+
+        assert [call.args[2] for call in cache_set.call_args_list] == [604800, 60]
+
+
+class TestCacheInvalidation:
+    @patch("truelist_django.cache.Truelist")
+    def test_invalidate_all(
+        self, mock_truelist_cls: MagicMock, valid_result: ValidationResult
+    ) -> None:
+        mock_client = mock_truelist_cls.return_value
+        mock_client.email.validate.return_value = valid_result
+        caches["default"].clear()
+
+        client = CachedTruelistClient(cache_enabled=True)
+        client.validate("user@example.com")
+        assert client.invalidate_all() == 1
+        client.validate("user@example.com")
+        client.validate("user@example.com")
+
+        assert mock_client.email.validate.call_count == 2
+
+    @patch("truelist_django.cache.Truelist")
+    def test_invalidate_domain_only_affects_that_domain(
+        self, mock_truelist_cls: MagicMock, valid_result: ValidationResult
+    ) -> None:
+        mock_client = mock_truelist_cls.return_value
+        mock_client.email.validate.return_value = valid_result
+        caches["default"].clear()
+
+        client = CachedTruelistClient(cache_enabled=True)
+        client.validate("user@example.com")
+        client.validate("user@other.com")
+        client.invalidate_domain("Example.com")
+        client.validate("user@example.com")
+        client.validate("user@other.com")
+
+        assert mock_client.email.validate.call_count == 3
+        mock_client.email.validate.assert_called_with("user@example.com")
+
+    @patch("truelist_django.cache.Truelist")
+    def test_invalidate_tenant_only_affects_that_tenant(
+        self, mock_truelist_cls: MagicMock, valid_result: ValidationResult
+    ) -> None:
+        mock_client = mock_truelist_cls.return_value
+        mock_client.email.validate.return_value = valid_result
+        caches["default"].clear()
+
+        acme = CachedTruelistClient(cache_enabled=True, tenant="acme")
+        globex = CachedTruelistClient(cache_enabled=True, tenant="globex")
+        acme.validate("user@example.com")
+        globex.validate("user@example.com")
+        assert acme.invalidate_tenant() == 1
+        acme.validate("user@example.com")
+        globex.validate("user@example.com")
+
+        assert mock_client.email.validate.call_count == 3
+
+    def test_invalidate_tenant_without_tenant_raises(self) -> None:
+        client = CachedTruelistClient()
+        with pytest.raises(ValueError, match="No tenant"):
+            client.invalidate_tenant()
+
+    def test_generations_increase(self) -> None:
+        caches["default"].clear()
+        client = CachedTruelistClient()
+        assert client.invalidate_domain("example.com") == 1
+        assert client.invalidate_domain("example.com") == 2
+        assert client.invalidate_domain("other.com") == 1
+
+
+class TestValidateMany:
+    def test_cache_hits_and_misses(self, truelist_fake: FakeTruelist) -> None:
+        caches["default"].clear()
+        client = CachedTruelistClient(cache_enabled=True, tenant="acme")
+        client.validate("cached@example.com")
+        truelist_fake.calls.clear()
+
+        results = client.validate_many(
+            ["new@example.com", "cached@example.com", "new@example.com", "other@test.com"]
+        )
+
+        assert list(results) == ["new@example.com", "cached@example.com", "other@test.com"]
+        assert all(isinstance(result, ValidationResult) for result in results.values())
+        assert sorted(truelist_fake.calls) == ["new@example.com", "other@test.com"]
+        assert client.get_cached("new@example.com") is not None
+
+    def test_keys_match_single_lookups(self, truelist_fake: FakeTruelist) -> None:
+        caches["default"].clear()
+        client = CachedTruelistClient(cache_enabled=True, tenant="acme")
+        client.invalidate_domain("example.com")
+        client.validate_many(["user@example.com"])
+        truelist_fake.calls.clear()
+
+        client.validate("user@example.com")
+
+        truelist_fake.assert_not_called()
+
+    def test_misses_are_validated_concurrently(
+        self, truelist_fake: FakeTruelist, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        emails = [f"user{i}@example.com" for i in range(10)]
+        # Each call waits until all ten are in flight at once.
+        barrier = threading.Barrier(len(emails), timeout=5)
+        validate = truelist_fake.validate
+
+        def validate_together(email: str) -> ValidationResult:
+            barrier.wait()
+            return validate(email)
+
+        monkeypatch.setattr(truelist_fake, "validate", validate_together)
+
+        results = CachedTruelistClient().validate_many(emails, max_workers=10, timeout=10)
+
+        assert all(isinstance(result, ValidationResult) for result in results.values())
+        assert sorted(truelist_fake.calls) == sorted(emails)
+
+    def test_errors_are_returned_per_address(
+        self, truelist_fake: FakeTruelist, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        truelist_fake.add_rule(address="down@example.com", error=ConnectionError("down"))
+        release = threading.Event()
+        validate = truelist_fake.validate
+
+        def validate_or_hang(email: str) -> ValidationResult:
+            if email == "slow@example.com":
+                release.wait(5)
+            return validate(email)
+
+        monkeypatch.setattr(truelist_fake, "validate", validate_or_hang)
+        try:
+            results = CachedTruelistClient().validate_many(
+                ["down@example.com", "slow@example.com", "user@example.com"], timeout=1
+            )
+        finally:
+            release.set()
+
+        assert isinstance(results["down@example.com"], ConnectionError)
+        assert isinstance(results["slow@example.com"], TimeoutError)
+        assert isinstance(results["user@example.com"], ValidationResult)
+
+    def test_requests_time_out_at_the_deadline(self) -> None:
+        timeouts: list[float] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            timeouts.append(request.extensions["timeout"]["read"])
+            return httpx.Response(503)
+
+        client = CachedTruelistClient(timeout=10, transport=httpx.MockTransport(handler))
+        results = client.validate_many(["user@example.com"], timeout=0.5)
+
+        assert isinstance(results["user@example.com"], TruelistError)
+        assert len(timeouts) == 1  # Not retried.
+        assert 0 < timeouts[0] <= 0.5
+
+    @override_settings(TRUELIST_MAX_IN_FLIGHT=1, TRUELIST_INTERACTIVE_RESERVED=0)
+    def test_queued_calls_give_up_at_the_deadline(self, truelist_fake: FakeTruelist) -> None:
+        dispatcher = get_dispatcher()
+        assert dispatcher is not None
+        # Hold the only slot, so both calls queue behind it.
+        dispatcher.acquire(INTERACTIVE)
+        try:
+            results = CachedTruelistClient(timeout=10).validate_many(
+                ["first@example.com", "second@example.com"], timeout=0.1
+            )
+            assert all(isinstance(result, TimeoutError) for result in results.values())
+
+            # Waiters notify the dispatcher as they leave the queue. Without the
+            # deadline they would keep waiting for TRUELIST_TIMEOUT (10s).
+            with dispatcher._condition:
+                assert dispatcher._condition.wait_for(
+                    lambda: dispatcher._stats[INTERACTIVE].waiting == 0, timeout=5
+                )
+        finally:
+            dispatcher.release(INTERACTIVE)
+
+        truelist_fake.assert_not_called()
+        assert dispatcher.stats()[INTERACTIVE]["in_flight"] == 0
+
+    @override_settings(TRUELIST_TYPO_DETECTION=True)
+    def test_local_stages_skip_the_api(self, truelist_fake: FakeTruelist) -> None:
+        results = CachedTruelistClient().validate_many(["user@gmial.com"])
+
+        result = results["user@gmial.com"]
+        assert isinstance(result, ValidationResult)
+        assert result.suggestion == "user@gmail.com"
+        truelist_fake.assert_not_called()
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.core.cache import caches
+from django.core.management import CommandError, call_command
+from django.utils import timezone
+
+from truelist_django.blocklist import KNOWN_INVALID_DOMAIN, KnownInvalidIndex
+from truelist_django.records import ValidationRecord
+from truelist_django.testing import FakeTruelist
+
+
+class TestTruelistInvalidateCommand:
+    def test_invalidates_all_domains_and_tenants(self) -> None:
+        caches["default"].clear()
+        out = StringIO()
+        call_command(
+            "truelist_invalidate",
+            "--all",
+            "--domain",
+            "example.com",
+            "--tenant",
+            "acme",
+            stdout=out,
+        )
+
+        output = out.getvalue()
+        assert "Invalidated all results (generation 1)." in output
+        assert "Invalidated domain example.com (generation 1)." in output
+        assert "Invalidated tenant acme (generation 1)." in output
+
+    def test_requires_a_target(self) -> None:
+        with pytest.raises(CommandError, match="Nothing to invalidate"):
+            call_command("truelist_invalidate")
+
+
+class TestTruelistBuildBlocklistCommand:
+    def test_builds_index_from_files(self, tmp_path: Path) -> None:
+        addresses = tmp_path / "addresses.txt"
+        addresses.write_text("bad@example.com\nworse@example.com\n")
+        domains = tmp_path / "domains.txt"
+        domains.write_text("bad-domain.com\n")
+        output = tmp_path / "blocklist.bin"
+
+        out = StringIO()
+        call_command(
+            "truelist_build_blocklist",
+            "--addresses",
+            str(addresses),
+            "--domains",
+            str(domains),
+            "--output",
+            str(output),
+            stdout=out,
+        )
+
+        assert f"Wrote blocklist to {output}." in out.getvalue()
+        index = KnownInvalidIndex(str(output))
+        assert index.lookup("user@bad-domain.com") == KNOWN_INVALID_DOMAIN
+
+    def test_requires_output(self, tmp_path: Path) -> None:
+        with pytest.raises(CommandError, match="No output path"):
+            call_command("truelist_build_blocklist", "--addresses", str(tmp_path / "a.txt"))
+
+
+@pytest.mark.django_db
+class TestTruelistRefreshCommand:
+    def test_once(self, truelist_fake: FakeTruelist) -> None:
+        now = timezone.now()
+        ValidationRecord.objects.create(
+            email="user@example.com",
+            state="ok",
+            fetched_at=now,
+            refresh_after=now,
+            last_accessed_at=now,
+        )
+        out = StringIO()
+
+        call_command("truelist_refresh", "--once", stdout=out)
+
+        assert "Refreshed 1 addresses." in out.getvalue()
+        truelist_fake.assert_called_with("user@example.com")
+
+
+class TestTruelistSimulateCommand:
+    def test_reports_each_policy(self, tmp_path: Path) -> None:
+        log = tmp_path / "log.csv"
+        log.write_text("timestamp,key,state\n0,a,ok\n60,a,ok\n7200,a,ok\n")
+        out = StringIO()
+
+        call_command(
+            "truelist_simulate",
+            str(log),
+            "--ttl",
+            "3600",
+            "--ttl",
+            "86400",
+            "--state-ttl",
+            "email_invalid=604800",
+            stdout=out,
+        )
+
+        lines = out.getvalue().splitlines()
+        assert lines[0].startswith("ttl=3600 max_entries=unbounded: requests=3 hit_ratio=33.3%")
+        assert "api_calls_saved=1" in lines[0]
+        assert "api_calls_saved=2" in lines[1]
+
+    def test_invalid_state_ttl(self, tmp_path: Path) -> None:
+        with pytest.raises(CommandError, match="STATE=SECONDS"):
+            call_command("truelist_simulate", str(tmp_path / "log.csv"), "--state-ttl", "ok")
+
+    def test_missing_log(self, tmp_path: Path) -> None:
+        with pytest.raises(CommandError):
+            call_command("truelist_simulate", str(tmp_path / "missing.csv"))
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+from django.test import override_settings
+from truelist import TimeoutError
+
+from truelist_django.cache import CachedTruelistClient
+from truelist_django.dispatch import (
+    BACKGROUND,
+    BATCH,
+    INTERACTIVE,
+    Dispatcher,
+    get_dispatcher,
+)
+from truelist_django.testing import FakeTruelist
+from truelist_django.validators import TruelistEmailValidator
+
+
+def _hold(dispatcher: Dispatcher, priority: str, release: threading.Event) -> threading.Thread:
+    acquired = threading.Event()
+
+    def run() -> None:
+        with dispatcher.slot(priority):
+            acquired.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    assert acquired.wait(5)
+    return thread
+
+
+def _wait_for(predicate: object, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():  # type: ignore[operator]
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.005)
+
+
+class TestDispatcher:
+    def test_rejects_invalid_limits(self) -> None:
+        with pytest.raises(ValueError):
+            Dispatcher(max_in_flight=0)
+        with pytest.raises(ValueError):
+            Dispatcher(max_in_flight=2, interactive_reserved=2)
+
+    def test_rejects_unknown_priority(self) -> None:
+        with pytest.raises(ValueError, match="Unknown priority"):
+            Dispatcher(max_in_flight=1).acquire("urgent")
+
+    def test_reserved_slots_are_kept_for_interactive(self) -> None:
+        dispatcher = Dispatcher(max_in_flight=2, interactive_reserved=1)
+        release = threading.Event()
+        holder = _hold(dispatcher, BATCH, release)
+        try:
+            with pytest.raises(TimeoutError):
+                dispatcher.acquire(BATCH, timeout=0.05)
+            with dispatcher.slot(INTERACTIVE, timeout=0.05):
+                assert dispatcher.stats()[INTERACTIVE]["in_flight"] == 1
+        finally:
+            release.set()
+            holder.join()
+
+    def test_waiters_start_in_priority_order(self) -> None:
+        dispatcher = Dispatcher(max_in_flight=1)
+        release = threading.Event()
+        holder = _hold(dispatcher, INTERACTIVE, release)
+        order: list[str] = []
+
+        def run(priority: str) -> None:
+            with dispatcher.slot(priority):
+                order.append(priority)
+
+        threads = []
+        for priority in (BACKGROUND, BATCH, INTERACTIVE):
+            thread = threading.Thread(target=run, args=(priority,))
+            thread.start()
+            threads.append(thread)
+            _wait_for(lambda p=priority: dispatcher.stats()[p]["queue_depth"] == 1)
+
+        release.set()
+        holder.join()
+        for thread in threads:
+            thread.join()
+        assert order == [INTERACTIVE, BATCH, BACKGROUND]
+
+    def test_stats_report_waits(self) -> None:
+        dispatcher = Dispatcher(max_in_flight=1)
+        release = threading.Event()
+        holder = _hold(dispatcher, BATCH, release)
+        timer = threading.Timer(0.05, release.set)
+        timer.start()
+        with dispatcher.slot(BACKGROUND):
+            pass
+        holder.join()
+
+        stats = dispatcher.stats()
+        assert stats[BATCH]["started"] == 1
+        assert stats[BACKGROUND]["started"] == 1
+        assert stats[BACKGROUND]["max_wait"] >= 0.04
+        assert stats[BACKGROUND]["mean_wait"] == stats[BACKGROUND]["max_wait"]
+        assert stats[BACKGROUND]["queue_depth"] == 0
+        assert stats[BACKGROUND]["in_flight"] == 0
+
+
+class TestGetDispatcher:
+    def test_disabled_by_default(self) -> None:
+        assert get_dispatcher() is None
+
+    @override_settings(TRUELIST_MAX_IN_FLIGHT=8, TRUELIST_INTERACTIVE_RESERVED=3)
+    def test_shared_per_configuration(self) -> None:
+        dispatcher = get_dispatcher()
+        assert dispatcher is not None
+        assert dispatcher is get_dispatcher()
+        assert dispatcher.max_in_flight == 8
+        assert dispatcher.interactive_reserved == 3
+
+    @pytest.mark.parametrize("max_in_flight", [1, 2])
+    def test_reserved_is_clamped_below_the_limit(
+        self, max_in_flight: int, truelist_fake: FakeTruelist
+    ) -> None:
+        with override_settings(TRUELIST_MAX_IN_FLIGHT=max_in_flight):
+            TruelistEmailValidator()("user@example.com")
+
+            dispatcher = get_dispatcher()
+            assert dispatcher is not None
+            assert dispatcher.interactive_reserved == max_in_flight - 1
+
+
+class TestClientPriority:
+    def test_rejects_unknown_priority(self) -> None:
+        with pytest.raises(ValueError, match="Unknown priority"):
+            CachedTruelistClient(priority="urgent")
+
+    @override_settings(TRUELIST_MAX_IN_FLIGHT=4, TRUELIST_INTERACTIVE_RESERVED=1)
+    def test_api_calls_go_through_dispatcher(self, truelist_fake: FakeTruelist) -> None:
+        dispatcher = get_dispatcher()
+        assert dispatcher is not None
+        before = dispatcher.stats()[BATCH]["started"]
+
+        CachedTruelistClient(priority=BATCH).validate("user@example.com")
+
+        assert dispatcher.stats()[BATCH]["started"] == before + 1
+        assert dispatcher.stats()[BATCH]["in_flight"] == 0
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import dataclasses
 from unittest.mock import MagicMock, patch
 
 import pytest
 from rest_framework import serializers
 from truelist import AuthenticationError, ConnectionError, ValidationResult
 
-from truelist_django.fields import TruelistEmailField
+from truelist_django.fields import TruelistEmailField, TruelistMultiEmailField
+from truelist_django.testing import FakeTruelist
 
 
 class SimpleSerializer(serializers.Serializer):  # type: ignore[type-arg]
@@ -46,6 +48,18 @@ class TestTruelistEmailField:
         assert not s.is_valid()
         assert "email" in s.errors
 
+    @patch("truelist_django.fields.CachedTruelistClient")
+    def test_invalid_email_error_includes_suggestion(
+        self, mock_client_cls: MagicMock, invalid_result: ValidationResult
+    ) -> None:
+        mock_client_cls.return_value.validate.return_value = dataclasses.replace(
+            invalid_result, suggestion="bad@gmail.com"
+        )
+
+        s = SimpleSerializer(data={"email": "bad@gmial.com"})
+        assert not s.is_valid()
+        assert "Did you mean bad@gmail.com?" in str(s.errors["email"][0])
+
     @patch("truelist_django.fields.CachedTruelistClient")
     def test_risky_email_passes_by_default(
         self, mock_client_cls: MagicMock, risky_result: ValidationResult
@@ -118,3 +132,50 @@ class TestTruelistEmailField:
         s = SimpleSerializer(data={"email": "not-an-email"})
         assert not s.is_valid()
         assert "email" in s.errors
+
+
+class InviteSerializer(serializers.Serializer):  # type: ignore[type-arg]
+    emails = TruelistMultiEmailField(max_emails=3)
+
+
+class TestTruelistMultiEmailField:
+    def test_accepts_list(self, truelist_fake: FakeTruelist) -> None:
+        s = InviteSerializer(data={"emails": ["a@example.com", "A@example.com", "b@example.com"]})
+        assert s.is_valid(), s.errors
+        assert s.validated_data["emails"] == ["a@example.com", "b@example.com"]
+        truelist_fake.assert_call_count(2)
+
+    def test_accepts_string(self, truelist_fake: FakeTruelist) -> None:
+        s = InviteSerializer(data={"emails": "a@example.com, b@example.com"})
+        assert s.is_valid(), s.errors
+        assert s.validated_data["emails"] == ["a@example.com", "b@example.com"]
+
+    def test_reports_each_rejected_address(self, truelist_fake: FakeTruelist) -> None:
+        truelist_fake.add_rule(address="bad@example.com")
+
+        s = InviteSerializer(data={"emails": ["ok@example.com", "bad@example.com", "nope"]})
+        assert not s.is_valid()
+        assert s.errors["emails"] == ["nope: Enter a valid email address."]
+        truelist_fake.assert_not_called()
+
+        s = InviteSerializer(data={"emails": ["ok@example.com", "bad@example.com"]})
+        assert not s.is_valid()
+        assert s.errors["emails"] == [
+            "bad@example.com: This email address could not be verified as deliverable."
+        ]
+
+    @pytest.mark.parametrize(
+        ("data", "message"),
+        [
+            ({"emails": 5}, "Expected a list"),
+            ({"emails": []}, "may not be empty"),
+            ({"emails": "a@x.com b@x.com c@x.com d@x.com"}, "at most 3"),
+        ],
+    )
+    def test_rejects_bad_input(
+        self, truelist_fake: FakeTruelist, data: dict[str, object], message: str
+    ) -> None:
+        s = InviteSerializer(data=data)
+        assert not s.is_valid()
+        assert message in str(s.errors["emails"][0])
+        truelist_fake.assert_not_called()
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import pytest
+from django import forms
+from truelist import AuthenticationError
+
+from truelist_django.forms import TruelistMultiEmailField, parse_email_list
+from truelist_django.testing import FakeTruelist
+
+
+class InviteForm(forms.Form):
+    emails = TruelistMultiEmailField(max_emails=3)
+
+
+class OptionalInviteForm(forms.Form):
+    emails = TruelistMultiEmailField(required=False)
+
+
+class TestParseEmailList:
+    def test_splits_and_dedupes(self) -> None:
+        value = "a@example.com, b@example.com;\nA@Example.com  c@example.com,,"
+        assert parse_email_list(value) == ["a@example.com", "b@example.com", "c@example.com"]
+
+    def test_accepts_iterable(self) -> None:
+        assert parse_email_list([" a@example.com ", "", "a@example.com"]) == ["a@example.com"]
+
+
+class TestTruelistMultiEmailField:
+    def test_valid_addresses(self, truelist_fake: FakeTruelist) -> None:
+        form = InviteForm(data={"emails": "a@example.com, b@example.com, a@example.com"})
+
+        assert form.is_valid(), form.errors
+        assert form.cleaned_data["emails"] == ["a@example.com", "b@example.com"]
+        truelist_fake.assert_call_count(2)
+
+    def test_reports_each_rejected_address(self, truelist_fake: FakeTruelist) -> None:
+        truelist_fake.add_rule(address="bad@example.com")
+        truelist_fake.add_rule(address="worse@example.com")
+
+        form = InviteForm(data={"emails": "ok@example.com bad@example.com worse@example.com"})
+
+        assert not form.is_valid()
+        assert form.errors["emails"] == [
+            "bad@example.com: This email address could not be verified as deliverable.",
+            "worse@example.com: This email address could not be verified as deliverable.",
+        ]
+
+    def test_syntax_errors_skip_the_api(self, truelist_fake: FakeTruelist) -> None:
+        form = InviteForm(data={"emails": "ok@example.com, not-an-email"})
+
+        assert not form.is_valid()
+        assert form.errors["emails"] == ["not-an-email: Enter a valid email address."]
+        truelist_fake.assert_not_called()
+
+    def test_max_emails(self, truelist_fake: FakeTruelist) -> None:
+        form = InviteForm(data={"emails": "a@x.com b@x.com c@x.com d@x.com"})
+
+        assert not form.is_valid()
+        assert form.errors["emails"] == ["Enter at most 3 email addresses (you entered 4)."]
+        truelist_fake.assert_not_called()
+
+    def test_required(self, truelist_fake: FakeTruelist) -> None:
+        assert not InviteForm(data={"emails": " , "}).is_valid()
+        form = OptionalInviteForm(data={"emails": ""})
+        assert form.is_valid()
+        assert form.cleaned_data["emails"] == []
+
+    def test_auth_error_raises(self, truelist_fake: FakeTruelist) -> None:
+        truelist_fake.add_rule(address="a@example.com", error=AuthenticationError("bad key"))
+
+        with pytest.raises(AuthenticationError):
+            InviteForm(data={"emails": "a@example.com"}).is_valid()
+
+    def test_initial_list_is_rendered_as_text(self) -> None:
+        form = InviteForm(initial={"emails": ["a@example.com", "b@example.com"]})
+
+        assert "a@example.com, b@example.com" in str(form["emails"])
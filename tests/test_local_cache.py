@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import multiprocessing
+from pathlib import Path
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.test import override_settings
+from truelist import ValidationResult
+
+from truelist_django.cache import CachedTruelistClient
+from truelist_django.local_cache import SharedMemoryCache, get_local_cache
+from truelist_django.testing import FakeTruelist
+
+
+def _write_from_child(path: str, result: ValidationResult) -> None:
+    SharedMemoryCache(path, slots=64).set("child-key", result, 60)
+
+
+class TestSharedMemoryCache:
+    def test_round_trip(self, tmp_path: Path, valid_result: ValidationResult) -> None:
+        cache = SharedMemoryCache(str(tmp_path / "cache.bin"), slots=64)
+        assert cache.get("user@example.com") is None
+
+        assert cache.set("user@example.com", valid_result, 60)
+
+        assert cache.get("user@example.com") == valid_result
+        assert cache.get("other@example.com") is None
+
+    def test_expired_entries_are_misses(
+        self, tmp_path: Path, valid_result: ValidationResult
+    ) -> None:
+        cache = SharedMemoryCache(str(tmp_path / "cache.bin"), slots=64)
+        cache.set("user@example.com", valid_result, 60)
+
+        with patch("truelist_django.local_cache.time.time", return_value=2**31):
+            assert cache.get("user@example.com") is None
+
+    def test_overwrites_existing_key(
+        self, tmp_path: Path, valid_result: ValidationResult, invalid_result: ValidationResult
+    ) -> None:
+        cache = SharedMemoryCache(str(tmp_path / "cache.bin"), slots=64)
+        cache.set("key", valid_result, 60)
+        cache.set("key", invalid_result, 60)
+        assert cache.get("key") == invalid_result
+
+    def test_rejects_oversized_results(
+        self, tmp_path: Path, valid_result: ValidationResult
+    ) -> None:
+        cache = SharedMemoryCache(str(tmp_path / "cache.bin"), slots=64)
+        huge = ValidationResult(**{**valid_result.__dict__, "first_name": "x" * 300})
+        assert not cache.set("key", huge, 60)
+        assert cache.get("key") is None
+
+    def test_clock_eviction_keeps_referenced_entries(
+        self, tmp_path: Path, valid_result: ValidationResult
+    ) -> None:
+        # A single bucket of eight ways.
+        cache = SharedMemoryCache(str(tmp_path / "cache.bin"), slots=8)
+        for i in range(8):
+            cache.set(f"key{i}", valid_result, 60)
+        # Every entry is referenced, so the first sweep clears all bits and
+        # evicts key0; key1 is then re-referenced by a read.
+        cache.set("key8", valid_result, 60)
+        assert cache.get("key1") is not None
+        cache.set("key9", valid_result, 60)
+
+        assert cache.get("key0") is None
+        assert cache.get("key1") is not None
+        assert cache.get("key2") is None
+        assert cache.get("key9") is not None
+
+    def test_clear(self, tmp_path: Path, valid_result: ValidationResult) -> None:
+        cache = SharedMemoryCache(str(tmp_path / "cache.bin"), slots=64)
+        cache.set("key", valid_result, 60)
+        cache.clear()
+        assert cache.get("key") is None
+
+    def test_shared_between_processes(self, tmp_path: Path, valid_result: ValidationResult) -> None:
+        path = str(tmp_path / "cache.bin")
+        cache = SharedMemoryCache(path, slots=64)
+        process = multiprocessing.get_context("fork").Process(
+            target=_write_from_child, args=(path, valid_result)
+        )
+        process.start()
+        process.join(10)
+
+        assert process.exitcode == 0
+        assert cache.get("child-key") == valid_result
+
+    def test_reopening_with_another_size_leaves_old_mapping_usable(
+        self, tmp_path: Path, valid_result: ValidationResult
+    ) -> None:
+        path = str(tmp_path / "cache.bin")
+        large = SharedMemoryCache(path, slots=1024)
+        large.set("key", valid_result, 60)
+
+        small = SharedMemoryCache(path, slots=64)
+
+        assert small.get("key") is None
+        assert large.get("key") == valid_result
+        assert large.set("other", valid_result, 60)
+        large.clear()  # Touches every page of the old, larger table.
+        assert SharedMemoryCache(path, slots=64).slots == 64
+        assert [p.name for p in tmp_path.iterdir()] == ["cache.bin"]
+
+    def test_get_local_cache_is_shared_per_process(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "cache.bin")
+        assert get_local_cache(path, 64) is get_local_cache(path, 64)
+
+
+class TestCachedClientLocalTier:
+    def test_serves_hits_from_local_tier(self, tmp_path: Path, truelist_fake: FakeTruelist) -> None:
+        with override_settings(TRUELIST_LOCAL_CACHE_PATH=str(tmp_path / "cache.bin")):
+            CachedTruelistClient(cache_enabled=True).validate("user@example.com")
+            caches["default"].clear()
+
+            result = CachedTruelistClient(cache_enabled=True).validate("User@Example.com")
+
+        assert result.is_valid
+        truelist_fake.assert_call_count(1)
+
+    def test_invalidation_clears_local_tier(
+        self, tmp_path: Path, truelist_fake: FakeTruelist
+    ) -> None:
+        with override_settings(TRUELIST_LOCAL_CACHE_PATH=str(tmp_path / "cache.bin")):
+            client = CachedTruelistClient(cache_enabled=True)
+            client.validate("user@example.com")
+            client.invalidate_domain("example.com")
+            client.validate("user@example.com")
+
+        truelist_fake.assert_call_count(2)
+
+    def test_unused_when_cache_disabled(self, tmp_path: Path, truelist_fake: FakeTruelist) -> None:
+        with override_settings(TRUELIST_LOCAL_CACHE_PATH=str(tmp_path / "cache.bin")):
+            client = CachedTruelistClient(cache_enabled=False)
+            client.validate("user@example.com")
+            client.validate("user@example.com")
+
+        truelist_fake.assert_call_count(2)
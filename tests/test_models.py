@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.db import models
+from django.test import override_settings
+from django.utils import timezone
+from truelist import ValidationResult
+
+from truelist_django.models import TruelistVerifiedEmailMixin
+
+
+class Subscriber(TruelistVerifiedEmailMixin):
+    email = models.EmailField()
+
+    class Meta:
+        app_label = "truelist_django"
+
+
+class TestTruelistVerifiedEmailMixin:
+    @patch("truelist_django.validators.CachedTruelistClient")
+    def test_records_verification(
+        self, mock_client_cls: MagicMock, valid_result: ValidationResult
+    ) -> None:
+        mock_client_cls.return_value.validate.return_value = valid_result
+
+        subscriber = Subscriber(email="user@example.com")
+        subscriber.clean_fields()
+
+        assert subscriber.truelist_verified_email == "user@example.com"
+        assert subscriber.truelist_state == "ok"
+        assert subscriber.truelist_sub_state == "email_ok"
+        assert subscriber.truelist_verified_at is not None
+
+    @patch("truelist_django.validators.CachedTruelistClient")
+    def test_skips_unchanged_value(
+        self, mock_client_cls: MagicMock, valid_result: ValidationResult
+    ) -> None:
+        mock_client = mock_client_cls.return_value
+        mock_client.validate.return_value = valid_result
+
+        subscriber = Subscriber(email="user@example.com")
+        subscriber.clean_fields()
+        subscriber.email = "User@Example.com"
+        subscriber.clean_fields()
+
+        mock_client.validate.assert_called_once_with("user@example.com")
+
+    @patch("truelist_django.validators.CachedTruelistClient")
+    def test_revalidates_changed_value(
+        self, mock_client_cls: MagicMock, valid_result: ValidationResult
+    ) -> None:
+        mock_client = mock_client_cls.return_value
+        mock_client.validate.return_value = valid_result
+
+        subscriber = Subscriber(email="user@example.com")
+        subscriber.clean_fields()
+        subscriber.email = "other@example.com"
+        subscriber.clean_fields()
+
+        assert mock_client.validate.call_count == 2
+
+    @override_settings(TRUELIST_REVERIFY_AFTER=60)
+    @patch("truelist_django.validators.CachedTruelistClient")
+    def test_revalidates_after_reverify_age(
+        self, mock_client_cls: MagicMock, valid_result: ValidationResult
+    ) -> None:
+        mock_client = mock_client_cls.return_value
+        mock_client.validate.return_value = valid_result
+
+        subscriber = Subscriber(
+            email="user@example.com",
+            truelist_verified_email="user@example.com",
+            truelist_state="ok",
+            truelist_verified_at=timezone.now() - timedelta(seconds=120),
+        )
+        subscriber.clean_fields()
+
+        mock_client.validate.assert_called_once()
+
+    @patch("truelist_django.validators.CachedTruelistClient")
+    def test_invalid_email_raises_and_is_not_recorded(
+        self, mock_client_cls: MagicMock, invalid_result: ValidationResult
+    ) -> None:
+        mock_client_cls.return_value.validate.return_value = invalid_result
+
+        subscriber = Subscriber(email="bad@example.com")
+        with pytest.raises(ValidationError) as exc_info:
+            subscriber.clean_fields()
+
+        assert "email" in exc_info.value.message_dict
+        assert subscriber.truelist_verified_at is None
+
+    @patch("truelist_django.validators.CachedTruelistClient")
+    def test_unknown_result_is_not_recorded(
+        self, mock_client_cls: MagicMock, unknown_result: ValidationResult
+    ) -> None:
+        mock_client = mock_client_cls.return_value
+        mock_client.validate.return_value = unknown_result
+
+        subscriber = Subscriber(email="mystery@example.com")
+        subscriber.clean_fields()
+        subscriber.clean_fields()
+
+        assert mock_client.validate.call_count == 2
+        assert subscriber.truelist_verified_at is None
+
+    @patch("truelist_django.validators.CachedTruelistClient")
+    def test_excluded_field_is_not_validated(self, mock_client_cls: MagicMock) -> None:
+        subscriber = Subscriber(email="user@example.com")
+        subscriber.clean_fields(exclude=["email"])
+
+        mock_client_cls.return_value.validate.assert_not_called()
+
+
+def test_mixin_imports_without_the_app_installed() -> None:
+    code = (
+        "import django\n"
+        "from django.conf import settings\n"
+        "settings.configure(INSTALLED_APPS=[])\n"
+        "django.setup()\n"
+        "from truelist_django.models import TruelistVerifiedEmailMixin\n"
+    )
+    env = {key: value for key, value in os.environ.items() if key != "DJANGO_SETTINGS_MODULE"}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env, capture_output=True)
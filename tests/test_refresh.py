@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.test import override_settings
+from django.utils import timezone
+from truelist import AuthenticationError, ConnectionError
+
+from truelist_django.cache import CachedTruelistClient
+from truelist_django.records import ValidationRecord
+from truelist_django.refresh import RefreshScheduler
+from truelist_django.testing import FakeTruelist
+
+pytestmark = pytest.mark.django_db
+
+
+def _track(email: str, *, refresh_in: int = -1, accessed_ago: int = 0) -> ValidationRecord:
+    now = timezone.now()
+    return ValidationRecord.objects.create(
+        email=email,
+        state="ok",
+        fetched_at=now - timedelta(hours=1),
+        refresh_after=now + timedelta(seconds=refresh_in),
+        last_accessed_at=now - timedelta(seconds=accessed_ago),
+    )
+
+
+class TestRefreshTracking:
+    @override_settings(TRUELIST_CACHE_TTL=3600, TRUELIST_REFRESH_LEAD=600)
+    def test_cache_miss_creates_record(self, truelist_fake: FakeTruelist) -> None:
+        client = CachedTruelistClient(cache_enabled=True, refresh_tracking=True)
+        client.validate("User@Example.com")
+
+        record = ValidationRecord.objects.get()
+        assert record.email == "user@example.com"
+        assert record.state == "ok"
+        assert record.refresh_after - record.fetched_at == timedelta(seconds=3000)
+
+    @override_settings(TRUELIST_CACHE_TTL=300, TRUELIST_REFRESH_LEAD=600)
+    def test_lead_is_capped_at_half_the_ttl(self, truelist_fake: FakeTruelist) -> None:
+        client = CachedTruelistClient(cache_enabled=True, refresh_tracking=True)
+        client.validate("user@example.com")
+
+        record = ValidationRecord.objects.get()
+        assert record.refresh_after - record.fetched_at == timedelta(seconds=150)
+
+    def test_unknown_results_are_not_tracked(self, truelist_fake: FakeTruelist) -> None:
+        truelist_fake.add_rule(address="mystery@example.com", state="unknown")
+        client = CachedTruelistClient(cache_enabled=True, refresh_tracking=True)
+        client.validate("mystery@example.com")
+
+        assert not ValidationRecord.objects.exists()
+
+    def test_cache_hit_updates_access_time(self, truelist_fake: FakeTruelist) -> None:
+        client = CachedTruelistClient(cache_enabled=True, refresh_tracking=True)
+        client.validate("user@example.com")
+        stale = timezone.now() - timedelta(days=1)
+        ValidationRecord.objects.update(last_accessed_at=stale)
+
+        client.validate("user@example.com")
+
+        assert ValidationRecord.objects.get().last_accessed_at > stale
+
+    def test_tracking_is_off_by_default(self, truelist_fake: FakeTruelist) -> None:
+        CachedTruelistClient(cache_enabled=True).validate("user@example.com")
+        assert not ValidationRecord.objects.exists()
+
+
+class TestRefreshScheduler:
+    def test_refreshes_due_records_most_recently_accessed_first(
+        self, truelist_fake: FakeTruelist
+    ) -> None:
+        _track("cold@example.com", accessed_ago=3600)
+        _track("hot@example.com", accessed_ago=10)
+        _track("fresh@example.com", refresh_in=3600)
+
+        scheduler = RefreshScheduler(budget_per_minute=60, sleep=lambda seconds: None)
+
+        assert scheduler.run_once() == 2
+        assert truelist_fake.calls == ["hot@example.com", "cold@example.com"]
+        assert ValidationRecord.objects.get(email="hot@example.com").refresh_after > timezone.now()
+        assert CachedTruelistClient(cache_enabled=True).get_cached("hot@example.com") is not None
+
+    def test_refresh_does_not_count_as_access(self, truelist_fake: FakeTruelist) -> None:
+        record = _track("user@example.com", accessed_ago=3600)
+
+        RefreshScheduler(sleep=lambda seconds: None).run_once()
+
+        record.refresh_from_db()
+        assert record.last_accessed_at < timezone.now() - timedelta(minutes=59)
+
+    def test_paces_calls_to_budget(self, truelist_fake: FakeTruelist) -> None:
+        for i in range(3):
+            _track(f"user{i}@example.com")
+        clock = [1000.0]
+        sleeps: list[float] = []
+
+        def sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        with patch("truelist_django.refresh.time.monotonic", lambda: clock[0]):
+            RefreshScheduler(budget_per_minute=30, sleep=sleep).run_once()
+
+        assert sleeps == [2.0, 2.0]
+
+    def test_budget_caps_calls_per_run(self, truelist_fake: FakeTruelist) -> None:
+        for i in range(5):
+            _track(f"user{i}@example.com")
+
+        RefreshScheduler(budget_per_minute=3, sleep=lambda seconds: None).run_once()
+
+        truelist_fake.assert_call_count(3)
+
+    def test_prunes_inactive_records(self, truelist_fake: FakeTruelist) -> None:
+        _track("gone@example.com", accessed_ago=7200)
+
+        RefreshScheduler(active_window=3600, sleep=lambda seconds: None).run_once()
+
+        truelist_fake.assert_not_called()
+        assert not ValidationRecord.objects.exists()
+
+    def test_failed_refresh_is_retried_later(self, truelist_fake: FakeTruelist) -> None:
+        truelist_fake.add_rule(address="user@example.com", error=ConnectionError("timeout"))
+        record = _track("user@example.com")
+
+        assert RefreshScheduler(sleep=lambda seconds: None).run_once() == 0
+
+        record.refresh_from_db()
+        assert record.refresh_after > timezone.now() + timedelta(minutes=14)
+
+    def test_auth_error_raises(self, truelist_fake: FakeTruelist) -> None:
+        truelist_fake.add_rule(address="user@example.com", error=AuthenticationError())
+        _track("user@example.com")
+
+        with pytest.raises(AuthenticationError):
+            RefreshScheduler(sleep=lambda seconds: None).run_once()
+
+    def test_rejects_non_positive_budget(self) -> None:
+        with pytest.raises(ValueError, match="positive"):
+            RefreshScheduler(budget_per_minute=0)
@@ -28,6 +28,51 @@ class TestGetSetting:
     def test_falls_back_to_default_cache_alias(self) -> None:
         assert get_setting("TRUELIST_CACHE_ALIAS") == "default"
 
+    def test_falls_back_to_default_local_cache_settings(self) -> None:
+        assert get_setting("TRUELIST_LOCAL_CACHE_PATH") is None
+        assert get_setting("TRUELIST_LOCAL_CACHE_SLOTS") == 65536
+        assert get_setting("TRUELIST_LOCAL_CACHE_TTL") == 60
+
+    def test_falls_back_to_default_backend(self) -> None:
+        assert get_setting("TRUELIST_BACKEND") is None
+
+    def test_falls_back_to_default_blocklist_path(self) -> None:
+        assert get_setting("TRUELIST_BLOCKLIST_PATH") is None
+
+    def test_falls_back_to_default_reverify_after(self) -> None:
+        assert get_setting("TRUELIST_REVERIFY_AFTER") == 30 * 24 * 3600
+
+    def test_falls_back_to_default_refresh_settings(self) -> None:
+        assert get_setting("TRUELIST_REFRESH_TRACKING") is False
+        assert get_setting("TRUELIST_REFRESH_BUDGET") == 60
+        assert get_setting("TRUELIST_REFRESH_LEAD") == 600
+        assert get_setting("TRUELIST_REFRESH_ACTIVE_WINDOW") == 7 * 24 * 3600
+
+    def test_falls_back_to_default_live_settings(self) -> None:
+        assert get_setting("TRUELIST_LIVE_DEBOUNCE") == 0.3
+        assert get_setting("TRUELIST_LIVE_RATE_LIMIT") == 60
+
+    def test_falls_back_to_default_dispatch_settings(self) -> None:
+        assert get_setting("TRUELIST_MAX_IN_FLIGHT") is None
+        assert get_setting("TRUELIST_INTERACTIVE_RESERVED") == 2
+
+    def test_falls_back_to_default_state_ttls(self) -> None:
+        assert get_setting("TRUELIST_CACHE_STATE_TTLS") == {}
+
+    def test_falls_back_to_default_typo_settings(self) -> None:
+        assert get_setting("TRUELIST_TYPO_DETECTION") is False
+        assert get_setting("TRUELIST_TYPO_EXTRA_DOMAINS") == ()
+        assert get_setting("TRUELIST_TYPO_MAX_DISTANCE") == 2
+
+    def test_falls_back_to_default_http_settings(self) -> None:
+        assert get_setting("TRUELIST_HTTP_TRANSPORT") is None
+        assert get_setting("TRUELIST_HTTP_MAX_CONNECTIONS") == 100
+        assert get_setting("TRUELIST_HTTP_MAX_KEEPALIVE") == 20
+        assert get_setting("TRUELIST_HTTP_KEEPALIVE_EXPIRY") == 5.0
+        assert get_setting("TRUELIST_HTTP2") is False
+        assert get_setting("TRUELIST_HTTP_PROXY") is None
+        assert get_setting("TRUELIST_DNS_CACHE_TTL") == 0
+
     @override_settings(TRUELIST_BASE_URL="https://custom.api.io")
     def test_overrides_from_django_settings(self) -> None:
         assert get_setting("TRUELIST_BASE_URL") == "https://custom.api.io"
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from io import StringIO
+
+import pytest
+
+from truelist_django.simulate import (
+    CachePolicy,
+    LogRecord,
+    SimulatedCache,
+    read_log,
+    simulate,
+)
+
+
+def _log(*rows: tuple[float, str, str]) -> list[LogRecord]:
+    return [LogRecord(timestamp, key, state) for timestamp, key, state in rows]
+
+
+class TestSimulatedCache:
+    def test_entries_expire_on_simulated_clock(self) -> None:
+        cache = SimulatedCache()
+        cache.set("a", 1, 10)
+        cache.advance(9)
+        assert cache.get("a") == 1
+        cache.advance(10)
+        assert cache.get("a") is None
+        assert cache.bytes == 0
+
+    def test_lru_eviction(self) -> None:
+        cache = SimulatedCache(max_entries=2)
+        cache.set("a", 1, None)
+        cache.set("b", 2, None)
+        cache.get("a")
+        cache.set("c", 3, None)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.evictions == 1
+        assert cache.peak_entries == 2
+
+    def test_add_and_incr(self) -> None:
+        cache = SimulatedCache()
+        assert cache.add("n", 1, None)
+        assert not cache.add("n", 5, None)
+        assert cache.incr("n") == 2
+
+
+class TestReadLog:
+    def test_parses_rows(self) -> None:
+        log = StringIO(
+            "timestamp,key,state,domain\n"
+            "100,abc,ok,d1\n"
+            "2026-01-01T00:00:00+00:00,def,email_invalid,\n"
+        )
+        records = list(read_log(log))
+
+        assert records[0] == LogRecord(100.0, "abc", "ok", "d1", "")
+        assert records[1].timestamp == 1767225600.0
+        assert records[1].domain == ""
+
+    def test_missing_columns(self) -> None:
+        with pytest.raises(ValueError, match="missing columns: state"):
+            list(read_log(StringIO("timestamp,key\n1,a\n")))
+
+
+class TestSimulate:
+    def test_hits_within_ttl(self) -> None:
+        log = _log((0, "a", "ok"), (10, "a", "ok"), (100, "a", "ok"), (10, "b", "ok"))[:3]
+
+        (short, long) = simulate(log, [CachePolicy("short", ttl=50), CachePolicy("long", ttl=500)])
+
+        assert (short.requests, short.hits, short.api_calls) == (3, 1, 2)
+        assert (long.hits, long.api_calls) == (2, 1)
+        assert long.api_calls_saved == 2
+        assert long.hit_ratio == pytest.approx(2 / 3)
+        assert long.mean_hit_age == pytest.approx(55)
+        assert long.max_hit_age == 100
+
+    def test_staleness(self) -> None:
+        log = _log((0, "a", "ok"), (60, "a", "email_invalid"))
+
+        (report,) = simulate(log, [CachePolicy("p", ttl=3600)])
+
+        assert report.stale_hits == 1
+        assert report.stale_ratio == 1.0
+
+    def test_unknown_results_are_never_cached(self) -> None:
+        log = _log((0, "a", "unknown"), (1, "a", "unknown"))
+
+        (report,) = simulate(log, [CachePolicy("p", ttl=3600)])
+
+        assert report.api_calls == 2
+
+    def test_state_ttls(self) -> None:
+        log = _log((0, "a", "ok"), (0, "b", "email_invalid"), (500, "a", "ok"), (500, "b", "ok"))
+
+        (report,) = simulate(log, [CachePolicy("p", ttl=100, state_ttls={"email_invalid": 1000})])
+
+        assert report.hits == 1
+        assert report.stale_hits == 1
+
+    def test_capacity_and_memory(self) -> None:
+        log = _log(*((i, f"key{i}", "ok") for i in range(10)), (20, "key0", "ok"))
+
+        bounded, unbounded = simulate(
+            log,
+            [CachePolicy("small", ttl=3600, max_entries=5), CachePolicy("big", ttl=3600)],
+        )
+
+        assert bounded.hits == 0
+        assert bounded.evictions > 0
+        assert bounded.peak_entries == 5
+        assert unbounded.hits == 1
+        assert unbounded.peak_entries == 10
+        assert unbounded.peak_bytes > bounded.peak_bytes
+
+    def test_tenants_are_partitioned(self) -> None:
+        log = [LogRecord(0, "a", "ok", tenant="acme"), LogRecord(1, "a", "ok", tenant="globex")]
+
+        (report,) = simulate(log, [CachePolicy("p", ttl=3600)])
+
+        assert report.hits == 0
+
+    def test_rejects_out_of_order_log(self) -> None:
+        with pytest.raises(ValueError, match="time order"):
+            simulate(_log((10, "a", "ok"), (5, "b", "ok")), [CachePolicy("p", ttl=60)])
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import re
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.exceptions import ValidationError
+from truelist import ConnectionError, TimeoutError
+
+from truelist_django.cache import CachedTruelistClient
+from truelist_django.testing import FakeTruelist, get_fake
+from truelist_django.validators import TruelistEmailValidator
+
+
+class TestFakeTruelist:
+    def test_default_state(self) -> None:
+        result = FakeTruelist().email.validate("user@example.com")
+        assert result.is_valid
+        assert result.sub_state == "email_ok"
+        assert result.domain == "example.com"
+
+    def test_rules_by_address_domain_and_pattern(self) -> None:
+        fake = FakeTruelist()
+        fake.add_rule(domain="example.com", state="risky")
+        fake.add_rule(address="Bad@Example.com", suggestion="bad@example.org")
+        fake.add_rule(pattern=re.compile(r"^role\+"), state="unknown")
+
+        assert fake.validate("user@example.com").state == "risky"
+        assert fake.validate("bad@example.com").state == "email_invalid"
+        assert fake.validate("bad@example.com").suggestion == "bad@example.org"
+        assert fake.validate("role+x@other.com").state == "unknown"
+        assert fake.validate("user@other.com").state == "ok"
+
+    def test_rule_requires_exactly_one_matcher(self) -> None:
+        with pytest.raises(ValueError, match="exactly one"):
+            FakeTruelist().add_rule(address="a@b.com", domain="b.com")
+
+    def test_rule_error(self) -> None:
+        fake = FakeTruelist()
+        fake.add_rule(domain="slow.com", error=TimeoutError())
+        with pytest.raises(TimeoutError):
+            fake.validate("user@slow.com")
+
+    def test_error_rate_is_deterministic(self) -> None:
+        def failures(fake: FakeTruelist) -> list[bool]:
+            outcomes = []
+            for _ in range(50):
+                try:
+                    fake.validate("user@example.com")
+                    outcomes.append(False)
+                except ConnectionError:
+                    outcomes.append(True)
+            return outcomes
+
+        first = failures(FakeTruelist(error_rate=0.3, seed=7))
+        assert first == failures(FakeTruelist(error_rate=0.3, seed=7))
+        assert 0 < sum(first) < 50
+
+    @patch("truelist_django.testing.time.sleep")
+    def test_latency(self, mock_sleep: MagicMock) -> None:
+        fake = FakeTruelist(latency=0.05)
+        fake.add_rule(domain="slow.com", state="ok", latency=2.0)
+        fake.validate("user@example.com")
+        fake.validate("user@slow.com")
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.05, 2.0]
+
+    def test_call_assertions(self) -> None:
+        fake = FakeTruelist()
+        fake.assert_not_called()
+        fake.validate("User@Example.com")
+        fake.assert_called_with("user@example.com")
+        fake.assert_call_count(1)
+        with pytest.raises(AssertionError):
+            fake.assert_called_with("other@example.com")
+        with pytest.raises(AssertionError):
+            fake.assert_not_called()
+        fake.reset()
+        fake.assert_call_count(0)
+
+
+class TestTruelistFakeFixture:
+    def test_routes_validators_through_fake(self, truelist_fake: FakeTruelist) -> None:
+        truelist_fake.add_rule(domain="mailinator.com")
+
+        TruelistEmailValidator()("user@example.com")
+        with pytest.raises(ValidationError):
+            TruelistEmailValidator()("user@mailinator.com")
+
+        truelist_fake.assert_call_count(2)
+        assert get_fake() is truelist_fake
+
+    def test_cached_client_records_calls(self, truelist_fake: FakeTruelist) -> None:
+        client = CachedTruelistClient(cache_enabled=False)
+        client.validate("user@example.com")
+        client.close()
+        truelist_fake.assert_called_with("user@example.com")
+
+    def test_fixture_is_isolated(self, truelist_fake: FakeTruelist) -> None:
+        truelist_fake.assert_not_called()
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import httpcore
+import httpx
+import pytest
+from django.test import override_settings
+from truelist import Truelist
+
+from truelist_django.cache import CachedTruelistClient
+from truelist_django.transport import (
+    CachingResolverBackend,
+    attach_transport,
+    build_transport,
+    get_shared_transport,
+)
+
+_VERIFY_RESPONSE = {
+    "emails": [
+        {
+            "address": "user@example.com",
+            "domain": "example.com",
+            "email_state": "ok",
+            "email_sub_state": "email_ok",
+        }
+    ]
+}
+
+
+def _stub_transport(requests: list[httpx.Request]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=_VERIFY_RESPONSE)
+
+    return httpx.MockTransport(handler)
+
+
+def stub_transport_factory() -> httpx.BaseTransport:
+    return _stub_transport([])
+
+
+class TestBuildTransport:
+    def test_applies_limits(self) -> None:
+        transport = build_transport(
+            max_connections=7, max_keepalive_connections=3, keepalive_expiry=1.5
+        )
+        pool = transport._pool
+        assert pool._max_connections == 7
+        assert pool._max_keepalive_connections == 3
+        assert pool._keepalive_expiry == 1.5
+
+    def test_installs_dns_cache(self) -> None:
+        transport = build_transport(dns_cache_ttl=30)
+        assert isinstance(transport._pool._network_backend, CachingResolverBackend)
+
+
+class TestCachingResolverBackend:
+    def test_caches_lookups(self) -> None:
+        inner = MagicMock(spec=httpcore.NetworkBackend)
+        backend = CachingResolverBackend(60, backend=inner)
+        infos: list[Any] = [(2, 1, 6, "", ("127.0.0.1", 443))]
+
+        with patch("truelist_django.transport.socket.getaddrinfo", return_value=infos) as lookup:
+            backend.connect_tcp("api.truelist.io", 443)
+            backend.connect_tcp("api.truelist.io", 443)
+
+        lookup.assert_called_once()
+        assert inner.connect_tcp.call_args.args == ("127.0.0.1", 443)
+
+    def test_evicts_after_failed_connect(self) -> None:
+        inner = MagicMock(spec=httpcore.NetworkBackend)
+        inner.connect_tcp.side_effect = httpcore.ConnectError("refused")
+        backend = CachingResolverBackend(60, backend=inner)
+        infos: list[Any] = [(2, 1, 6, "", ("127.0.0.1", 443))]
+
+        with patch("truelist_django.transport.socket.getaddrinfo", return_value=infos) as lookup:
+            for _ in range(2):
+                with pytest.raises(httpcore.ConnectError):
+                    backend.connect_tcp("api.truelist.io", 443)
+
+        assert lookup.call_count == 2
+
+
+class TestTransportInjection:
+    def test_attach_transport_keeps_sdk_configuration(self) -> None:
+        requests: list[httpx.Request] = []
+        client = Truelist("secret", base_url="https://api.example.test", timeout=3.0)
+        attach_transport(client, _stub_transport(requests))
+
+        result = client.email.validate("user@example.com")
+
+        assert result.is_valid
+        assert requests[0].url.host == "api.example.test"
+        assert requests[0].headers["Authorization"] == "Bearer secret"
+
+    def test_cached_client_uses_given_transport(self) -> None:
+        requests: list[httpx.Request] = []
+        client = CachedTruelistClient(cache_enabled=False, transport=_stub_transport(requests))
+
+        assert client.validate("user@example.com").is_valid
+        assert len(requests) == 1
+
+    def test_default_settings_use_sdk_client(self) -> None:
+        assert get_shared_transport() is None
+
+    @override_settings(TRUELIST_HTTP_TRANSPORT="tests.test_transport.stub_transport_factory")
+    def test_shared_transport_from_settings(self) -> None:
+        transport = get_shared_transport()
+        assert transport is not None
+        assert get_shared_transport() is transport
+
+        client = CachedTruelistClient(cache_enabled=False)
+        assert client.validate("user@example.com").is_valid
+        client.close()
+        # Closing a client leaves the shared pool usable for the next one.
+        assert CachedTruelistClient(cache_enabled=False).validate("user@example.com").is_valid
+
+    @override_settings(TRUELIST_HTTP_TRANSPORT="tests.test_transport.stub_transport_factory")
+    def test_clients_from_settings_share_one_sdk_client(self) -> None:
+        first = CachedTruelistClient(cache_enabled=False)
+        second = CachedTruelistClient(cache_enabled=False)
+
+        with patch("truelist_django.cache.Truelist") as sdk_client:
+            assert first._get_client() is second._get_client()
+            first.close()
+            assert second.validate("user@example.com").is_valid
+
+        sdk_client.assert_not_called()
+
+    @override_settings(TRUELIST_HTTP_TRANSPORT="tests.test_transport.stub_transport_factory")
+    def test_explicit_transport_gets_its_own_client(self) -> None:
+        requests: list[httpx.Request] = []
+        client = CachedTruelistClient(cache_enabled=False, transport=_stub_transport(requests))
+
+        assert client._get_client() is not CachedTruelistClient()._get_client()
+        assert client.validate("user@example.com").is_valid
+        assert len(requests) == 1
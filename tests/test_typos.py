@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.test import override_settings
+
+from truelist_django.cache import CachedTruelistClient
+from truelist_django.testing import FakeTruelist
+from truelist_django.typos import (
+    POPULAR_DOMAINS,
+    TYPO_DOMAIN,
+    TypoIndex,
+    edit_distance,
+    get_typo_index,
+    typo_result,
+)
+from truelist_django.validators import TruelistEmailValidator
+
+
+class TestEditDistance:
+    @pytest.mark.parametrize(
+        ("a", "b", "expected"),
+        [
+            ("gmail.com", "gmail.com", 0),
+            ("gmial.com", "gmail.com", 1),
+            ("gmai.com", "gmail.com", 1),
+            ("gnail.com", "gmail.com", 1),
+            ("hotmial.con", "hotmail.com", 2),
+            ("", "abc", 3),
+            ("ca", "abc", 3),
+        ],
+    )
+    def test_distance(self, a: str, b: str, expected: int) -> None:
+        assert edit_distance(a, b) == expected
+        assert edit_distance(b, a) == expected
+
+
+class TestTypoIndex:
+    @pytest.fixture
+    def index(self) -> TypoIndex:
+        return TypoIndex(POPULAR_DOMAINS)
+
+    @pytest.mark.parametrize(
+        ("typo", "expected"),
+        [
+            ("gmial.com", "gmail.com"),
+            ("GMAIL.CON", "gmail.com"),
+            ("hotmial.con", "hotmail.com"),
+            ("yaho.com", "yahoo.com"),
+            ("outlok.com", "outlook.com"),
+            ("iclod.com", "icloud.com"),
+        ],
+    )
+    def test_suggests_popular_domain(self, index: TypoIndex, typo: str, expected: str) -> None:
+        assert index.suggest(typo) == expected
+
+    @pytest.mark.parametrize("domain", ["gmail.com", "example.com", "aim.com", "company.io", ""])
+    def test_known_or_distant_domains_have_no_suggestion(
+        self, index: TypoIndex, domain: str
+    ) -> None:
+        assert index.suggest(domain) is None
+
+    @pytest.mark.parametrize(
+        ("domain", "expected"),
+        [
+            ("hotmail.es", "hotmail.fr"),
+            ("hotmail.be", "hotmail.de"),
+            ("hotmail.nl", "hotmail.fr"),
+            ("hotmail.se", "hotmail.de"),
+            ("hotmail.ca", "hotmail.com"),
+            ("outlook.es", "outlook.fr"),
+            ("outlook.it", "outlook.fr"),
+            ("outlook.be", "outlook.de"),
+            ("yahoo.co.jp", "yahoo.co.uk"),
+            ("yahoo.co.id", "yahoo.co.in"),
+        ],
+    )
+    def test_regional_variants_are_not_typos(
+        self, index: TypoIndex, domain: str, expected: str
+    ) -> None:
+        assert index.suggest(domain) == expected
+        assert not index.is_typo(domain)
+
+    @pytest.mark.parametrize("domain", ["hotmail.con", "gmail.cm", "gmail.co", "hotmial.de"])
+    def test_implausible_suffixes_and_misspelt_names_are_typos(
+        self, index: TypoIndex, domain: str
+    ) -> None:
+        assert index.is_typo(domain)
+
+    def test_short_domains_allow_one_edit(self) -> None:
+        index = TypoIndex(["abcd.com"])
+        assert index.suggest("abdc.com") == "abcd.com"
+        assert index.suggest("axdc.com") is None
+
+    def test_ties_go_to_the_more_popular_domain(self) -> None:
+        assert TypoIndex(["first.com", "firsu.com"]).suggest("firss.com") == "first.com"
+        assert TypoIndex(["firsu.com", "first.com"]).suggest("firss.com") == "firsu.com"
+
+    def test_repeat_lookups_are_remembered(self, index: TypoIndex) -> None:
+        assert index.suggest("gmial.com") == "gmail.com"
+        assert index._memo["gmial.com"] == "gmail.com"
+        index.suggest("example.com")
+        assert "example.com" in index._memo
+
+    def test_contains(self, index: TypoIndex) -> None:
+        assert "Gmail.com" in index
+        assert "gmial.com" not in index
+
+
+class TestTypoResult:
+    def test_builds_invalid_result_with_suggestion(self) -> None:
+        result = typo_result("Jane.Doe@gmial.com")
+
+        assert result is not None
+        assert result.state == "email_invalid"
+        assert result.sub_state == TYPO_DOMAIN
+        assert result.domain == "gmial.com"
+        assert result.suggestion == "Jane.Doe@gmail.com"
+
+    @pytest.mark.parametrize("email", ["user@gmail.com", "user@example.com", "gmial.com"])
+    def test_no_result_without_typo(self, email: str) -> None:
+        assert typo_result(email) is None
+
+    @pytest.mark.parametrize("email", ["user@hotmail.nl", "user@yahoo.co.jp"])
+    def test_regional_variants_are_not_rejected(self, email: str) -> None:
+        assert typo_result(email) is None
+
+    def test_implausible_suffix_is_rejected(self) -> None:
+        result = typo_result("user@gmail.cm")
+        assert result is not None
+        assert result.suggestion == "user@gmail.com"
+
+    @pytest.mark.parametrize(
+        "domain",
+        [
+            "ymail.com",
+            "email.com",
+            "foxmail.com",
+            "fastmail.fm",
+            "gm.com",
+            "ge.com",
+            "ae.com",
+            "aon.com",
+            "msc.com",
+            "man.com",
+            "mtn.com",
+            "mack.com",
+            "lime.com",
+            "gmai.com",
+        ],
+    )
+    def test_real_neighbours_and_short_names_are_not_rejected(self, domain: str) -> None:
+        assert typo_result(f"user@{domain}") is None
+
+    @pytest.mark.parametrize(
+        ("domain", "expected"),
+        [
+            ("gamil.com", "gmail.com"),
+            ("gmaill.com", "gmail.com"),
+            ("yahooo.com", "yahoo.com"),
+            ("hotmail.co", "hotmail.com"),
+        ],
+    )
+    def test_misspelt_popular_domains_are_rejected(self, domain: str, expected: str) -> None:
+        result = typo_result(f"user@{domain}")
+        assert result is not None
+        assert result.suggestion == f"user@{expected}"
+
+    @override_settings(TRUELIST_TYPO_EXTRA_DOMAINS=["aim.com", "acmecorp.com"])
+    def test_extra_domains(self) -> None:
+        assert "acmecorp.com" in get_typo_index()
+        result = typo_result("user@acmecrop.com")
+        assert result is not None
+        assert result.suggestion == "user@acmecorp.com"
+
+    @override_settings(TRUELIST_TYPO_MAX_DISTANCE=1)
+    def test_max_distance_setting(self) -> None:
+        assert typo_result("user@hotmial.con") is None
+
+
+class TestClientTypoDetection:
+    @override_settings(TRUELIST_TYPO_DETECTION=True)
+    def test_typo_skips_api_and_cache(self, truelist_fake: FakeTruelist) -> None:
+        client = CachedTruelistClient(cache_enabled=True)
+
+        result = client.validate("user@gmial.com")
+
+        assert result.suggestion == "user@gmail.com"
+        truelist_fake.assert_not_called()
+        assert client.get_cached("user@gmial.com") is None
+
+    @override_settings(TRUELIST_TYPO_DETECTION=True)
+    def test_known_domain_goes_to_api(self, truelist_fake: FakeTruelist) -> None:
+        CachedTruelistClient().validate("user@gmail.com")
+
+        truelist_fake.assert_called_with("user@gmail.com")
+
+    def test_disabled_by_default(self, truelist_fake: FakeTruelist) -> None:
+        CachedTruelistClient().validate("user@gmial.com")
+
+        truelist_fake.assert_called_with("user@gmial.com")
+
+    @override_settings(TRUELIST_TYPO_DETECTION=True)
+    def test_validator_reports_suggestion(self, truelist_fake: FakeTruelist) -> None:
+        with pytest.raises(ValidationError) as exc_info:
+            TruelistEmailValidator()("user@hotmial.con")
+
+        assert exc_info.value.messages == [
+            "This email address could not be verified as deliverable. "
+            "Did you mean user@hotmail.com?"
+        ]
+        truelist_fake.assert_not_called()
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import dataclasses
 from unittest.mock import MagicMock, patch
 
 import pytest
 from django.core.exceptions import ValidationError
 from truelist import AuthenticationError, ConnectionError, ValidationResult
 
+from truelist_django.testing import FakeTruelist
 from truelist_django.validators import TruelistEmailValidator
 
 
@@ -127,6 +129,36 @@ class TestTruelistEmailValidator:
         assert exc_info.value.code == "bad_email"
         assert "Bad email!" in str(exc_info.value.message)
 
+    @patch("truelist_django.validators.CachedTruelistClient")
+    def test_suggestion_included_in_message(
+        self, mock_client_cls: MagicMock, invalid_result: ValidationResult
+    ) -> None:
+        mock_client_cls.return_value.validate.return_value = dataclasses.replace(
+            invalid_result, suggestion="bad@gmail.com"
+        )
+
+        with pytest.raises(ValidationError) as exc_info:
+            TruelistEmailValidator()("bad@gmial.com")
+
+        assert exc_info.value.code == "invalid_email"
+        assert exc_info.value.messages == [
+            "This email address could not be verified as deliverable. Did you mean bad@gmail.com?"
+        ]
+
+    @patch("truelist_django.validators.CachedTruelistClient")
+    def test_validate_returns_result(
+        self, mock_client_cls: MagicMock, valid_result: ValidationResult
+    ) -> None:
+        mock_client_cls.return_value.validate.return_value = valid_result
+
+        assert TruelistEmailValidator().validate("user@example.com") == valid_result
+
+    @patch("truelist_django.validators.CachedTruelistClient")
+    def test_validate_returns_none_on_silenced_api_error(self, mock_client_cls: MagicMock) -> None:
+        mock_client_cls.return_value.validate.side_effect = ConnectionError("timeout")
+
+        assert TruelistEmailValidator(fail_silently=True).validate("user@example.com") is None
+
     def test_equality(self) -> None:
         v1 = TruelistEmailValidator(allow_risky=True, fail_silently=True)
         v2 = TruelistEmailValidator(allow_risky=True, fail_silently=True)
@@ -134,6 +166,7 @@ class TestTruelistEmailValidator:
 
         assert v1 == v2
         assert v1 != v3
+        assert v1 != TruelistEmailValidator(suggestion_message="Try %(suggestion)s")
 
     def test_deconstructible(self) -> None:
         validator = TruelistEmailValidator(allow_risky=False, fail_silently=False)
@@ -143,3 +176,46 @@ class TestTruelistEmailValidator:
         assert args == ()
         assert kwargs["allow_risky"] is False
         assert kwargs["fail_silently"] is False
+
+
+class TestValidateMany:
+    def test_reports_errors_per_address(self, truelist_fake: FakeTruelist) -> None:
+        truelist_fake.add_rule(address="bad@example.com")
+        truelist_fake.add_rule(address="typo@gmial.com", suggestion="typo@gmail.com")
+
+        with pytest.raises(ValidationError) as exc_info:
+            TruelistEmailValidator().validate_many(
+                ["ok@example.com", "bad@example.com", "typo@gmial.com"]
+            )
+
+        assert exc_info.value.messages == [
+            "bad@example.com: This email address could not be verified as deliverable.",
+            "typo@gmial.com: This email address could not be verified as deliverable. "
+            "Did you mean typo@gmail.com?",
+        ]
+        assert [error.code for error in exc_info.value.error_list] == [
+            "invalid_email",
+            "invalid_email",
+        ]
+
+    def test_returns_results(self, truelist_fake: FakeTruelist) -> None:
+        truelist_fake.add_rule(address="down@example.com", error=ConnectionError("down"))
+
+        results = TruelistEmailValidator().validate_many(["ok@example.com", "down@example.com"])
+
+        assert results["ok@example.com"] is not None
+        assert results["down@example.com"] is None
+
+    def test_api_error_raises_when_fail_silently_false(self, truelist_fake: FakeTruelist) -> None:
+        truelist_fake.add_rule(address="down@example.com", error=ConnectionError("down"))
+
+        with pytest.raises(ValidationError) as exc_info:
+            TruelistEmailValidator(fail_silently=False).validate_many(["down@example.com"])
+
+        assert exc_info.value.error_list[0].code == "service_unavailable"
+
+    def test_auth_error_always_raises(self, truelist_fake: FakeTruelist) -> None:
+        truelist_fake.add_rule(address="user@example.com", error=AuthenticationError("bad key"))
+
+        with pytest.raises(AuthenticationError):
+            TruelistEmailValidator().validate_many(["user@example.com"])
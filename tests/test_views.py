@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.cache import caches
+from django.http import JsonResponse
+from django.test import RequestFactory
+from truelist import AuthenticationError, ConnectionError, ValidationResult
+
+from truelist_django.cache import CachedTruelistClient
+from truelist_django.views import TruelistValidateView, _hash, is_plausible_email
+
+
+def _get(
+    email: str, ip: str = "10.0.0.1", client: str | None = None, **initkwargs: Any
+) -> JsonResponse:
+    initkwargs.setdefault("debounce", 0)
+    params = {"email": email}
+    if client is not None:
+        params["client"] = client
+    request = RequestFactory().get("/validate/", params, REMOTE_ADDR=ip)
+    response: JsonResponse = TruelistValidateView.as_view(**initkwargs)(request)
+    return response
+
+
+class TestIsPlausibleEmail:
+    @pytest.mark.parametrize("email", ["user@example.com", "first.last+tag@mail.example.org"])
+    def test_accepts(self, email: str) -> None:
+        assert is_plausible_email(email)
+
+    @pytest.mark.parametrize(
+        "email", ["", "user", "user@", "user@localhost", "us er@example.com", "a" * 250 + "@x.io"]
+    )
+    def test_rejects(self, email: str) -> None:
+        assert not is_plausible_email(email)
+
+
+class TestTruelistValidateView:
+    @patch("truelist_django.cache.Truelist")
+    def test_validates_and_caches(
+        self, mock_truelist_cls: MagicMock, valid_result: ValidationResult
+    ) -> None:
+        mock_truelist_cls.return_value.email.validate.return_value = valid_result
+
+        response = _get("user@example.com")
+
+        assert response.status_code == 200
+        assert json.loads(response.content) == {
+            "email": "user@example.com",
+            "status": "checked",
+            "state": "ok",
+            "sub_state": "email_ok",
+            "suggestion": None,
+        }
+        cached = CachedTruelistClient(cache_enabled=True).get_cached("user@example.com")
+        assert cached == valid_result
+
+    @patch("truelist_django.cache.Truelist")
+    def test_cache_hit_skips_api(
+        self, mock_truelist_cls: MagicMock, valid_result: ValidationResult
+    ) -> None:
+        mock_validate = mock_truelist_cls.return_value.email.validate
+        mock_validate.return_value = valid_result
+
+        _get("user@example.com")
+        _get("user@example.com")
+
+        mock_validate.assert_called_once()
+
+    @patch("truelist_django.cache.Truelist")
+    def test_syntax_gate_skips_api(self, mock_truelist_cls: MagicMock) -> None:
+        response = _get("not-an-email")
+
+        assert json.loads(response.content)["status"] == "invalid_syntax"
+        mock_truelist_cls.return_value.email.validate.assert_not_called()
+
+    @patch("truelist_django.cache.Truelist")
+    def test_throttles_per_ip(
+        self, mock_truelist_cls: MagicMock, valid_result: ValidationResult
+    ) -> None:
+        mock_truelist_cls.return_value.email.validate.return_value = valid_result
+
+        assert _get("user@example.com", rate_limit=2).status_code == 200
+        assert _get("user@example.com", rate_limit=2).status_code == 200
+        assert _get("user@example.com", rate_limit=2).status_code == 429
+        assert _get("user@example.com", ip="10.0.0.2", rate_limit=2).status_code == 200
+
+    @patch("truelist_django.views.time.sleep")
+    @patch("truelist_django.cache.Truelist")
+    def test_superseded_request_skips_api(
+        self, mock_truelist_cls: MagicMock, mock_sleep: MagicMock
+    ) -> None:
+        def newer_request_arrives(seconds: float) -> None:
+            key = f"truelist:live:latest:{_hash('client:field-1')[:16]}"
+            caches["default"].set(key, "newer-token", 60)
+
+        mock_sleep.side_effect = newer_request_arrives
+
+        response = _get("user@example.com", client="field-1", debounce=0.3)
+
+        assert json.loads(response.content)["status"] == "superseded"
+        mock_truelist_cls.return_value.email.validate.assert_not_called()
+
+    @patch("truelist_django.cache.Truelist")
+    def test_callers_sharing_an_ip_do_not_supersede_each_other(
+        self, mock_truelist_cls: MagicMock, valid_result: ValidationResult
+    ) -> None:
+        mock_truelist_cls.return_value.email.validate.return_value = valid_result
+        responses: list[JsonResponse] = []
+        started: list[bool] = []
+
+        def request_from_other_caller(seconds: float) -> None:
+            # Another user behind the same proxy looks up an address meanwhile.
+            if not started:
+                started.append(True)
+                responses.append(_get("other@example.com", client="field-2", debounce=0.3))
+
+        with patch("truelist_django.views.time.sleep", side_effect=request_from_other_caller):
+            first = _get("user@example.com", client="field-1", debounce=0.3)
+            anonymous = _get("third@example.com", debounce=0.3)
+
+        assert json.loads(first.content)["status"] == "checked"
+        assert json.loads(responses[0].content)["status"] == "checked"
+        assert json.loads(anonymous.content)["status"] == "checked"
+
+    def test_session_id_never_falls_back_to_ip(self) -> None:
+        request = RequestFactory().get("/validate/", {"email": "a@b.co"}, REMOTE_ADDR="10.0.0.1")
+        assert TruelistValidateView().get_session_id(request) is None
+
+        request = RequestFactory().get("/validate/", {"client": "x" * 65})
+        assert TruelistValidateView().get_session_id(request) is None
+
+    @patch("truelist_django.cache.Truelist")
+    def test_api_error_returns_unavailable(self, mock_truelist_cls: MagicMock) -> None:
+        mock_truelist_cls.return_value.email.validate.side_effect = ConnectionError("timeout")
+
+        response = _get("user@example.com")
+
+        assert response.status_code == 503
+        assert json.loads(response.content)["status"] == "unavailable"
+
+    @patch("truelist_django.cache.Truelist")
+    def test_auth_error_always_raises(self, mock_truelist_cls: MagicMock) -> None:
+        mock_truelist_cls.return_value.email.validate.side_effect = AuthenticationError()
+
+        with pytest.raises(AuthenticationError):
+            _get("user@example.com")